@@ -7,10 +7,11 @@ from argparse import ArgumentError, ArgumentParser, FileType, Namespace
 from importlib.metadata import PackageNotFoundError, version
 from itertools import chain
 from multiprocessing import freeze_support
+from pathlib import Path
 from typing import List
 
 from cli import parse
-from cli.types import Mode, NodeConnectionProperties
+from cli.types import Mode, NodeConnectionProperties, NodeSelectionStrategy
 
 try:
     __version__ = version("eth-duties")
@@ -32,6 +33,16 @@ def __get_raw_arguments() -> Namespace:
         usage="eth-duties [...options]",
         epilog=f"version: v{__version__}",
     )
+    parser.add_argument(
+        "--beacon-events",
+        help=(
+            "If supplied the head, chain_reorg and finalized_checkpoint events of the beacon "
+            "nodes are streamed to confirm or invalidate cached duties and to track beacon "
+            "node liveness. Falls back to polling while no event stream is available"
+        ),
+        action="store_true",
+        default=False,
+    )
     parser.add_argument(
         "--beacon-nodes",
         type=parse.set_beacon_nodes,
@@ -41,10 +52,78 @@ def __get_raw_arguments() -> Namespace:
         ),
         default="http://localhost:5052",
     )
+    parser.add_argument(
+        "--beacon-node-selection",
+        help=(
+            "Strategy to select one of the healthy beacon nodes for a request. "
+            "Values are 'first', 'fastest' or 'round-robin' (default: 'first')"
+        ),
+        type=NodeSelectionStrategy,
+        choices=NodeSelectionStrategy,
+        default=NodeSelectionStrategy.FIRST,
+    )
+    parser.add_argument(
+        "--bulk-attestation-duties",
+        help=(
+            "If supplied attestation duties are also fetched if more validators than "
+            "'--max-attestation-duty-logs' are provided. Only the next "
+            "'--max-attestation-duty-logs' attestation duties are logged"
+        ),
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--connection-keep-alive",
+        type=float,
+        help=(
+            "Time in seconds an idle connection to a beacon or validator node is kept open "
+            "for reuse (default: 30)"
+        ),
+        action="store",
+        default=30.0,
+    )
+    parser.add_argument(
+        "--connection-pool-size",
+        type=int,
+        help=(
+            "Max. number of open connections per beacon or validator node (default: 10)"
+        ),
+        action="store",
+        default=10,
+    )
+    parser.add_argument(
+        "--hedge-requests",
+        help=(
+            "If supplied a beacon node request is additionally sent to a second healthy "
+            "beacon node if the first node does not respond in time (see '--hedge-percentile')"
+        ),
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        help=(
+            "Percentile of the recent response latencies of a beacon node after which "
+            "a request is hedged (default: 95)"
+        ),
+        action="store",
+        default=95.0,
+    )
+    parser.add_argument(
+        "--http2",
+        help="If supplied HTTP/2 will be negotiated with nodes which support it",
+        action="store_true",
+        default=False,
+    )
     parser.add_argument(
         "--interval",
         type=int,
-        help="Interval in seconds for fetching data from the beacon node (default: 15)",
+        help=(
+            "Max. interval in seconds for fetching data from the beacon node. In log mode "
+            "the interval ends earlier at the start of an epoch or of the slot of the next "
+            "duty (default: 15)"
+        ),
         action="store",
         default=15,
     )
@@ -113,6 +192,38 @@ def __get_raw_arguments() -> Namespace:
         action="store",
         default=50,
     )
+    parser.add_argument(
+        "--max-concurrent-requests",
+        type=int,
+        help=(
+            "Max. number of concurrent api requests per beacon or validator node "
+            "(default: 4)"
+        ),
+        action="store",
+        default=4,
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=int,
+        help=(
+            "Max. interval in seconds in log mode while no duty is due within "
+            "'--log-time-warning'. The interval grows up to this value and shrinks back to "
+            "'--interval' as the next duty approaches. 0 disables the adaptive interval "
+            "(default: 0)"
+        ),
+        action="store",
+        default=0,
+    )
+    parser.add_argument(
+        "--max-requests-per-second",
+        type=float,
+        help=(
+            "Max. number of api requests per second per beacon or validator node. "
+            "0 disables the rate limit (default: 0)"
+        ),
+        action="store",
+        default=0.0,
+    )
     parser.add_argument(
         "--mode",
         help=(
@@ -156,12 +267,40 @@ def __get_raw_arguments() -> Namespace:
         action="store",
         default=1,
     )
+    parser.add_argument(
+        "--no-compression",
+        help=(
+            "If supplied no compressed (gzip/zstd) responses are requested from any node. "
+            "Useful if decompression costs more CPU time than the saved bandwidth is worth"
+        ),
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--no-compression-nodes",
+        type=parse.set_node_urls,
+        help=(
+            "Comma separated list of beacon or validator node URLs from which no "
+            "compressed responses are requested"
+        ),
+        default=[],
+    )
     parser.add_argument(
         "--omit-attestation-duties",
         help="If supplied upcoming attestation duties will not be logged to the console",
         action="store_true",
         default=False,
     )
+    parser.add_argument(
+        "--prefetch-slots",
+        help=(
+            "Number of slots before the next epoch starts in which the duties of the next "
+            "epoch are fetched in the background. 0 disables prefetching (default: 4)"
+        ),
+        action="store",
+        type=int,
+        default=4,
+    )
     parser.add_argument(
         "--rest",
         help="Starts a rest server on port 5000",
@@ -182,6 +321,47 @@ def __get_raw_arguments() -> Namespace:
         action="store",
         default=5000,
     )
+    parser.add_argument(
+        "--spread-validator-chunks",
+        help=(
+            "If supplied the validator chunks of a single request are distributed over all "
+            "healthy beacon nodes in proportion to their observed throughput"
+        ),
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--ssz",
+        help=(
+            "If supplied duties and validator states are requested SSZ encoded from beacon "
+            "nodes which support it. Nodes which answer with json are remembered and asked "
+            "for json afterwards"
+        ),
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--state-snapshot-file",
+        help=(
+            "Path to a json file with the validators and RANDAO mixes of a beacon state. "
+            "Attestation duties of epochs which are determined by the snapshot (up to the "
+            "epoch after the snapshot) are computed from it instead of being fetched per "
+            "validator. The file is loaded again whenever it is modified"
+        ),
+        action="store",
+        type=str,
+        default=None,
+    )
+    parser.add_argument(
+        "--sync-committee-cache-file",
+        help=(
+            "Path to a file where fetched sync committee duties are persisted per sync "
+            "committee period so that they do not need to be fetched again after a restart"
+        ),
+        action="store",
+        type=str,
+        default=None,
+    )
     parser.add_argument(
         "--validators",
         type=parse.set_validator_identifiers,
@@ -240,6 +420,105 @@ def __validate_fetching_interval(passed_fetching_interval: int) -> None:
         )
 
 
+def __validate_max_interval(
+    passed_fetching_interval: int, passed_max_interval: int
+) -> None:
+    """Validates whether the max. interval is disabled or not below the fetching interval
+
+    Args:
+        passed_fetching_interval (int): Passed interval in seconds
+        passed_max_interval (int): Passed max. interval in seconds
+
+    Raises:
+        ArgumentError: Error if the max. interval is smaller than the fetching interval
+    """
+    if passed_max_interval != 0 and passed_max_interval < passed_fetching_interval:
+        raise ArgumentError(
+            None,
+            f"Passed seconds for '--max-interval' ({passed_max_interval}) need to be 0 "
+            f"or greater than for '--interval' (supplied or default: {passed_fetching_interval})",
+        )
+
+
+def __validate_connection_pool_size(passed_connection_pool_size: int) -> None:
+    """Validates whether the connection pool size is at least one
+
+    Args:
+        passed_connection_pool_size (int): Passed max. number of connections per node
+
+    Raises:
+        ValueError: Error for wrongly provided connection pool size
+    """
+    if passed_connection_pool_size < 1:
+        raise ValueError("The connection pool size should be greater or equal 1")
+
+
+def __validate_prefetch_slots(passed_prefetch_slots: int) -> None:
+    """Validates whether the number of prefetch slots fits into an epoch
+
+    Args:
+        passed_prefetch_slots (int): Passed number of slots before the epoch boundary
+
+    Raises:
+        ValueError: Error for wrongly provided number of prefetch slots
+    """
+    if passed_prefetch_slots < 0 or passed_prefetch_slots >= 32:
+        raise ValueError("The number of prefetch slots should be between 0 and 31")
+
+
+def __validate_request_limits(
+    passed_max_concurrent_requests: int, passed_max_requests_per_second: float
+) -> None:
+    """Validates the provided request limits per node
+
+    Args:
+        passed_max_concurrent_requests (int): Passed max. number of concurrent requests
+        passed_max_requests_per_second (float): Passed max. number of requests per second
+
+    Raises:
+        ValueError: Error if any of the provided limits is out of range
+    """
+    if passed_max_concurrent_requests < 1:
+        raise ValueError(
+            "The value for flag '--max-concurrent-requests' should be greater or equal 1"
+        )
+    if passed_max_requests_per_second < 0:
+        raise ValueError(
+            "The value for flag '--max-requests-per-second' should be greater or equal 0"
+        )
+
+
+def __validate_hedge_percentile(passed_hedge_percentile: float) -> None:
+    """Validates whether the hedge percentile is between 0 and 100
+
+    Args:
+        passed_hedge_percentile (float): Passed hedge percentile
+
+    Raises:
+        ValueError: Error if hedge percentile is not between 0 and 100
+    """
+    if passed_hedge_percentile <= 0 or passed_hedge_percentile > 100:
+        raise ValueError(
+            "The value for flag '--hedge-percentile' should be between 0 and 100"
+        )
+
+
+def __validate_state_snapshot_file(passed_state_snapshot_file: str | None) -> None:
+    """Validates whether the provided state snapshot file exists
+
+    Args:
+        passed_state_snapshot_file (str | None): Passed path to the state snapshot file
+
+    Raises:
+        ValueError: Error if the state snapshot file does not exist
+    """
+    if passed_state_snapshot_file and not Path(passed_state_snapshot_file).is_file():
+        raise ValueError(
+            f"The file passed with '--state-snapshot-file' "
+            f"({passed_state_snapshot_file}) does not exist"
+        )
+
+
 def __validate_provided_validator_flag(
     validators: List[str] | None,
     validators_file: str | None,
@@ -345,6 +624,14 @@ def __set_arguments() -> Namespace:
     freeze_support()
     arguments = __get_raw_arguments()
     __validate_fetching_interval(arguments.interval)
+    __validate_max_interval(arguments.interval, arguments.max_interval)
+    __validate_connection_pool_size(arguments.connection_pool_size)
+    __validate_hedge_percentile(arguments.hedge_percentile)
+    __validate_prefetch_slots(arguments.prefetch_slots)
+    __validate_request_limits(
+        arguments.max_concurrent_requests, arguments.max_requests_per_second
+    )
+    __validate_state_snapshot_file(arguments.state_snapshot_file)
     __validate_provided_validator_flag(
         arguments.validators, arguments.validators_file, arguments.validator_nodes
     )
@@ -60,6 +60,24 @@ def set_beacon_nodes(beacon_node_urls: str) -> List[NodeConnectionProperties]:
     return [NodeConnectionProperties(beacon_node_urls, NodeType.BEACON)]
 
 
+def set_node_urls(node_urls: str) -> List[str]:
+    """Parse a comma separated list of beacon or validator node urls
+
+    Args:
+        node_urls (str): Provided node urls
+
+    Raises:
+        KeyError: Error if one or many provided urls do not start with http:// or https://
+
+    Returns:
+        List[str]: Parsed node urls
+    """
+    splitted_urls = node_urls.split(",")
+    if not all(url.startswith(MANDATORY_NODE_URL_PREFIXES) for url in splitted_urls):
+        raise KeyError(NODE_URL_ERROR_MESSAGE.format("Provided"))
+    return splitted_urls
+
+
 def set_logging_color(logging_color: str) -> List[int]:
     """Parse provided logging color
 
@@ -15,6 +15,14 @@ class Mode(Enum):
     CICD_FORCE_GRACEFUL_EXIT = "cicd-force-graceful-exit"
 
 
+class NodeSelectionStrategy(Enum):
+    """Defines how a beacon node is selected from all healthy beacon nodes"""
+
+    FIRST = "first"
+    FASTEST = "fastest"
+    ROUND_ROBIN = "round-robin"
+
+
 class NodeType(Enum):
     """Defines the type of node"""
 
@@ -6,8 +6,11 @@ ATTESTATION_DUTY_ENDPOINT = "/eth/v1/validator/duties/attester/"
 SYNC_COMMITTEE_DUTY_ENDPOINT = "/eth/v1/validator/duties/sync/"
 BLOCK_PROPOSING_DUTY_ENDPOINT = "/eth/v1/validator/duties/proposer/"
 BEACON_GENESIS_ENDPOINT = "/eth/v1/beacon/genesis"
+COMMITTEES_ENDPOINT = "/eth/v1/beacon/states/head/committees?epoch="
+SYNC_COMMITTEES_ENDPOINT = "/eth/v1/beacon/states/head/sync_committees?epoch="
 VALIDATOR_STATUS_ENDPOINT = "/eth/v1/beacon/states/head/validators"
 NODE_HEALTH_ENDPOINT = "/eth/v1/node/health"
+EVENTS_ENDPOINT = "/eth/v1/events?topics=head,chain_reorg,finalized_checkpoint"
 
 # Validator key manager API endpoints
 LOCAL_KEYSTORES_ENDPOINT = "/eth/v1/keystores"
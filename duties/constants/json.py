@@ -9,3 +9,11 @@ RESPONSE_JSON_VALIDATOR_FIELD_NAME = "validator"
 RESPONSE_JSON_PUBKEY_FIELD_NAME = "pubkey"
 RESPONSE_JSON_VALIDATING_PUBKEY_NAME = "validating_pubkey"
 RESPONSE_JSON_MESSAGE_NAME = "message"
+RESPONSE_JSON_DEPENDENT_ROOT_FIELD_NAME = "dependent_root"
+RESPONSE_JSON_VALIDATORS_FIELD_NAME = "validators"
+RESPONSE_JSON_SLOT_FIELD_NAME = "slot"
+SYNC_COMMITTEE_CACHE_GENESIS_TIME_FIELD_NAME = "genesis_time"
+SYNC_COMMITTEE_CACHE_PERIODS_FIELD_NAME = "periods"
+SYNC_COMMITTEE_CACHE_DUTIES_FIELD_NAME = "duties"
+SYNC_COMMITTEE_CACHE_REQUESTED_VALIDATORS_FIELD_NAME = "requested_validators"
+STATE_SNAPSHOT_RANDAO_MIXES_FIELD_NAME = "randao_mixes"
@@ -1,11 +1,17 @@
 """Defines logging messages"""
 
-CONNECTION_ERROR_MESSAGE = (
-    "Couldn't connect to %s node with url: %s. Retry in 2 second."
-)
-READ_TIMEOUT_ERROR_MESSAGE = (
-    "Couldn't read from %s node with url: %s. Retry in 5 seconds."
-)
+CONNECTION_ERROR_MESSAGE = "Couldn't connect to %s node with url: %s."
+READ_TIMEOUT_ERROR_MESSAGE = "Couldn't read from %s node with url: %s."
+RETRY_REQUEST_MESSAGE = "Retry request to %s in %s seconds"
+CIRCUIT_BREAKER_OPEN_MESSAGE = (
+    "Node with url %s failed %s times in a row. "
+    "Requests are routed to other nodes for the next %s seconds."
+)
+CIRCUIT_BREAKER_REJECTED_REQUEST_MESSAGE = (
+    "Circuit breaker of node with url %s is open. Requests are skipped until it allows "
+    "a trial request."
+)
+INVALID_RESPONSE_ERROR_MESSAGE = "Couldn't decode response from %s node with url: %s."
 NO_RESPONSE_ERROR_MESSAGE = "Couldn't fetch any data from client: %s"
 NO_FETCHED_VALIDATOR_IDENTIFIERS_MESSAGE = (
     "Validator identifiers could not be fetched from client: %s"
@@ -22,6 +28,9 @@ TOO_MANY_PROVIDED_VALIDATORS_FOR_FETCHING_ATTESTATION_DUTIES_MESSAGE = (
     "Checking attestion duties will be skipped! "
     "To increase the max. number of logged attestation duties use '--max-attestation-duty-logs'"
 )
+NOT_LOGGED_ATTESTATION_DUTIES_MESSAGE = (
+    "%s further attestation duties are not logged (see '--max-attestation-duty-logs')"
+)
 HIGHER_PROCESSING_TIME_INFO_MESSAGE = (
     "You provided %s validators. Fetching all necessary data may take some time."
 )
@@ -59,6 +68,63 @@ NO_AVAILABLE_BEACON_NODE_MESSAGE = (
     "Non of the provided beacon nodes is ready to accept requests"
 )
 USED_BEACON_NODE_MESSAGE = "Using beacon node %s"
+ADJUSTED_CHUNK_SIZE_MESSAGE = (
+    "Adjusted number of validators per request for endpoint %s on node %s to %s"
+)
+HEDGED_REQUEST_MESSAGE = (
+    "Beacon node %s did not respond within %s sec. Hedging request to beacon node %s"
+)
+SSZ_FALLBACK_MESSAGE = (
+    "Beacon node %s does not support SSZ for endpoint %s. Falling back to json"
+)
+COMPRESSED_RESPONSE_MESSAGE = (
+    "Decoded %s response of endpoint %s from %s to %s bytes in %.2f ms "
+    "(average ratio %.1f, average decode time %.2f ms)"
+)
+UNSUPPORTED_CONTENT_ENCODING_ERROR_MESSAGE = "Unsupported content encoding: {0}"
+PREFETCH_DUTIES_MESSAGE = "Prefetching duties of epoch %s"
+CACHED_DUTIES_MESSAGE = "Using cached %s duties of epoch %s"
+FETCHING_COMMITTEES_MESSAGE = (
+    "Fetching committees of epoch %s from the beacon state for %s validators"
+)
+FETCHING_SYNC_COMMITTEE_MESSAGE = (
+    "Fetching sync committee of epoch %s from the beacon state for %s validators"
+)
+COMPUTING_ATTESTATION_DUTIES_MESSAGE = (
+    "Computing attestation duties of epoch %s from the state snapshot for %s validators"
+)
+LOADED_STATE_SNAPSHOT_MESSAGE = (
+    "Loaded state snapshot of epoch %s with %s validators from %s"
+)
+STATE_SNAPSHOT_READ_WARNING_MESSAGE = (
+    "Could not read state snapshot file %s (%s). Attestation duties will be fetched "
+    "from the beacon node"
+)
+LOADED_SYNC_COMMITTEE_CACHE_MESSAGE = (
+    "Loaded sync committee duties of %s sync committee period(s) from %s"
+)
+SYNC_COMMITTEE_CACHE_READ_WARNING_MESSAGE = (
+    "Could not read sync committee cache file %s (%s). Sync committee duties will be "
+    "fetched from the beacon node"
+)
+SYNC_COMMITTEE_CACHE_WRITE_WARNING_MESSAGE = (
+    "Could not write sync committee cache file %s (%s)"
+)
+CHANGED_DEPENDENT_ROOT_MESSAGE = (
+    "Dependent root of %s duties of epoch %s changed from %s to %s (reorg). "
+    "Refetching duties"
+)
+SUBSCRIBED_TO_EVENTS_MESSAGE = "Subscribed to events of beacon node %s"
+EVENT_STREAM_ERROR_MESSAGE = (
+    "Event stream of beacon node %s is not available (%s). Cached duties are verified "
+    "by polling until the stream is reconnected"
+)
+CHAIN_REORG_EVENT_MESSAGE = "Chain reorg at slot %s with depth %s"
+INVALID_EVENT_MESSAGE = "Ignoring invalid %s event (%s)"
+JOINED_IN_FLIGHT_REQUEST_MESSAGE = "Joined in-flight request %s"
+BEACON_NODE_FAILOVER_MESSAGE = (
+    "Request to beacon node %s failed. Moving request to beacon node %s"
+)
 ALL_HEALTHY_BEACON_NODES_MESSAGE = "All beacon node endpoints are healthy"
 ONE_NON_HEALTHY_BEACON_NODE_MESSAGE = "Beacon node %s is not ready to accept requests!"
 NODE_URL_ERROR_MESSAGE = "{0} node url should start with http or https"
@@ -31,13 +31,35 @@ RANDOM_NUMBERS = __create_random_numbers()
 
 # General program settings
 REQUEST_TIMEOUT = (3, 5)
-REQUEST_CONNECTION_ERROR_WAITING_TIME = 2
-REQUEST_READ_TIMEOUT_ERROR_WAITING_TIME = 5
+REQUEST_RETRY_LIMIT = 3
+REQUEST_RETRY_BASE_DELAY = 0.5
+REQUEST_RETRY_MAX_DELAY = 5.0
+RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_MAX_TOKENS = 10
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_OPEN_DURATION = 30
 REQUEST_HEADER = {"Content-type": "application/json", "Accept": "application/json"}
+SSZ_ACCEPT_HEADER = "application/octet-stream;q=1.0,application/json;q=0.9"
+SSZ_CONTENT_TYPE = "application/octet-stream"
+UNSUPPORTED_CONTENT_TYPE_STATUS_CODES = (406, 415)
+DUTY_CACHE_REORG_DEPTH = 2
+DUTY_CACHE_FETCH_ATTEMPTS = 2
+SLOT_CLOCK_WAKE_UP_OFFSET = 0.5
+COMPRESSED_ACCEPT_ENCODING = "gzip, deflate"
+ZSTD_ACCEPT_ENCODING = "zstd, gzip, deflate"
+IDENTITY_ACCEPT_ENCODING = "identity"
 DUTY_LOGGING_TIME_FORMAT = "%M:%S"
 THRESHOLD_TO_INFORM_USER_FOR_WAITING_PERIOD = 5000
 NUMBER_OF_VALIDATORS_PER_REST_CALL = 1000
+MIN_NUMBER_OF_VALIDATORS_PER_REST_CALL = 50
+MAX_NUMBER_OF_VALIDATORS_PER_POST_REST_CALL = 10_000
+MAX_RESPONSE_SIZE_PER_REST_CALL = 10_000_000
+CHUNK_GROWTH_LATENCY_THRESHOLD = 1.0
+CHUNK_SHRINK_LATENCY_THRESHOLD = 3.0
+PAYLOAD_TOO_LARGE_STATUS_CODES = (413, 414)
 MAX_NUMBER_OF_VALIDATORS_FOR_FETCHING_ATTESTATION_DUTIES = 100
+MIN_NUMBER_OF_VALIDATORS_FOR_FETCHING_SYNC_COMMITTEES = 1000
+MIN_NUMBER_OF_VALIDATORS_FOR_FETCHING_COMMITTEES = 1000
 ALIAS_SEPARATOR = ";"
 PUBKEY_PREFIX = "0x"
 PUBKEY_LENGTH = 48
@@ -60,6 +82,16 @@ ALL_VALIDATOR_IDENTIFIERS_SHARED_MEMORY_NAMES = [
 MINUTES_UNTIL_USED_BEACON_NODE_CONNECTION_STRING_IS_LOGGED = 1
 MINUTES_UNTIL_ALL_HEALTHY_BEACON_NODE_CONNECTION_STRINGS_ARE_LOGGED = 1
 SECONDS_UNTIL_BEACON_NODE_HEALTH_UPDATE = 7
+NODE_HEALTH_CHECK_ROUND_DEADLINE = REQUEST_TIMEOUT[1]
+SECONDS_UNTIL_EVENT_STREAM_HEARTBEAT_EXPIRES = 15
+SECONDS_UNTIL_EVENT_STREAM_TIMES_OUT = 30
+SECONDS_UNTIL_EVENT_STREAM_RECONNECT = 5
+MAX_SECONDS_UNTIL_EVENT_STREAM_RECONNECT = 60
+EVENT_STREAM_ACCEPT_HEADER = "text/event-stream"
+NODE_STATISTICS_SMOOTHING_FACTOR = 0.2
+MIN_NODE_SUCCESS_RATE = 0.05
+NODE_LATENCY_SAMPLE_SIZE = 50
+MIN_LATENCY_SAMPLES_FOR_PERCENTILE = 5
 
 # REST specific settings
 REST_RAW_DUTY_NO_BEACON_NODE_CONNECTION_TIMEOUT = 7
@@ -0,0 +1,424 @@
+"""Module for caching fetched duties for the epoch (or sync committee period) they are valid for
+"""
+
+from dataclasses import dataclass
+from json import JSONDecodeError, dumps, loads
+from logging import getLogger
+from os import replace
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from cli.arguments import ARGUMENTS
+from constants import json, logging, program
+from fetcher.data_types import DutyRecord, DutyType
+from protocol import ethereum
+
+
+@dataclass
+class DutyCacheEntry:
+    """Fetched duties of an epoch together with the root of the block they depend on.
+    Duties stay valid as long as their dependent block is not reorged. Since reorgs of more
+    than a few slots are very unlikely, the dependent root is verified once after the
+    dependent slot is deep enough. Duties can be fetched for a part of the validators,
+    therefore the validators for which duties were requested are tracked as well.
+    """
+
+    duties: List[DutyRecord]
+    dependent_root: str | None
+    dependent_slot: int | None
+    is_confirmed: bool
+    requested_validators: Set[str] | None
+
+    def get_missing_validators(self, validators: List[str] | None) -> List[str]:
+        """Get the validators for which no duties were requested yet
+
+        Args:
+            validators (List[str] | None): Validator indices or None if the duties do not depend on validators # pylint: disable=line-too-long
+
+        Returns:
+            List[str]: Validator indices whose duties are not cached
+        """
+        if validators is None or self.requested_validators is None:
+            return []
+        return [
+            validator
+            for validator in validators
+            if validator not in self.requested_validators
+        ]
+
+    def get_duties(self, validators: List[str] | None) -> List[DutyRecord]:
+        """Get the cached duties of the provided validators
+
+        Args:
+            validators (List[str] | None): Validator indices or None for all cached duties
+
+        Returns:
+            List[DutyRecord]: Cached duties
+        """
+        if validators is None:
+            return self.duties
+        validator_set = {int(validator) for validator in validators}
+        return [duty for duty in self.duties if duty.validator_index in validator_set]
+
+    def is_verification_due(self, current_slot: int) -> bool:
+        """Check whether the dependent root needs to be verified
+
+        Args:
+            current_slot (int): The current slot
+
+        Returns:
+            bool: True if the dependent block is deep enough but was not verified yet
+        """
+        return (
+            not self.is_confirmed
+            and self.dependent_slot is not None
+            and current_slot >= self.dependent_slot + program.DUTY_CACHE_REORG_DEPTH
+        )
+
+
+class DutyCache:
+    """Caches duties per duty type, epoch and validator set version. Sync committee duties are
+    cached per sync committee period and can be persisted to a file. Beacon node events can
+    confirm or invalidate cached duties, in which case `has_invalidated_duties` tells the
+    main process to refetch its duties. While events are received, dependent roots are not
+    verified by polling."""
+
+    def __init__(self, sync_committee_cache_file: str | None) -> None:
+        self.__entries: Dict[Tuple[DutyType, int, int | None], DutyCacheEntry] = {}
+        self.has_invalidated_duties = False
+        self.is_receiving_events = False
+        self.__sync_committee_cache_file = sync_committee_cache_file
+        self.__logger = getLogger()
+        self.__load_sync_committee_duties()
+
+    def get(
+        self, duty_type: DutyType, epoch: int, validator_set_version: int | None
+    ) -> DutyCacheEntry | None:
+        """Get the cached duties
+
+        Args:
+            duty_type (DutyType): Type of the duty
+            epoch (int): Epoch of the duties
+            validator_set_version (int | None): Version of the validator set or None if the duties do not depend on it # pylint: disable=line-too-long
+
+        Returns:
+            DutyCacheEntry | None: Cached duties or None if nothing is cached
+        """
+        self.__prune()
+        return self.__entries.get(
+            (duty_type, self.__get_cache_epoch(duty_type, epoch), validator_set_version)
+        )
+
+    def is_cacheable(self, duty_type: DutyType, epoch: int) -> bool:
+        """Check whether duties of the provided epoch can be cached. Duties whose dependent
+        block is not proposed yet (e.g. block proposing duties of the next epoch) are
+        speculative and would need to be fetched again once the block exists.
+
+        Args:
+            duty_type (DutyType): Type of the duty
+            epoch (int): Epoch of the duties
+
+        Returns:
+            bool: True if the duties do not depend on a block or the dependent slot has passed # pylint: disable=line-too-long
+        """
+        dependent_slot = ethereum.get_dependent_slot(duty_type, epoch)
+        return dependent_slot is None or dependent_slot < ethereum.get_current_slot()
+
+    def add(
+        self,
+        duty_type: DutyType,
+        epoch: int,
+        validator_set_version: int | None,
+        duties: List[DutyRecord],
+        dependent_root: str | None,
+        requested_validators: List[str] | None,
+    ) -> DutyCacheEntry:
+        """Cache fetched duties. Duties with the same dependent root as the cached duties are
+        merged into the cached entry, otherwise the entry is replaced. Entries of older
+        validator set versions are removed.
+
+        Args:
+            duty_type (DutyType): Type of the duty
+            epoch (int): Epoch of the duties
+            validator_set_version (int | None): Version of the validator set or None if the duties do not depend on it # pylint: disable=line-too-long
+            duties (List[DutyRecord]): Fetched duties
+            dependent_root (str | None): Dependent root of the fetched duties
+            requested_validators (List[str] | None): Validator indices for which the duties were requested or None if the duties do not depend on validators # pylint: disable=line-too-long
+
+        Returns:
+            DutyCacheEntry: Entry with the cached duties
+        """
+        cache_entry = self.get(duty_type, epoch, validator_set_version)
+        if (
+            cache_entry
+            and cache_entry.dependent_root == dependent_root
+            and cache_entry.requested_validators is not None
+            and requested_validators is not None
+        ):
+            cache_entry.duties.extend(duties)
+            cache_entry.requested_validators.update(requested_validators)
+            return cache_entry
+        dependent_slot = ethereum.get_dependent_slot(duty_type, epoch)
+        is_confirmed = (
+            dependent_slot is None
+            or ethereum.get_current_slot()
+            >= dependent_slot + program.DUTY_CACHE_REORG_DEPTH
+        )
+        if validator_set_version is not None:
+            self.__entries = {
+                key: cached_entry
+                for key, cached_entry in self.__entries.items()
+                if key[2] is None or key[2] >= validator_set_version
+            }
+        cache_entry = DutyCacheEntry(
+            list(duties),
+            dependent_root,
+            dependent_slot,
+            is_confirmed,
+            None if requested_validators is None else set(requested_validators),
+        )
+        self.__entries[
+            (duty_type, self.__get_cache_epoch(duty_type, epoch), validator_set_version)
+        ] = cache_entry
+        return cache_entry
+
+    def persist(self, duty_type: DutyType) -> None:
+        """Write the cached sync committee duties to the sync committee cache file if it was
+        provided. The file is replaced atomically since the rest server might write it as
+        well.
+
+        Args:
+            duty_type (DutyType): Type of the cached duties
+        """
+        if (
+            duty_type != DutyType.SYNC_COMMITTEE
+            or self.__sync_committee_cache_file is None
+        ):
+            return
+        self.__prune()
+        periods: Dict[str, Dict[str, Any]] = {
+            str(key[1]): {
+                json.SYNC_COMMITTEE_CACHE_DUTIES_FIELD_NAME: [
+                    duty.to_response() for duty in entry.duties
+                ],
+                json.SYNC_COMMITTEE_CACHE_REQUESTED_VALIDATORS_FIELD_NAME: sorted(
+                    entry.requested_validators or []
+                ),
+            }
+            for key, entry in self.__entries.items()
+            if key[0] == DutyType.SYNC_COMMITTEE
+        }
+        content = {
+            json.SYNC_COMMITTEE_CACHE_GENESIS_TIME_FIELD_NAME: ethereum.GENESIS_TIME,
+            json.SYNC_COMMITTEE_CACHE_PERIODS_FIELD_NAME: periods,
+        }
+        cache_file = Path(self.__sync_committee_cache_file)
+        temporary_cache_file = cache_file.with_name(f"{cache_file.name}.tmp")
+        try:
+            temporary_cache_file.write_text(dumps(content), encoding="utf-8")
+            replace(temporary_cache_file, cache_file)
+        except OSError as error:
+            self.__logger.warning(
+                logging.SYNC_COMMITTEE_CACHE_WRITE_WARNING_MESSAGE,
+                self.__sync_committee_cache_file,
+                error,
+            )
+
+    def invalidate(
+        self, duty_type: DutyType, epoch: int, validator_set_version: int | None
+    ) -> None:
+        """Remove cached duties, e.g. after their dependent block was reorged
+
+        Args:
+            duty_type (DutyType): Type of the duty
+            epoch (int): Epoch of the duties
+            validator_set_version (int | None): Version of the validator set or None if the duties do not depend on it # pylint: disable=line-too-long
+        """
+        self.__entries.pop(
+            (
+                duty_type,
+                self.__get_cache_epoch(duty_type, epoch),
+                validator_set_version,
+            ),
+            None,
+        )
+
+    def update_dependent_roots(
+        self,
+        slot: int,
+        previous_duty_dependent_root: str,
+        current_duty_dependent_root: str,
+    ) -> None:
+        """Compare the dependent roots of cached duties with the dependent roots of a new head
+        block. Duties whose dependent root changed are removed, matching duties are confirmed
+        once their dependent block is deep enough.
+
+        Args:
+            slot (int): Slot of the new head block
+            previous_duty_dependent_root (str): Dependent root of the attestation duties of the epoch of the head block # pylint: disable=line-too-long
+            current_duty_dependent_root (str): Dependent root of the attestation duties of the next epoch and the proposing duties of the epoch of the head block # pylint: disable=line-too-long
+        """
+        epoch = slot // ethereum.SLOTS_PER_EPOCH
+        expected_dependent_roots = {
+            (DutyType.ATTESTATION, epoch): previous_duty_dependent_root,
+            (DutyType.ATTESTATION, epoch + 1): current_duty_dependent_root,
+            (DutyType.PROPOSING, epoch): current_duty_dependent_root,
+        }
+        for key, entry in list(self.__entries.items()):
+            expected_dependent_root = expected_dependent_roots.get(key[:2])
+            if expected_dependent_root is None or entry.dependent_root is None:
+                continue
+            if entry.dependent_root != expected_dependent_root:
+                self.__logger.warning(
+                    logging.CHANGED_DEPENDENT_ROOT_MESSAGE,
+                    key[0].value,
+                    key[1],
+                    entry.dependent_root,
+                    expected_dependent_root,
+                )
+                del self.__entries[key]
+                self.has_invalidated_duties = True
+            elif (
+                entry.dependent_slot is not None
+                and slot >= entry.dependent_slot + program.DUTY_CACHE_REORG_DEPTH
+            ):
+                entry.is_confirmed = True
+
+    def unconfirm(self, slot: int) -> None:
+        """Mark cached duties whose dependent block is not older than the provided slot as
+        unconfirmed, e.g. after a chain reorg down to this slot
+
+        Args:
+            slot (int): Oldest slot which was reorged
+        """
+        for entry in self.__entries.values():
+            if entry.dependent_slot is not None and entry.dependent_slot >= slot:
+                entry.is_confirmed = False
+
+    def confirm(self, slot: int) -> None:
+        """Mark cached duties whose dependent block is older than the provided slot as
+        confirmed, e.g. after this slot was finalized
+
+        Args:
+            slot (int): First slot which is not final
+        """
+        for entry in self.__entries.values():
+            if entry.dependent_slot is not None and entry.dependent_slot < slot:
+                entry.is_confirmed = True
+
+    def is_verification_due(self) -> bool:
+        """Check whether the dependent root of any cached duties needs to be verified
+
+        Returns:
+            bool: True if any cached duties need to be verified
+        """
+        return len(self.get_keys_to_verify()) > 0
+
+    def get_verification_slots(self) -> List[int]:
+        """Get the slots at which the dependent roots of cached duties need to be verified
+
+        Returns:
+            List[int]: Slots at which the verification of cached duties is due
+        """
+        if self.is_receiving_events:
+            return []
+        return [
+            entry.dependent_slot + program.DUTY_CACHE_REORG_DEPTH
+            for entry in self.__entries.values()
+            if not entry.is_confirmed and entry.dependent_slot is not None
+        ]
+
+    def get_keys_to_verify(self) -> List[Tuple[DutyType, int, int | None]]:
+        """Get the keys of all cached duties whose dependent root needs to be verified
+
+        Returns:
+            List[Tuple[DutyType, int, int | None]]: Duty type, epoch and validator set version of the cached duties # pylint: disable=line-too-long
+        """
+        self.__prune()
+        if self.is_receiving_events:
+            return []
+        current_slot = ethereum.get_current_slot()
+        return [
+            key
+            for key, entry in self.__entries.items()
+            if entry.is_verification_due(current_slot)
+        ]
+
+    def __load_sync_committee_duties(self) -> None:
+        """Load persisted sync committee duties of the current and upcoming sync committee
+        periods. Files of another network (different genesis time) are ignored."""
+        if self.__sync_committee_cache_file is None:
+            return
+        cache_file = Path(self.__sync_committee_cache_file)
+        if not cache_file.exists():
+            return
+        try:
+            content = loads(cache_file.read_text(encoding="utf-8"))
+            if (
+                content[json.SYNC_COMMITTEE_CACHE_GENESIS_TIME_FIELD_NAME]
+                != ethereum.GENESIS_TIME
+            ):
+                return
+            for epoch, period in content[
+                json.SYNC_COMMITTEE_CACHE_PERIODS_FIELD_NAME
+            ].items():
+                self.__entries[
+                    (DutyType.SYNC_COMMITTEE, int(epoch), None)
+                ] = DutyCacheEntry(
+                    [
+                        DutyRecord.from_response(duty, DutyType.SYNC_COMMITTEE)
+                        for duty in period[json.SYNC_COMMITTEE_CACHE_DUTIES_FIELD_NAME]
+                    ],
+                    None,
+                    None,
+                    True,
+                    set(
+                        period[
+                            json.SYNC_COMMITTEE_CACHE_REQUESTED_VALIDATORS_FIELD_NAME
+                        ]
+                    ),
+                )
+        except (OSError, JSONDecodeError, KeyError, TypeError, ValueError) as error:
+            self.__entries.clear()
+            self.__logger.warning(
+                logging.SYNC_COMMITTEE_CACHE_READ_WARNING_MESSAGE,
+                self.__sync_committee_cache_file,
+                error,
+            )
+            return
+        self.__prune()
+        self.__logger.info(
+            logging.LOADED_SYNC_COMMITTEE_CACHE_MESSAGE,
+            len(self.__entries),
+            self.__sync_committee_cache_file,
+        )
+
+    def __prune(self) -> None:
+        """Remove duties of past epochs and sync committee periods"""
+        current_epoch = ethereum.get_current_epoch()
+        self.__entries = {
+            key: entry
+            for key, entry in self.__entries.items()
+            if key[1] >= self.__get_cache_epoch(key[0], current_epoch)
+        }
+
+    def __get_cache_epoch(self, duty_type: DutyType, epoch: int) -> int:
+        """Get the epoch under which duties are cached
+
+        Args:
+            duty_type (DutyType): Type of the duty
+            epoch (int): Epoch of the duties
+
+        Returns:
+            int: First epoch of the sync committee period for sync committee duties, otherwise the provided epoch # pylint: disable=line-too-long
+        """
+        if duty_type == DutyType.SYNC_COMMITTEE:
+            return (
+                epoch
+                // ethereum.EPOCHS_PER_SYNC_COMMITTEE
+                * ethereum.EPOCHS_PER_SYNC_COMMITTEE
+            )
+        return epoch
+
+
+duty_cache = DutyCache(ARGUMENTS.sync_committee_cache_file)
@@ -3,7 +3,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -30,6 +30,78 @@ class ValidatorDuty(BaseModel):
     seconds_left_in_current_sync_committee: int = Field(default=0)
 
 
+@dataclass(slots=True)
+class DutyRecord:
+    """Compact internal representation of a validator duty. Duties are fetched, cached and
+    logged as records, the pydantic model `ValidatorDuty` is only created for responses of
+    the rest api.
+    """
+
+    validator_index: int
+    pubkey: str
+    type: DutyType = DutyType.NONE
+    slot: int = 0
+    epoch: int = 0
+    validator_sync_committee_indices: Tuple[int, ...] = ()
+    seconds_to_duty: int = 0
+    seconds_left_in_current_sync_committee: int = 0
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any], duty_type: DutyType) -> "DutyRecord":
+        """Create a record from a duty of a beacon node response
+
+        Args:
+            data (Dict[str, Any]): Duty as returned by the beacon node api
+            duty_type (DutyType): Type of the duty
+
+        Returns:
+            DutyRecord: Duty record
+        """
+        return cls(
+            int(data["validator_index"]),
+            data["pubkey"],
+            duty_type,
+            int(data.get("slot", 0)),
+            validator_sync_committee_indices=tuple(
+                int(index) for index in data.get("validator_sync_committee_indices", ())
+            ),
+        )
+
+    def to_response(self) -> Dict[str, Any]:
+        """Convert the record to a duty in the format of the beacon node api
+
+        Returns:
+            Dict[str, Any]: Duty as returned by the beacon node api
+        """
+        return {
+            "pubkey": self.pubkey,
+            "validator_index": str(self.validator_index),
+            "slot": str(self.slot),
+            "validator_sync_committee_indices": [
+                str(index) for index in self.validator_sync_committee_indices
+            ],
+        }
+
+    def to_validator_duty(self) -> ValidatorDuty:
+        """Convert the record to the pydantic model which is returned by the rest api
+
+        Returns:
+            ValidatorDuty: Validator duty
+        """
+        return ValidatorDuty(
+            pubkey=self.pubkey,
+            validator_index=str(self.validator_index),
+            epoch=self.epoch,
+            slot=self.slot,
+            validator_sync_committee_indices=list(
+                self.validator_sync_committee_indices
+            ),
+            type=self.type,
+            seconds_to_duty=self.seconds_to_duty,
+            seconds_left_in_current_sync_committee=self.seconds_left_in_current_sync_committee,
+        )
+
+
 @dataclass
 class ValidatorData:
     """Representation of validator data as returned by /eth/v1/beacon/states/<state>/validators"""
@@ -37,6 +109,17 @@ class ValidatorData:
     pubkey: str
 
 
+@dataclass
+class ValidatorStatus:
+    """Fields of /eth/v1/beacon/states/<state>/validators which are needed to
+    identify active validators
+    """
+
+    index: str
+    status: str
+    pubkey: str
+
+
 class ValidatorIdentifier(BaseModel):
     """Representation of validator metadata as returned by
     /eth/v1/beacon/states/<state>/validators
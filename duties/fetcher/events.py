@@ -0,0 +1,189 @@
+"""Module for subscribing to beacon node events which confirm or invalidate cached duties
+"""
+
+from asyncio import Event, sleep
+from json import JSONDecodeError, loads
+from logging import getLogger
+from typing import Any, Dict, List
+
+from cli.arguments import ARGUMENTS
+from cli.types import NodeConnectionProperties
+from constants import endpoints, logging, program
+from fetcher.cache import duty_cache
+from helper.general import get_correct_request_header
+from httpx import (
+    AsyncClient,
+    HTTPError,
+    HTTPStatusError,
+    Limits,
+    Response,
+    StreamError,
+    Timeout,
+)
+from protocol import ethereum
+from protocol.request import beacon_node
+from protocol.retry import RetryPolicy
+
+
+class BeaconEventSubscriber:
+    """Subscribes to the `head`, `chain_reorg` and `finalized_checkpoint` events of the
+    provided beacon nodes. Every new head confirms or invalidates cached duties by their
+    dependent roots, so the dependent roots do not need to be polled while the stream is
+    connected. Streamed data proves that the beacon node is alive and replaces its health
+    check. If the stream breaks, the subscriber moves to the next beacon node and backs off
+    exponentially while no node streams events. In the meantime cached duties are verified
+    by polling as usual. The stream uses its own client, so it never occupies a connection
+    of the shared connection pools.
+    """
+
+    def __init__(self) -> None:
+        self.changed_duties = Event()
+        self.__has_received_events = False
+        self.__reconnect_policy = RetryPolicy(
+            base_delay=program.SECONDS_UNTIL_EVENT_STREAM_RECONNECT,
+            max_delay=program.MAX_SECONDS_UNTIL_EVENT_STREAM_RECONNECT,
+        )
+        self.__logger = getLogger()
+
+    async def subscribe(self) -> None:
+        """Stream events of the provided beacon nodes until the program stops"""
+        if not ARGUMENTS.beacon_events:
+            return
+        async with self.__create_client() as client:
+            attempt = 0
+            while True:
+                for node in self.__get_beacon_nodes():
+                    self.__has_received_events = False
+                    try:
+                        await self.__stream_events(client, node)
+                    except HTTPStatusError as error:
+                        self.__logger.warning(
+                            logging.EVENT_STREAM_ERROR_MESSAGE,
+                            node.url,
+                            f"status code {error.response.status_code}",
+                        )
+                    except (HTTPError, StreamError, ValueError) as error:
+                        self.__logger.warning(
+                            logging.EVENT_STREAM_ERROR_MESSAGE, node.url, error
+                        )
+                    if self.__has_received_events:
+                        attempt = 0
+                attempt += 1
+                await sleep(self.__reconnect_policy.get_delay(attempt))
+
+    def __create_client(self) -> AsyncClient:
+        """Create the client of the event stream. Only one stream is open at a time and
+        the read timeout covers the time between two received lines.
+
+        Returns:
+            AsyncClient: Asynchronous http client
+        """
+        return AsyncClient(
+            timeout=Timeout(
+                program.SECONDS_UNTIL_EVENT_STREAM_TIMES_OUT,
+                connect=program.REQUEST_TIMEOUT[0],
+            ),
+            limits=Limits(max_connections=1, max_keepalive_connections=0),
+            headers={"Accept-Encoding": program.IDENTITY_ACCEPT_ENCODING},
+        )
+
+    def __get_beacon_nodes(self) -> List[NodeConnectionProperties]:
+        """Get the provided beacon nodes in the order in which they are subscribed to. Healthy
+        nodes are preferred.
+
+        Returns:
+            List[NodeConnectionProperties]: Provided beacon nodes
+        """
+        return sorted(
+            ARGUMENTS.beacon_nodes,
+            key=lambda node: node not in beacon_node.healthy_nodes,
+        )
+
+    async def __stream_events(
+        self, client: AsyncClient, node: NodeConnectionProperties
+    ) -> None:
+        """Stream the events of the provided beacon node until the stream breaks
+
+        Args:
+            client (AsyncClient): Client of the event stream
+            node (NodeConnectionProperties): Beacon node connection properties
+
+        Raises:
+            HTTPStatusError: Raised if the beacon node does not serve the event stream
+        """
+        async with client.stream(
+            "GET",
+            f"{node.url}{endpoints.EVENTS_ENDPOINT}",
+            headers={
+                **get_correct_request_header(node),
+                "Accept": program.EVENT_STREAM_ACCEPT_HEADER,
+            },
+        ) as response:
+            response.raise_for_status()
+            self.__logger.info(logging.SUBSCRIBED_TO_EVENTS_MESSAGE, node.url)
+            duty_cache.is_receiving_events = True
+            try:
+                await self.__read_events(node, response)
+            finally:
+                duty_cache.is_receiving_events = False
+
+    async def __read_events(
+        self, node: NodeConnectionProperties, response: Response
+    ) -> None:
+        """Read server-sent events from the response stream. Every received line counts as
+        heartbeat of the beacon node.
+
+        Args:
+            node (NodeConnectionProperties): Beacon node connection properties
+            response (Response): Streamed response of the events endpoint
+        """
+        event_type = ""
+        data_lines: List[str] = []
+        async for line in response.aiter_lines():
+            beacon_node.record_heartbeat(node)
+            if not line:
+                if event_type and data_lines:
+                    self.__has_received_events = True
+                    self.__handle_event(event_type, "\n".join(data_lines))
+                event_type = ""
+                data_lines = []
+                continue
+            field, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if field == "event":
+                event_type = value
+            elif field == "data":
+                data_lines.append(value)
+
+    def __handle_event(self, event_type: str, data: str) -> None:
+        """Confirm or invalidate cached duties based on the received event. The main process
+        is woken up if cached duties were invalidated. A chain reorg only unconfirms cached
+        duties since the following head event carries the new dependent roots.
+
+        Args:
+            event_type (str): Event topic
+            data (str): Json encoded event data
+        """
+        try:
+            event: Dict[str, Any] = loads(data)
+            match event_type:
+                case "head":
+                    duty_cache.update_dependent_roots(
+                        int(event["slot"]),
+                        event["previous_duty_dependent_root"],
+                        event["current_duty_dependent_root"],
+                    )
+                    if duty_cache.has_invalidated_duties:
+                        self.changed_duties.set()
+                case "chain_reorg":
+                    self.__logger.info(
+                        logging.CHAIN_REORG_EVENT_MESSAGE, event["slot"], event["depth"]
+                    )
+                    duty_cache.unconfirm(int(event["slot"]) - int(event["depth"]))
+                case "finalized_checkpoint":
+                    duty_cache.confirm(int(event["epoch"]) * ethereum.SLOTS_PER_EPOCH)
+        except (JSONDecodeError, KeyError, TypeError, ValueError) as error:
+            self.__logger.debug(logging.INVALID_EVENT_MESSAGE, event_type, error)
+
+
+beacon_event_subscriber = BeaconEventSubscriber()
@@ -1,99 +1,178 @@
 """Module which holds all logic for fetching validator duties
 """
 
+from asyncio import TaskGroup, gather, to_thread
 from logging import getLogger
-from typing import List
+from os import stat
+from typing import Any, Dict, List, Set, Tuple
 
 from cli.arguments import ARGUMENTS
-from constants import endpoints, logging, program
-from fetcher.data_types import DutyType, ValidatorDuty
+from cli.types import Mode
+from constants import endpoints, json, logging, program
+from fetcher.cache import duty_cache
+from fetcher.data_types import DutyRecord, DutyType
 from fetcher.identifier import core
 from helper.error import NoDataFromEndpointError
 from protocol import ethereum
-from protocol.request import CalldataType, send_beacon_api_request
+from protocol.engine import DutyEngine, load_state_snapshot
+from protocol.flight import single_flight
+from protocol.request import (
+    CalldataType,
+    send_beacon_api_duty_request,
+    send_beacon_api_request,
+)
+from protocol.response import DutyResponse
 
 __VALIDATOR_IDENTIFIER_CACHE: List[str] = []
+__VALIDATOR_PUBKEY_CACHE: Dict[str, str] = {}
+__validator_identifier_cache_version = 0
+__duty_engine: DutyEngine | None = None
+__state_snapshot_modification_time: float | None = None
 __LOGGER = getLogger()
 
 
-def update_validator_identifier_cache() -> None:
-    """Updates the validator identifiers for the fetch module"""
-    complete_active_validator_identifiers = (
-        core.read_validator_identifiers_from_shared_memory(
-            program.ACTIVE_VALIDATOR_IDENTIFIERS_SHARED_MEMORY_NAME
+def __load_duty_engine() -> DutyEngine | None:
+    """Loads the state snapshot provided with '--state-snapshot-file' into a duty engine
+
+    Returns:
+        DutyEngine | None: Duty engine or None if no or an unreadable file was provided
+    """
+    if ARGUMENTS.state_snapshot_file is None:
+        return None
+    try:
+        snapshot = load_state_snapshot(ARGUMENTS.state_snapshot_file)
+    except (OSError, KeyError, TypeError, ValueError) as error:
+        __LOGGER.warning(
+            logging.STATE_SNAPSHOT_READ_WARNING_MESSAGE,
+            ARGUMENTS.state_snapshot_file,
+            error,
         )
+        return None
+    __LOGGER.info(
+        logging.LOADED_STATE_SNAPSHOT_MESSAGE,
+        snapshot.epoch,
+        len(snapshot.pubkeys),
+        ARGUMENTS.state_snapshot_file,
+    )
+    return DutyEngine(snapshot)
+
+
+async def __get_duty_engine() -> DutyEngine | None:
+    """Gets the duty engine of the state snapshot provided with '--state-snapshot-file'.
+    A snapshot only determines the attestation duties up to the epoch after it was taken,
+    therefore the file is loaded again whenever it was modified. This way the snapshot can
+    be replaced with a newer one while eth-duties is running.
+
+    Returns:
+        DutyEngine | None: Duty engine or None if no or an unreadable file was provided
+    """
+    global __duty_engine, __state_snapshot_modification_time
+    if ARGUMENTS.state_snapshot_file is None:
+        return None
+    try:
+        modification_time = stat(ARGUMENTS.state_snapshot_file).st_mtime
+    except OSError:
+        return __duty_engine
+    if modification_time != __state_snapshot_modification_time:
+        __state_snapshot_modification_time = modification_time
+        __duty_engine = await to_thread(__load_duty_engine)
+    return __duty_engine
+
+
+def update_validator_identifier_cache() -> None:
+    """Updates the validator identifiers for the fetch module. The version of the validator
+    set is increased if the identifiers changed."""
+    # pylint: disable-next=invalid-name, global-statement
+    global __validator_identifier_cache_version
+    active_validator_identifiers = core.read_validator_identifiers_from_shared_memory(
+        program.ACTIVE_VALIDATOR_IDENTIFIERS_SHARED_MEMORY_NAME
     )
+    complete_active_validator_identifiers = list(active_validator_identifiers.keys())
+    if complete_active_validator_identifiers != __VALIDATOR_IDENTIFIER_CACHE:
+        __validator_identifier_cache_version += 1
     __VALIDATOR_IDENTIFIER_CACHE.clear()
-    __VALIDATOR_IDENTIFIER_CACHE.extend(
-        list(complete_active_validator_identifiers.keys())
+    __VALIDATOR_IDENTIFIER_CACHE.extend(complete_active_validator_identifiers)
+    __VALIDATOR_PUBKEY_CACHE.clear()
+    __VALIDATOR_PUBKEY_CACHE.update(
+        {
+            validator_index: identifier.validator.pubkey
+            for validator_index, identifier in active_validator_identifiers.items()
+        }
     )
 
 
-async def fetch_upcoming_attestation_duties() -> dict[str, ValidatorDuty]:
+async def fetch_upcoming_attestation_duties() -> dict[int, DutyRecord]:
     """Fetches upcoming attestations (for current and upcoming epoch)
-    for all validators which were provided by the user.
+    for all validators which were provided by the user. Duties of the following epoch
+    are only requested for validators whose duty already passed.
 
     Returns:
-        dict[str, ValidatorDuty]: The upcoming attestation duties for all provided validators
+        dict[int, DutyRecord]: The upcoming attestation duties for all provided validators
     """
     current_epoch = ethereum.get_current_epoch()
-    is_any_duty_outdated: List[bool] = [True]
-    validator_duties: dict[str, ValidatorDuty] = {}
+    outdated_validators: List[int] | None = None
+    validator_duties: dict[int, DutyRecord] = {}
     if __should_fetch_attestation_duties():
-        while is_any_duty_outdated:
+        while outdated_validators is None or outdated_validators:
             response_data = await __fetch_duty_responses(
-                current_epoch, DutyType.ATTESTATION
+                current_epoch,
+                DutyType.ATTESTATION,
+                None
+                if outdated_validators is None
+                else [str(validator_index) for validator_index in outdated_validators],
             )
-            validator_duties = {
-                data.validator_index: __get_next_attestation_duty(
-                    data, validator_duties
+            for data in response_data:
+                validator_duties[data.validator_index] = __get_next_attestation_duty(
+                    data
                 )
-                for data in response_data
-            }
-            is_any_duty_outdated = [
-                True for duty in validator_duties.values() if duty.slot == 0
+            outdated_validators = [
+                validator_index
+                for validator_index, duty in validator_duties.items()
+                if duty.slot == 0
             ]
+            for validator_index in outdated_validators:
+                del validator_duties[validator_index]
             current_epoch += 1
     return validator_duties
 
 
-async def fetch_upcoming_sync_committee_duties() -> dict[str, ValidatorDuty]:
+async def fetch_upcoming_sync_committee_duties() -> dict[int, DutyRecord]:
     """Fetches current and upcoming sync committee duties for all validators
     provided by the user.
 
     Returns:
-        dict[str, ValidatorDuty]: The upcoming sync committee duties for all provided validators
+        dict[int, DutyRecord]: The upcoming sync committee duties for all provided validators
     """
     current_epoch = ethereum.get_current_epoch()
     current_sync_committee_epoch_boundaries = (
         ethereum.get_sync_committee_epoch_boundaries(current_epoch)
     )
-    validator_duties: dict[str, ValidatorDuty] = {}
+    validator_duties: dict[int, DutyRecord] = {}
     for epoch in [current_epoch, (current_sync_committee_epoch_boundaries[1] + 1)]:
         response_data = await __fetch_duty_responses(epoch, DutyType.SYNC_COMMITTEE)
         for data in response_data:
             if data.validator_index not in validator_duties:
-                sync_committee_duty = ValidatorDuty(
-                    pubkey=data.pubkey,
-                    validator_index=data.validator_index,
+                sync_committee_duty = DutyRecord(
+                    data.validator_index,
+                    data.pubkey,
+                    DutyType.SYNC_COMMITTEE,
                     epoch=epoch,
                     validator_sync_committee_indices=data.validator_sync_committee_indices,
-                    type=DutyType.SYNC_COMMITTEE,
                 )
                 ethereum.set_time_to_duty(sync_committee_duty)
                 validator_duties[data.validator_index] = sync_committee_duty
     return validator_duties
 
 
-async def fetch_upcoming_proposing_duties() -> dict[str, ValidatorDuty]:
+async def fetch_upcoming_proposing_duties() -> dict[int, DutyRecord]:
     """Fetches upcoming block proposals for all validators which were
     provided by the user.
 
     Returns:
-        dict[str, ValidatorDuty]: The upcoming block proposing duties for all provided validators
+        dict[int, DutyRecord]: The upcoming block proposing duties for all provided validators
     """
     current_epoch = ethereum.get_current_epoch()
-    validator_duties: dict[str, ValidatorDuty] = {}
+    validator_duties: dict[int, DutyRecord] = {}
     for index in [1, 1]:
         response_data = await __fetch_duty_responses(current_epoch, DutyType.PROPOSING)
         for data in response_data:
@@ -101,11 +180,8 @@ async def fetch_upcoming_proposing_duties() -> dict[str, ValidatorDuty]:
                 str(data.validator_index) in __VALIDATOR_IDENTIFIER_CACHE
                 and data.validator_index not in validator_duties
             ):
-                proposing_duty = ValidatorDuty(
-                    pubkey=data.pubkey,
-                    validator_index=data.validator_index,
-                    slot=data.slot,
-                    type=DutyType.PROPOSING,
+                proposing_duty = DutyRecord(
+                    data.validator_index, data.pubkey, DutyType.PROPOSING, data.slot
                 )
                 ethereum.set_time_to_duty(proposing_duty)
                 validator_duties[data.validator_index] = proposing_duty
@@ -113,6 +189,34 @@ async def fetch_upcoming_proposing_duties() -> dict[str, ValidatorDuty]:
     return __filter_proposing_duties(validator_duties)
 
 
+async def prefetch_next_epoch_duties_on_interval() -> None:
+    """Prefetches the duties of the next epoch into the duty cache in every epoch. The
+    prefetch starts the user defined number of slots before the epoch boundary, so that
+    the duties are already cached when the epoch starts."""
+    if ARGUMENTS.prefetch_slots == 0 or ARGUMENTS.mode == Mode.NO_LOG:
+        return
+    while True:
+        next_epoch = ethereum.get_current_epoch() + 1
+        await ethereum.slot_clock.wait_until_slot(
+            next_epoch * ethereum.SLOTS_PER_EPOCH - ARGUMENTS.prefetch_slots
+        )
+        await __prefetch_duties(next_epoch)
+        await ethereum.slot_clock.wait_until_slot(next_epoch * ethereum.SLOTS_PER_EPOCH)
+
+
+async def __prefetch_duties(epoch: int) -> None:
+    """Fetches the duties of the provided epoch into the duty cache
+
+    Args:
+        epoch (int): Epoch to prefetch the duties for
+    """
+    __LOGGER.debug(logging.PREFETCH_DUTIES_MESSAGE, epoch)
+    async with TaskGroup() as taskgroup:
+        if __should_fetch_attestation_duties():
+            taskgroup.create_task(__fetch_duty_responses(epoch, DutyType.ATTESTATION))
+        taskgroup.create_task(__fetch_duty_responses(epoch, DutyType.SYNC_COMMITTEE))
+
+
 def __should_fetch_attestation_duties() -> bool:
     """Checks if attestation duties should be fetched
 
@@ -122,6 +226,7 @@ def __should_fetch_attestation_duties() -> bool:
     if (
         len(__VALIDATOR_IDENTIFIER_CACHE) > ARGUMENTS.max_attestation_duty_logs
         and not ARGUMENTS.omit_attestation_duties
+        and not ARGUMENTS.bulk_attestation_duties
     ):
         __LOGGER.warning(
             logging.TOO_MANY_PROVIDED_VALIDATORS_FOR_FETCHING_ATTESTATION_DUTIES_MESSAGE,
@@ -133,45 +238,35 @@ def __should_fetch_attestation_duties() -> bool:
     return True
 
 
-def __get_next_attestation_duty(
-    data: ValidatorDuty, present_duties: dict[str, ValidatorDuty]
-) -> ValidatorDuty:
+def __get_next_attestation_duty(data: DutyRecord) -> DutyRecord:
     """Checks supplied response data for upcoming attestation duty and returns it
 
     Args:
-        data (ValidatorDuty): Response data from rest api call
-        present_duties (dict[str, ValidatorDuty]): The already fetched and processed duties
+        data (DutyRecord): Response data from rest api call
 
     Returns:
-        ValidatorDuty: Validator duty object for the next attestation duty
+        DutyRecord: Validator duty object for the next attestation duty or a duty without slot if the duty already passed # pylint: disable=line-too-long
     """
     current_slot = ethereum.get_current_slot()
-    if data.validator_index in present_duties:
-        present_validator_duty = present_duties[data.validator_index]
-        if present_validator_duty.slot != 0:
-            return present_validator_duty
-    attestation_duty = ValidatorDuty(
-        pubkey=data.pubkey,
-        validator_index=data.validator_index,
-        type=DutyType.ATTESTATION,
-    )
     if current_slot >= data.slot:
-        return attestation_duty
-    attestation_duty.slot = data.slot
+        return DutyRecord(data.validator_index, data.pubkey, DutyType.ATTESTATION)
+    attestation_duty = DutyRecord(
+        data.validator_index, data.pubkey, DutyType.ATTESTATION, data.slot
+    )
     ethereum.set_time_to_duty(attestation_duty)
     return attestation_duty
 
 
 def __filter_proposing_duties(
-    raw_proposing_duties: dict[str, ValidatorDuty]
-) -> dict[str, ValidatorDuty]:
+    raw_proposing_duties: dict[int, DutyRecord]
+) -> dict[int, DutyRecord]:
     """Filters supplied proposing duties dict for already outdated duties
 
     Args:
-        raw_proposing_duties (dict[str, ValidatorDuty]): All fetched proposing duties for the current and upcoming epoch # pylint: disable=line-too-long
+        raw_proposing_duties (dict[int, DutyRecord]): All fetched proposing duties for the current and upcoming epoch # pylint: disable=line-too-long
 
     Returns:
-        dict[str, ValidatorDuty]: Filtered proposing duties
+        dict[int, DutyRecord]: Filtered proposing duties
     """
     current_slot = ethereum.get_current_slot()
     filtered_proposing_duties = {
@@ -183,38 +278,429 @@ def __filter_proposing_duties(
 
 
 async def __fetch_duty_responses(
-    target_epoch: int, duty_type: DutyType
-) -> List[ValidatorDuty]:
-    """Fetches validator duties in dependence of the duty type from the beacon client
+    target_epoch: int,
+    duty_type: DutyType,
+    provided_validators: List[str] | None = None,
+) -> List[DutyRecord]:
+    """Fetches validator duties in dependence of the duty type from the beacon client.
+    Concurrent fetches (e.g. main loop and rest handlers) of the same endpoint, epoch and
+    validator set share a single request. Requests without validators in the calldata (e.g.
+    proposing duties) are shared regardless of the validator set.
 
     Args:
         target_epoch (int): Epoch to fetch duties for
         duty_type (DutyType): Type of the duty
+        provided_validators (List[str] | None): Validator indices to fetch the duties for. Defaults to all cached validator identifiers # pylint: disable=line-too-long
 
     Returns:
-        List[ValidatorDuty]: List of fetched validator duties
+        List[DutyRecord]: List of fetched validator duties
     """
+    duty_request = __get_duty_request(duty_type)
+    if not duty_request:
+        return []
+    validator_set_version = __get_validator_set_version(duty_type, duty_request[1])
+    validators = None
+    if duty_request[1] == CalldataType.REQUEST_DATA:
+        validators = (
+            provided_validators
+            if provided_validators is not None
+            else list(__VALIDATOR_IDENTIFIER_CACHE)
+        )
+    return await single_flight.run(
+        (
+            duty_request[0],
+            target_epoch,
+            None if validators is None else __validator_identifier_cache_version,
+            None if provided_validators is None else tuple(provided_validators),
+        ),
+        lambda: __get_duties(
+            duty_type, duty_request, target_epoch, validator_set_version, validators
+        ),
+    )
+
+
+async def verify_cached_duties() -> None:
+    """Verifies the dependent root of all cached duties for which the verification is due"""
+    for duty_type, epoch, validator_set_version in duty_cache.get_keys_to_verify():
+        await __verify_cached_duties(duty_type, epoch, validator_set_version)
+
+
+async def __get_duties(
+    duty_type: DutyType,
+    duty_request: Tuple[str, CalldataType],
+    target_epoch: int,
+    validator_set_version: int | None,
+    validators: List[str] | None,
+) -> List[DutyRecord]:
+    """Gets the duties from the duty cache. Only duties of validators which are not cached
+    yet are fetched and merged into the cache. If the dependent block was reorged, the
+    duties are fetched again. Duties whose dependent block does not exist yet or whose
+    dependent root is unknown are not cached.
+
+    Args:
+        duty_type (DutyType): Type of the duty
+        duty_request (Tuple[str, CalldataType]): Endpoint without epoch and calldata type
+        target_epoch (int): Epoch to fetch duties for
+        validator_set_version (int | None): Version of the validator set or None if the duties do not depend on it # pylint: disable=line-too-long
+        validators (List[str] | None): Validator indices to get the duties for or None if the duties do not depend on validators # pylint: disable=line-too-long
+
+    Returns:
+        List[DutyRecord]: List of cached or fetched validator duties
+    """
+    cache_entry = duty_cache.get(duty_type, target_epoch, validator_set_version)
+    if (
+        cache_entry
+        and not duty_cache.is_receiving_events
+        and cache_entry.is_verification_due(ethereum.get_current_slot())
+    ):
+        await __verify_cached_duties(duty_type, target_epoch, validator_set_version)
+        cache_entry = duty_cache.get(duty_type, target_epoch, validator_set_version)
+    missing_validators = (
+        cache_entry.get_missing_validators(validators) if cache_entry else validators
+    )
+    if cache_entry and not missing_validators:
+        __LOGGER.debug(logging.CACHED_DUTIES_MESSAGE, duty_type.value, target_epoch)
+        return cache_entry.get_duties(validators)
+    for _ in range(program.DUTY_CACHE_FETCH_ATTEMPTS):
+        try:
+            duty_response = await __send_duty_request(
+                duty_type, duty_request, target_epoch, missing_validators
+            )
+        except NoDataFromEndpointError:
+            break
+        duties = [
+            DutyRecord.from_response(data, duty_type) for data in duty_response.duties
+        ]
+        cached_duties = cache_entry.get_duties(validators) if cache_entry else []
+        if not duty_response.is_complete or not duty_cache.is_cacheable(
+            duty_type, target_epoch
+        ):
+            return duties + cached_duties
+        dependent_root = duty_response.dependent_root
+        if (
+            dependent_root is None
+            and ethereum.get_dependent_slot(duty_type, target_epoch) is not None
+        ):
+            dependent_root = await __fetch_dependent_root(duty_request, target_epoch)
+            if dependent_root is None:
+                return duties + cached_duties
+        cache_entry = duty_cache.add(
+            duty_type,
+            target_epoch,
+            validator_set_version,
+            duties,
+            dependent_root,
+            missing_validators,
+        )
+        duty_cache.persist(duty_type)
+        missing_validators = cache_entry.get_missing_validators(validators)
+        if not missing_validators:
+            break
+    return cache_entry.get_duties(validators) if cache_entry else []
+
+
+async def __send_duty_request(
+    duty_type: DutyType,
+    duty_request: Tuple[str, CalldataType],
+    target_epoch: int,
+    validators: List[str] | None,
+) -> DutyResponse:
+    """Sends the duty request. Attestation and sync committee duties of many validators are
+    derived from the (sync) committees of the beacon state instead of sending the validators
+    in chunks. Attestation duties which are determined by the provided state snapshot are
+    computed locally.
+
+    Args:
+        duty_type (DutyType): Type of the duty
+        duty_request (Tuple[str, CalldataType]): Endpoint without epoch and calldata type
+        target_epoch (int): Epoch to fetch duties for
+        validators (List[str] | None): Validator indices to fetch the duties for
+
+    Returns:
+        DutyResponse: Fetched duties
+    """
+    if (
+        duty_type == DutyType.SYNC_COMMITTEE
+        and validators
+        and len(validators)
+        >= program.MIN_NUMBER_OF_VALIDATORS_FOR_FETCHING_SYNC_COMMITTEES
+    ):
+        return await __send_sync_committee_request(target_epoch, validators)
+    duty_engine = (
+        await __get_duty_engine() if duty_type == DutyType.ATTESTATION else None
+    )
+    if (
+        duty_type == DutyType.ATTESTATION
+        and validators
+        and duty_engine
+        and duty_engine.can_compute_attestation_duties(target_epoch, validators)
+    ):
+        return await __compute_attestation_duties(duty_engine, target_epoch, validators)
+    if (
+        duty_type == DutyType.ATTESTATION
+        and validators
+        and len(validators) >= program.MIN_NUMBER_OF_VALIDATORS_FOR_FETCHING_COMMITTEES
+    ):
+        return await __send_committees_request(target_epoch, validators)
+    return await send_beacon_api_duty_request(
+        f"{duty_request[0]}{target_epoch}", duty_request[1], validators
+    )
+
+
+async def __compute_attestation_duties(
+    duty_engine: DutyEngine, target_epoch: int, validators: List[str]
+) -> DutyResponse:
+    """Computes the attestation duties of the provided validators from the state snapshot.
+    The shuffling runs in a worker thread to not block the event loop. The dependent root
+    is requested with an attester duty request without validators, so that the duties can
+    be verified like fetched attester duties.
+
+    Args:
+        duty_engine (DutyEngine): Duty engine of the state snapshot
+        target_epoch (int): Epoch to compute the duties for
+        validators (List[str]): Validator indices to compute the attestation duties for
+
+    Returns:
+        DutyResponse: Attestation duties in the structure of the duty api
+    """
+    __LOGGER.debug(
+        logging.COMPUTING_ATTESTATION_DUTIES_MESSAGE, target_epoch, len(validators)
+    )
+    duties, dependent_root_response = await gather(
+        to_thread(duty_engine.get_attestation_duties, target_epoch, validators),
+        send_beacon_api_duty_request(
+            f"{endpoints.ATTESTATION_DUTY_ENDPOINT}{target_epoch}",
+            CalldataType.REQUEST_DATA,
+            [],
+        ),
+    )
+    return DutyResponse(duties, dependent_root_response.dependent_root, True)
+
+
+async def __send_committees_request(
+    target_epoch: int, validators: List[str]
+) -> DutyResponse:
+    """Fetches all committees of the provided epoch from the beacon state and derives the
+    attestation duties of the provided validators from them. The committees are streamed and
+    only the members of the provided validators are kept. The dependent root is requested
+    with an attester duty request without validators, so that the duties can be verified
+    like fetched attester duties.
+
+    Args:
+        target_epoch (int): Epoch to fetch the committees for
+        validators (List[str]): Validator indices to get the attestation duties for
+
+    Returns:
+        DutyResponse: Attestation duties in the structure of the duty api
+    """
+    __LOGGER.debug(logging.FETCHING_COMMITTEES_MESSAGE, target_epoch, len(validators))
+    validator_set = set(validators)
+    committees, dependent_root_response = await gather(
+        send_beacon_api_request(
+            f"{endpoints.COMMITTEES_ENDPOINT}{target_epoch}",
+            CalldataType.NONE,
+            projection=lambda committee: __project_committee(committee, validator_set),
+        ),
+        send_beacon_api_duty_request(
+            f"{endpoints.ATTESTATION_DUTY_ENDPOINT}{target_epoch}",
+            CalldataType.REQUEST_DATA,
+            [],
+        ),
+    )
+    committees_at_slot: Dict[str, int] = {}
+    for slot, _, _, _ in committees:
+        committees_at_slot[slot] = committees_at_slot.get(slot, 0) + 1
+    return DutyResponse(
+        [
+            {
+                "pubkey": __VALIDATOR_PUBKEY_CACHE.get(validator_index, ""),
+                "validator_index": validator_index,
+                "committee_index": committee_index,
+                "committee_length": str(committee_length),
+                "committees_at_slot": str(committees_at_slot[slot]),
+                "validator_committee_index": str(validator_committee_index),
+                "slot": slot,
+            }
+            for slot, committee_index, committee_length, members in committees
+            for validator_index, validator_committee_index in members.items()
+        ],
+        dependent_root_response.dependent_root,
+        True,
+    )
+
+
+def __project_committee(
+    committee: Dict[str, Any], validator_set: Set[str]
+) -> Tuple[str, str, int, Dict[str, int]]:
+    """Reduces a committee of the committees endpoint to the provided validators. Most
+    committees do not contain any of the validators, which is checked with a set
+    intersection before the positions are searched.
+
+    Args:
+        committee (Dict[str, Any]): Committee as returned by the committees endpoint
+        validator_set (Set[str]): Validator indices to get the attestation duties for
+
+    Raises:
+        KeyError: Raised if the committee is malformed
+
+    Returns:
+        Tuple[str, str, int, Dict[str, int]]: Slot, committee index, committee length and the position of every provided validator within the committee # pylint: disable=line-too-long
+    """
+    committee_validators = committee[json.RESPONSE_JSON_VALIDATORS_FIELD_NAME]
+    members: Dict[str, int] = {}
+    if not validator_set.isdisjoint(committee_validators):
+        members = {
+            validator_index: position
+            for position, validator_index in enumerate(committee_validators)
+            if validator_index in validator_set
+        }
+    return (
+        committee[json.RESPONSE_JSON_SLOT_FIELD_NAME],
+        committee[json.RESPONSE_JSON_INDEX_FIELD_NAME],
+        len(committee_validators),
+        members,
+    )
+
+
+async def __send_sync_committee_request(
+    target_epoch: int, validators: List[str]
+) -> DutyResponse:
+    """Fetches the sync committee (512 validator indices) of the provided epoch from the
+    beacon state and intersects it with the provided validators. The position of a validator
+    within the committee is its sync committee index.
+
+    Args:
+        target_epoch (int): Epoch to fetch the sync committee for
+        validators (List[str]): Validator indices to get the sync committee duties for
+
+    Raises:
+        NoDataFromEndpointError: Raised if the response does not contain the sync committee
+
+    Returns:
+        DutyResponse: Sync committee duties in the structure of the duty api
+    """
+    __LOGGER.debug(
+        logging.FETCHING_SYNC_COMMITTEE_MESSAGE, target_epoch, len(validators)
+    )
+    response = await send_beacon_api_request(
+        f"{endpoints.SYNC_COMMITTEES_ENDPOINT}{target_epoch}",
+        CalldataType.NONE,
+        flatten=False,
+    )
     try:
-        match duty_type:
-            case DutyType.ATTESTATION:
-                responses = await send_beacon_api_request(
-                    f"{endpoints.ATTESTATION_DUTY_ENDPOINT}{target_epoch}",
-                    CalldataType.REQUEST_DATA,
-                    __VALIDATOR_IDENTIFIER_CACHE,
-                )
-            case DutyType.SYNC_COMMITTEE:
-                responses = await send_beacon_api_request(
-                    f"{endpoints.SYNC_COMMITTEE_DUTY_ENDPOINT}{target_epoch}",
-                    CalldataType.REQUEST_DATA,
-                    __VALIDATOR_IDENTIFIER_CACHE,
-                )
-            case DutyType.PROPOSING:
-                responses = await send_beacon_api_request(
-                    f"{endpoints.BLOCK_PROPOSING_DUTY_ENDPOINT}{target_epoch}",
-                    CalldataType.NONE,
-                )
-            case _:
-                responses = []
-        return [ValidatorDuty.model_validate(data) for data in responses]
+        sync_committee = list(response[0][json.RESPONSE_JSON_VALIDATORS_FIELD_NAME])
+    except (KeyError, TypeError) as error:
+        raise NoDataFromEndpointError() from error
+    validator_set = set(validators)
+    sync_committee_indices: Dict[str, List[str]] = {}
+    for sync_committee_index, validator_index in enumerate(sync_committee):
+        if validator_index in validator_set:
+            sync_committee_indices.setdefault(validator_index, []).append(
+                str(sync_committee_index)
+            )
+    return DutyResponse(
+        [
+            {
+                "pubkey": __VALIDATOR_PUBKEY_CACHE.get(validator_index, ""),
+                "validator_index": validator_index,
+                "validator_sync_committee_indices": indices,
+            }
+            for validator_index, indices in sync_committee_indices.items()
+        ],
+        None,
+        True,
+    )
+
+
+async def __verify_cached_duties(
+    duty_type: DutyType, epoch: int, validator_set_version: int | None
+) -> None:
+    """Verifies the dependent root of cached duties by requesting the duties without any
+    validator. Cached duties whose dependent root changed are removed from the cache.
+
+    Args:
+        duty_type (DutyType): Type of the duty
+        epoch (int): Epoch of the cached duties
+        validator_set_version (int | None): Version of the validator set or None if the duties do not depend on it # pylint: disable=line-too-long
+    """
+    cache_entry = duty_cache.get(duty_type, epoch, validator_set_version)
+    duty_request = __get_duty_request(duty_type)
+    if not cache_entry or not duty_request:
+        return
+    dependent_root = await __fetch_dependent_root(duty_request, epoch)
+    if dependent_root is None:
+        return
+    if cache_entry.dependent_root == dependent_root:
+        cache_entry.is_confirmed = True
+        return
+    if cache_entry.dependent_root:
+        __LOGGER.warning(
+            logging.CHANGED_DEPENDENT_ROOT_MESSAGE,
+            duty_type.value,
+            epoch,
+            cache_entry.dependent_root,
+            dependent_root,
+        )
+    duty_cache.invalidate(duty_type, epoch, validator_set_version)
+
+
+async def __fetch_dependent_root(
+    duty_request: Tuple[str, CalldataType], epoch: int
+) -> str | None:
+    """Fetches the dependent root of duties by requesting the duties without any validator
+
+    Args:
+        duty_request (Tuple[str, CalldataType]): Endpoint without epoch and calldata type
+        epoch (int): Epoch of the duties
+
+    Returns:
+        str | None: Dependent root or None if it could not be fetched
+    """
+    try:
+        duty_response = await send_beacon_api_duty_request(
+            f"{duty_request[0]}{epoch}", duty_request[1], []
+        )
     except NoDataFromEndpointError:
-        return []
+        return None
+    return duty_response.dependent_root
+
+
+def __get_duty_request(duty_type: DutyType) -> Tuple[str, CalldataType] | None:
+    """Gets the endpoint and calldata type of the provided duty type
+
+    Args:
+        duty_type (DutyType): Type of the duty
+
+    Returns:
+        Tuple[str, CalldataType] | None: Endpoint without epoch and calldata type or None for unknown duty types # pylint: disable=line-too-long
+    """
+    match duty_type:
+        case DutyType.ATTESTATION:
+            return endpoints.ATTESTATION_DUTY_ENDPOINT, CalldataType.REQUEST_DATA
+        case DutyType.SYNC_COMMITTEE:
+            return endpoints.SYNC_COMMITTEE_DUTY_ENDPOINT, CalldataType.REQUEST_DATA
+        case DutyType.PROPOSING:
+            return endpoints.BLOCK_PROPOSING_DUTY_ENDPOINT, CalldataType.NONE
+        case _:
+            return None
+
+
+def __get_validator_set_version(
+    duty_type: DutyType, calldata_type: CalldataType
+) -> int | None:
+    """Gets the version of the cached validator identifiers if the duties depend on them.
+    Sync committee membership is fixed for a whole period, therefore cached sync committee
+    duties are kept on validator set changes and only duties of new validators are fetched.
+
+    Args:
+        duty_type (DutyType): Type of the duty
+        calldata_type (CalldataType): Calldata type of the duty request
+
+    Returns:
+        int | None: Version of the validator set or None if the duties do not depend on it
+    """
+    if duty_type == DutyType.SYNC_COMMITTEE:
+        return None
+    if calldata_type == CalldataType.REQUEST_DATA:
+        return __validator_identifier_cache_version
+    return None
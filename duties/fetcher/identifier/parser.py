@@ -9,7 +9,7 @@ from typing import Any, Dict, List
 
 from cli.arguments import ARGUMENTS
 from constants import endpoints, json, logging, program
-from fetcher.data_types import ValidatorIdentifier
+from fetcher.data_types import ValidatorIdentifier, ValidatorStatus
 from fetcher.fetch import update_validator_identifier_cache
 from fetcher.identifier import core
 from fetcher.identifier.filter import (
@@ -17,7 +17,12 @@ from fetcher.identifier.filter import (
     log_inactive_and_duplicated_validators,
 )
 from helper.error import NoDataFromEndpointError
-from protocol.ethereum import ACTIVE_VALIDATOR_STATUS
+from protocol.client import connection_pool
+from protocol.ethereum import (
+    ACTIVE_VALIDATOR_STATUS,
+    get_current_epoch,
+    get_validator_status,
+)
 from protocol.request import (
     CalldataType,
     send_beacon_api_request,
@@ -139,6 +144,7 @@ async def __fetch_active_validator_identifiers(
             endpoint=endpoints.VALIDATOR_STATUS_ENDPOINT,
             calldata_type=CalldataType.PARAMETERS,
             provided_validators=provided_validators,
+            projection=__project_validator_info,
         )
     except NoDataFromEndpointError:
         validator_infos = []
@@ -150,8 +156,29 @@ async def __fetch_active_validator_identifiers(
     return provided_active_validator_identifiers
 
 
+def __project_validator_info(validator_info: Any) -> ValidatorStatus:
+    """Reduce fetched validator infos to the fields needed for identifying active validators.
+    SSZ encoded validator infos do not include the status which is derived from the epochs then.
+
+    Args:
+        validator_info (Any): Validator infos from the beacon chain
+
+    Returns:
+        ValidatorStatus: Index, status and pubkey of the validator
+    """
+    validator = validator_info[json.RESPONSE_JSON_VALIDATOR_FIELD_NAME]
+    status = validator_info.get(json.RESPONSE_JSON_STATUS_FIELD_NAME)
+    if status is None:
+        status = get_validator_status(validator, get_current_epoch())
+    return ValidatorStatus(
+        validator_info[json.RESPONSE_JSON_INDEX_FIELD_NAME],
+        status,
+        validator[json.RESPONSE_JSON_PUBKEY_FIELD_NAME],
+    )
+
+
 def __create_complete_active_validator_identifiers(
-    fetched_validator_infos: List[Any],
+    fetched_validator_infos: List[ValidatorStatus],
     provided_validators: List[str],
     raw_validator_identifiers: dict[str, ValidatorIdentifier],
 ) -> Dict[str, ValidatorIdentifier]:
@@ -159,7 +186,7 @@ def __create_complete_active_validator_identifiers(
     for inactive ones and duplicates
 
     Args:
-        fetched_validator_infos (List[Any]): Fetched validator infos from the beacon chain
+        fetched_validator_infos (List[ValidatorStatus]): Fetched validator infos from the beacon chain # pylint: disable=line-too-long
         provided_validators (List[str]): Provided validators by the user
         raw_validator_identifiers (dict[str, ValidatorIdentifier]): Validator identifiers provided by the user or fetched via keymanager api # pylint: disable=line-too-long
 
@@ -172,15 +199,9 @@ def __create_complete_active_validator_identifiers(
         raw_identifier = __get_raw_validator_identifier(
             validator_info, raw_validator_identifiers
         )
-        if (
-            raw_identifier
-            and validator_info[json.RESPONSE_JSON_STATUS_FIELD_NAME]
-            in ACTIVE_VALIDATOR_STATUS
-        ):
-            raw_identifier.index = validator_info[json.RESPONSE_JSON_INDEX_FIELD_NAME]
-            raw_identifier.validator.pubkey = validator_info[
-                json.RESPONSE_JSON_VALIDATOR_FIELD_NAME
-            ][json.RESPONSE_JSON_PUBKEY_FIELD_NAME]
+        if raw_identifier and validator_info.status in ACTIVE_VALIDATOR_STATUS:
+            raw_identifier.index = validator_info.index
+            raw_identifier.validator.pubkey = validator_info.pubkey
             complete_validator_identifiers[raw_identifier.index] = raw_identifier
     log_inactive_and_duplicated_validators(
         provided_validators, complete_validator_identifiers
@@ -189,27 +210,21 @@ def __create_complete_active_validator_identifiers(
 
 
 def __get_raw_validator_identifier(
-    validator_info: Any,
+    validator_info: ValidatorStatus,
     raw_validator_identifiers: dict[str, ValidatorIdentifier],
 ) -> ValidatorIdentifier | None:
     """Get raw validator identifier as provided by the user based on the
     fetched validator infos from the beacon chain
 
     Args:
-        validator_info (Any): Validator infos from the beacon chain
+        validator_info (ValidatorStatus): Validator infos from the beacon chain
         raw_validator_identifiers (dict[str, ValidatorIdentifier]): Validator identifiers provided by the user or fetched via keymanager api # pylint: disable=line-too-long
 
     Returns:
         ValidatorIdentifier | None: Raw validator identifier
     """
-    identifier_index = raw_validator_identifiers.get(
-        validator_info[json.RESPONSE_JSON_INDEX_FIELD_NAME]
-    )
-    identifier_pubkey = raw_validator_identifiers.get(
-        validator_info[json.RESPONSE_JSON_VALIDATOR_FIELD_NAME][
-            json.RESPONSE_JSON_PUBKEY_FIELD_NAME
-        ]
-    )
+    identifier_index = raw_validator_identifiers.get(validator_info.index)
+    identifier_pubkey = raw_validator_identifiers.get(validator_info.pubkey)
     if identifier_index and identifier_pubkey:
         if identifier_index.alias:
             return identifier_index
@@ -337,6 +352,16 @@ def __get_raw_validator_identifier_from_keystore(
     }
 
 
+async def __create_initial_shared_active_validator_identifiers() -> None:
+    """Create the validator identifiers in shared memory on startup and close the clients
+    of the startup event loop afterwards
+    """
+    try:
+        await create_shared_active_validator_identifiers()
+    finally:
+        await connection_pool.close_clients()
+
+
 try:
     SharedMemory(
         program.ACTIVE_VALIDATOR_IDENTIFIERS_SHARED_MEMORY_NAME,
@@ -348,7 +373,7 @@ try:
         True,
         program.SIZE_OF_SHARED_MEMORY,
     )
-    run(create_shared_active_validator_identifiers())
+    run(__create_initial_shared_active_validator_identifiers())
     update_validator_identifier_cache()
 except KeyboardInterrupt:
     __LOGGER.error(logging.SYSTEM_EXIT_MESSAGE)
@@ -9,7 +9,7 @@ from typing import List, Tuple
 from cli.arguments import ARGUMENTS
 from cli.types import Mode
 from constants import logging, program
-from fetcher.data_types import DutyType, ValidatorDuty, ValidatorIdentifier
+from fetcher.data_types import DutyRecord, DutyType, ValidatorIdentifier
 from fetcher.identifier.core import read_validator_identifiers_from_shared_memory
 from helper.duty import get_duties_proportion_above_time_threshold
 from helper.general import format_timedelta_to_hours
@@ -21,19 +21,29 @@ __validator_identifiers_with_alias = {"0": ValidatorIdentifier()}
 __LOGGER = getLogger()
 
 
-def log_time_to_next_duties(validator_duties: List[ValidatorDuty]) -> None:
+def log_time_to_next_duties(validator_duties: List[DutyRecord]) -> None:
     """Logs the time to next duties for the provided validators to the console
 
     Args:
-        validator_duties (List[ValidatorDuty]): List of validator duties
+        validator_duties (List[DutyRecord]): List of validator duties
     """
     __set_global_validator_identifiers_with_alias()
     print("")
     __LOGGER.info(logging.NEXT_INTERVAL_MESSAGE)
     if validator_duties:
+        number_of_attestation_duties = 0
         for duty in validator_duties:
+            if duty.type is DutyType.ATTESTATION:
+                number_of_attestation_duties += 1
+                if number_of_attestation_duties > ARGUMENTS.max_attestation_duty_logs:
+                    continue
             logging_message = __create_logging_message(duty)
             __LOGGER.info(logging_message)
+        if number_of_attestation_duties > ARGUMENTS.max_attestation_duty_logs:
+            __LOGGER.info(
+                logging.NOT_LOGGED_ATTESTATION_DUTIES_MESSAGE,
+                number_of_attestation_duties - ARGUMENTS.max_attestation_duty_logs,
+            )
         __log_duty_proportion_above_time_threshold(validator_duties)
     else:
         __LOGGER.info(logging.NO_UPCOMING_DUTIES_MESSAGE)
@@ -49,12 +59,12 @@ def __set_global_validator_identifiers_with_alias() -> None:
 
 
 def __log_duty_proportion_above_time_threshold(
-    validator_duties: List[ValidatorDuty],
+    validator_duties: List[DutyRecord],
 ) -> None:
     """Log the proportion of validator duties above a defined time threshold
 
     Args:
-        validator_duties (List[ValidatorDuty]): List of validator duties
+        validator_duties (List[DutyRecord]): List of validator duties
     """
     if ARGUMENTS.mode == Mode.LOG:
         relevant_duty_proportion = get_duties_proportion_above_time_threshold(
@@ -68,11 +78,11 @@ def __log_duty_proportion_above_time_threshold(
         )
 
 
-def __create_logging_message(duty: ValidatorDuty) -> str:
+def __create_logging_message(duty: DutyRecord) -> str:
     """Creates the logging message for the provided duty
 
     Args:
-        duty (ValidatorDuty): Specific upcoming validator duty
+        duty (DutyRecord): Specific upcoming validator duty
 
     Returns:
         str: Message which will be logged to stdout
@@ -99,11 +109,11 @@ def __create_logging_message(duty: ValidatorDuty) -> str:
     return logging_message
 
 
-def __create_sync_committee_logging_message(sync_committee_duty: ValidatorDuty) -> str:
+def __create_sync_committee_logging_message(sync_committee_duty: DutyRecord) -> str:
     """Create a sync committee duty related logging message
 
     Args:
-        sync_committee_duty (ValidatorDuty): Sync committee duty
+        sync_committee_duty (DutyRecord): Sync committee duty
 
     Returns:
         str: sync committee duty related logging message
@@ -135,13 +145,13 @@ def __create_sync_committee_logging_message(sync_committee_duty: ValidatorDuty)
 
 
 def __get_time_to_next_sync_committee(
-    sync_committee_duty: ValidatorDuty,
+    sync_committee_duty: DutyRecord,
     current_sync_committee_epoch_boundaries: Tuple[int, int],
 ) -> timedelta:
     """Get the time when next sync committee starts
 
     Args:
-        sync_committee_duty (ValidatorDuty): Sync committee duty
+        sync_committee_duty (DutyRecord): Sync committee duty
         current_sync_committee_epoch_boundaries (Tuple[int, int]): Lower and Upper epoch boundaries for current sync committee # pylint: disable=line-too-long
 
     Returns:
@@ -157,12 +167,12 @@ def __get_time_to_next_sync_committee(
     )
 
 
-def __get_logging_color(seconds_to_next_duty: float, duty: ValidatorDuty) -> str:
+def __get_logging_color(seconds_to_next_duty: float, duty: DutyRecord) -> str:
     """Gets correct logging color in dependence of duty and time to next duty
 
     Args:
-        seconds_to_next_duty (float): Time to next duty in seconds duty (ValidatorDuty): Specific upcoming validator duty # pylint: disable=line-too-long
-        duty (ValidatorDuty): Specific upcoming validator duty
+        seconds_to_next_duty (float): Time to next duty in seconds duty (DutyRecord): Specific upcoming validator duty # pylint: disable=line-too-long
+        duty (DutyRecord): Specific upcoming validator duty
 
     Returns:
         str: ANSI codes for colorful logging
@@ -176,11 +186,11 @@ def __get_logging_color(seconds_to_next_duty: float, duty: ValidatorDuty) -> str
     return rs.all
 
 
-def __get_validator_identifier_for_logging(duty: ValidatorDuty) -> str:
+def __get_validator_identifier_for_logging(duty: DutyRecord) -> str:
     """Gets the validator identifier for logging
 
     Args:
-        duty (ValidatorDuty): Validator duty
+        duty (DutyRecord): Validator duty
 
     Returns:
         str: Validator identifier
@@ -190,19 +200,21 @@ def __get_validator_identifier_for_logging(duty: ValidatorDuty) -> str:
         return alias
     if ARGUMENTS.log_pubkeys:
         return duty.pubkey
-    return duty.validator_index
+    return str(duty.validator_index)
 
 
-def __get_alias(duty: ValidatorDuty) -> str | None:
+def __get_alias(duty: DutyRecord) -> str | None:
     """Gets the validator alias
 
     Args:
-        duty (ValidatorDuty): Validator duty
+        duty (DutyRecord): Validator duty
 
     Returns:
         str | None: Validator alias
     """
-    validator_with_alias = __validator_identifiers_with_alias.get(duty.validator_index)
+    validator_with_alias = __validator_identifiers_with_alias.get(
+        str(duty.validator_index)
+    )
     if validator_with_alias and validator_with_alias.alias:
         return validator_with_alias.alias
     return None
@@ -2,31 +2,37 @@
 """
 
 from asyncio import Task, TaskGroup
+from math import inf
 from multiprocessing.shared_memory import SharedMemory
 from typing import Callable, List
 
+from cli.arguments import ARGUMENTS
 from constants.program import UPDATED_SHARED_MEMORY_NAME
-from fetcher.data_types import DutyType, ValidatorDuty
+from fetcher.cache import duty_cache
+from fetcher.data_types import DutyRecord, DutyType
 from fetcher.fetch import (
     fetch_upcoming_attestation_duties,
     fetch_upcoming_proposing_duties,
     fetch_upcoming_sync_committee_duties,
     update_validator_identifier_cache,
+    verify_cached_duties,
 )
 from protocol.ethereum import get_current_epoch, get_current_slot, set_time_to_duty
 
 
-def is_current_data_up_to_date(current_duties: List[ValidatorDuty]) -> bool:
+def is_current_data_up_to_date(current_duties: List[DutyRecord]) -> bool:
     """Checks if the current fetched validator duties are outdated.
 
     Args:
-        current_duties (List[ValidatorDuty]): Current validator duties fetched during last interval
+        current_duties (List[DutyRecord]): Current validator duties fetched during last interval
 
     Returns:
         bool: True if current data is outdated
     """
     if __has_updated_validator_identifiers():
         return False
+    if duty_cache.is_verification_due() or duty_cache.has_invalidated_duties:
+        return False
     if current_duties:
         duties_up_to_date = [
             __is_first_sync_committee_duty_up_to_date(current_duties),
@@ -37,11 +43,11 @@ def is_current_data_up_to_date(current_duties: List[ValidatorDuty]) -> bool:
     return False
 
 
-def __is_first_non_sync_committee_duty_up_to_date(duties: List[ValidatorDuty]) -> bool:
+def __is_first_non_sync_committee_duty_up_to_date(duties: List[DutyRecord]) -> bool:
     """Checks whether the data in memory of the first non sync-committee duty is up to date
 
     Args:
-        duties (List[ValidatorDuty]): Current fetched duties
+        duties (List[DutyRecord]): Current fetched duties
 
     Returns:
         bool: Data of first non sync-committee is up to date
@@ -60,12 +66,12 @@ def __is_first_non_sync_committee_duty_up_to_date(duties: List[ValidatorDuty]) -
 
 
 def __is_first_sync_committee_duty_up_to_date(
-    duties: List[ValidatorDuty],
+    duties: List[DutyRecord],
 ) -> bool:
     """Checks whether the data in memory of the first sync-committee duty is up to date
 
     Args:
-        duties (List[ValidatorDuty]): Current fetched duties
+        duties (List[DutyRecord]): Current fetched duties
 
     Returns:
         bool: Data of first sync-committee is up to date
@@ -96,24 +102,27 @@ def __has_updated_validator_identifiers() -> bool:
     return False
 
 
-def update_time_to_duty(duties: List[ValidatorDuty]) -> None:
+def update_time_to_duty(duties: List[DutyRecord]) -> None:
     """Updates the time to duty field via call by reference
 
     Args:
-        duties (List[ValidatorDuty]): Upcoming validator duties
+        duties (List[DutyRecord]): Upcoming validator duties
     """
     for duty in duties:
         set_time_to_duty(duty)
 
 
-async def fetch_upcoming_validator_duties() -> List[ValidatorDuty]:
-    """Fetch upcoming validator duties
+async def fetch_upcoming_validator_duties() -> List[DutyRecord]:
+    """Fetch upcoming validator duties. Duties are served from the duty cache as long as
+    their epoch did not pass and their dependent block was not reorged.
 
     Returns:
-        List[ValidatorDuty]: Sorted list with all upcoming validator duties
+        List[DutyRecord]: Sorted list with all upcoming validator duties
     """
+    await verify_cached_duties()
+    duty_cache.has_invalidated_duties = False
     async with TaskGroup() as taskgroup:
-        tasks: List[Task[dict[str, ValidatorDuty]]] = []
+        tasks: List[Task[dict[int, DutyRecord]]] = []
         tasks.append(taskgroup.create_task(fetch_upcoming_attestation_duties()))
         tasks.append(taskgroup.create_task(fetch_upcoming_sync_committee_duties()))
         tasks.append(taskgroup.create_task(fetch_upcoming_proposing_duties()))
@@ -123,12 +132,12 @@ async def fetch_upcoming_validator_duties() -> List[ValidatorDuty]:
 
 
 def get_duties_proportion_above_time_threshold(
-    duties: List[ValidatorDuty], time_threshold: int
+    duties: List[DutyRecord], time_threshold: int
 ) -> float:
     """Get duties proportion above user defined time threshold
 
     Args:
-        duties (List[ValidatorDuty]): List of fetched duties
+        duties (List[DutyRecord]): List of fetched duties
         time_threshold (int): Time threshold defined by the user
 
     Returns:
@@ -141,4 +150,31 @@ def get_duties_proportion_above_time_threshold(
     return relevant_duty_proportion
 
 
-__sort_duties: Callable[[ValidatorDuty], int] = lambda duty: duty.slot
+def get_adaptive_interval(duties: List[DutyRecord]) -> float:
+    """Get the interval until the next duties update. While no duty is due within the time
+    to duty warning threshold the interval grows up to the max. interval, so that the next
+    duty is logged again when it crosses the threshold.
+
+    Args:
+        duties (List[DutyRecord]): Upcoming validator duties with updated time to duty
+
+    Returns:
+        float: Interval in seconds
+    """
+    if not ARGUMENTS.max_interval:
+        return ARGUMENTS.interval
+    seconds_to_next_duty = min(
+        (
+            duty.seconds_to_duty
+            for duty in duties
+            if duty.type != DutyType.SYNC_COMMITTEE
+        ),
+        default=inf,
+    )
+    return min(
+        max(seconds_to_next_duty - ARGUMENTS.log_time_warning, ARGUMENTS.interval),
+        ARGUMENTS.max_interval,
+    )
+
+
+__sort_duties: Callable[[DutyRecord], int] = lambda duty: duty.slot
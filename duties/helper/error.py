@@ -24,3 +24,31 @@ class NoDataFromEndpointError(Exception):
     ) -> None:
         self.message = message
         super().__init__(self.message)
+
+
+class PayloadTooLargeError(Exception):
+    """Exception raised if a node rejects a request because of its size (413 or 414)
+
+    Args:
+        message (str): Error message
+    """
+
+    def __init__(
+        self, message: str = "Request payload or url too large for api endpoint"
+    ) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class SszNotSupportedError(Exception):
+    """Exception raised if a beacon node rejects a SSZ request or returns undecodable SSZ
+
+    Args:
+        message (str): Error message
+    """
+
+    def __init__(
+        self, message: str = "SSZ encoding is not supported by api endpoint"
+    ) -> None:
+        self.message = message
+        super().__init__(self.message)
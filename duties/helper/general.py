@@ -28,6 +28,18 @@ def get_correct_request_header(
     return REQUEST_HEADER
 
 
+def get_endpoint_without_epoch(endpoint: str) -> str:
+    """Remove a trailing epoch from the endpoint to group requests to the same resource
+
+    Args:
+        endpoint (str): Called endpoint
+
+    Returns:
+        str: Endpoint without epoch
+    """
+    return endpoint.rstrip("0123456789")
+
+
 def format_timedelta_to_hours(time_delta: timedelta) -> str:
     """Format a timedelta to HH:MM:SS
 
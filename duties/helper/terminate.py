@@ -10,7 +10,7 @@ from typing import List
 from cli.arguments import ARGUMENTS
 from cli.types import Mode
 from constants import logging
-from fetcher.data_types import DutyType, ValidatorDuty
+from fetcher.data_types import DutyRecord, DutyType
 from helper.duty import get_duties_proportion_above_time_threshold
 from helper.identifier import clean_shared_memory
 
@@ -38,12 +38,12 @@ class GracefulTerminator:
             task.cancel()
         await gather(*tasks, return_exceptions=True)
 
-    def terminate_in_cicd_mode(self, duties: List[ValidatorDuty]) -> None:
+    def terminate_in_cicd_mode(self, duties: List[DutyRecord]) -> None:
         """Terminates the running application in dependence of the mode and
         the duties which could be found for the provided validators
 
         Args:
-            duties (List[ValidatorDuty]): List of fetched validator duties
+            duties (List[DutyRecord]): List of fetched validator duties
         """
         running_mode: Mode = ARGUMENTS.mode
         match running_mode:
@@ -73,11 +73,11 @@ class GracefulTerminator:
                 pass
         self.__cicd_cycle_counter += 1
 
-    def __no_relevant_upcoming_duties(self, duties: List[ValidatorDuty]) -> bool:
+    def __no_relevant_upcoming_duties(self, duties: List[DutyRecord]) -> bool:
         """Checks whether there are non relevant upcoming duties for the provided validators
 
         Args:
-            duties (List[ValidatorDuty]): List of fetched validator duties
+            duties (List[DutyRecord]): List of fetched validator duties
 
         Returns:
             bool: Whether or not there are any relevant upcoming duties
@@ -94,13 +94,13 @@ class GracefulTerminator:
         )
 
     def __is_proportion_of_attestation_duties_above_time_threshold(
-        self, attestation_duties: List[ValidatorDuty]
+        self, attestation_duties: List[DutyRecord]
     ) -> bool:
         """Checks whether upcoming attestation duties will occur after a user definded
         time threshold and thus be defined as non-relevant duties
 
         Args:
-            attestation_duties (List[ValidatorDuty]): List of fetched attestation duties
+            attestation_duties (List[DutyRecord]): List of fetched attestation duties
 
         Returns:
             bool: Whether or not there are any relevant upcoming attestation duties
@@ -8,19 +8,25 @@ from typing import List
 
 from cli.arguments import ARGUMENTS
 from cli.types import Mode
-from constants import logging
-from fetcher.data_types import ValidatorDuty
+from constants import logging, program
+from fetcher.cache import duty_cache
+from fetcher.data_types import DutyRecord, DutyType
+from fetcher.events import beacon_event_subscriber
+from fetcher.fetch import prefetch_next_epoch_duties_on_interval
 from fetcher.identifier.parser import (
     update_shared_active_validator_identifiers_on_interval,
 )
 from fetcher.log import log_time_to_next_duties
 from helper.duty import (
     fetch_upcoming_validator_duties,
+    get_adaptive_interval,
     is_current_data_up_to_date,
     update_time_to_duty,
 )
 from helper.identifier import clean_shared_memory
 from helper.terminate import GracefulTerminator
+from protocol.client import connection_pool
+from protocol.ethereum import slot_clock
 from protocol.request import beacon_node, validator_node
 from rest.app import create_rest_server
 from rest.core.server import RestServer
@@ -29,15 +35,15 @@ __LOGGER = getLogger()
 
 
 async def __fetch_validator_duties(
-    duties: List[ValidatorDuty],
-) -> List[ValidatorDuty]:
+    duties: List[DutyRecord],
+) -> List[DutyRecord]:
     """Fetches upcoming validator duties
 
     Args:
-        duties (List[ValidatorDuty]): List of validator duties for last logging interval
+        duties (List[DutyRecord]): List of validator duties for last logging interval
 
     Returns:
-        List[ValidatorDuty]: Sorted list with all upcoming validator duties
+        List[DutyRecord]: Sorted list with all upcoming validator duties
     """
     if is_current_data_up_to_date(duties):
         __check_beacon_node_connection()
@@ -57,11 +63,18 @@ def __check_beacon_node_connection() -> None:
 
 
 async def __main() -> None:
-    async with TaskGroup() as taskgroup:
-        taskgroup.create_task(__main_process())
-        taskgroup.create_task(update_shared_active_validator_identifiers_on_interval())
-        taskgroup.create_task(validator_node.update_validator_node_health())
-        taskgroup.create_task(beacon_node.update_beacon_node_health())
+    try:
+        async with TaskGroup() as taskgroup:
+            taskgroup.create_task(__main_process())
+            taskgroup.create_task(
+                update_shared_active_validator_identifiers_on_interval()
+            )
+            taskgroup.create_task(validator_node.update_validator_node_health())
+            taskgroup.create_task(beacon_node.update_beacon_node_health())
+            taskgroup.create_task(prefetch_next_epoch_duties_on_interval())
+            taskgroup.create_task(beacon_event_subscriber.subscribe())
+    finally:
+        await connection_pool.close_clients()
 
 
 async def __main_process() -> None:
@@ -71,18 +84,43 @@ async def __main_process() -> None:
     )
     if system() != "Windows":
         await graceful_terminator.create_signal_handlers()
-    upcoming_duties: List[ValidatorDuty] = []
+    upcoming_duties: List[DutyRecord] = []
     while True:
         if ARGUMENTS.mode != Mode.NO_LOG:
             upcoming_duties = await __fetch_validator_duties(upcoming_duties)
             update_time_to_duty(upcoming_duties)
             log_time_to_next_duties(upcoming_duties)
             graceful_terminator.terminate_in_cicd_mode(upcoming_duties)
-            await sleep(ARGUMENTS.interval)
+            await __wait_for_next_interval(upcoming_duties)
         else:
             await sleep(ARGUMENTS.interval)
 
 
+async def __wait_for_next_interval(duties: List[DutyRecord]) -> None:
+    """Waits for the next interval. In log mode the interval grows up to '--max-interval'
+    while no duty is due within '--log-time-warning' and ends earlier at the start of the
+    next epoch, at the slot of the next duty, when the dependent roots of cached duties
+    need to be verified or when a beacon node event invalidated cached duties. The cicd
+    modes count intervals to determine the waiting time and therefore always wait the
+    full interval.
+
+    Args:
+        duties (List[DutyRecord]): Upcoming validator duties
+    """
+    if ARGUMENTS.mode == Mode.LOG:
+        await slot_clock.wait(
+            get_adaptive_interval(duties),
+            [
+                *duty_cache.get_verification_slots(),
+                *[duty.slot for duty in duties if duty.type != DutyType.SYNC_COMMITTEE],
+            ],
+            program.SLOT_CLOCK_WAKE_UP_OFFSET,
+            beacon_event_subscriber.changed_duties,
+        )
+    else:
+        await sleep(ARGUMENTS.interval)
+
+
 def __start_processes(rest_server: RestServer, logger: Logger) -> None:
     """Starts the relevant processes
 
@@ -0,0 +1,124 @@
+"""Module for adaptive validator chunk sizes
+"""
+
+from logging import getLogger
+from typing import Dict, List, Tuple
+
+from constants import logging, program
+from helper.general import get_endpoint_without_epoch
+
+
+class ChunkSizeController:
+    """Tunes the number of validators per request for every endpoint and node. Sizes grow
+    while requests are fast and responses small and shrink on slow requests, timeouts
+    and 413/414 responses. Tuned sizes are kept for the rest of the process.
+    """
+
+    def __init__(self) -> None:
+        self.__chunk_sizes: Dict[Tuple[str, str], int] = {}
+        self.__logger = getLogger()
+
+    def get_chunk_size(
+        self, endpoint: str, node_urls: List[str], max_chunk_size: int
+    ) -> int:
+        """Get the number of validators per request which fits all provided nodes
+
+        Args:
+            endpoint (str): Endpoint which will be called
+            node_urls (List[str]): Urls of the nodes which will receive the chunks
+            max_chunk_size (int): Upper bound of validators per request for the endpoint
+
+        Returns:
+            int: Number of validators per request
+        """
+        return min(
+            [
+                min(self.__get_tuned_chunk_size(endpoint, node_url), max_chunk_size)
+                for node_url in node_urls
+            ],
+            default=program.NUMBER_OF_VALIDATORS_PER_REST_CALL,
+        )
+
+    def record_success(
+        self,
+        endpoint: str,
+        node_url: str,
+        chunk_size: int,
+        max_chunk_size: int,
+        latency: float,
+        response_size: int,
+    ) -> None:
+        """Adapt the chunk size after a successful request. Small remainder chunks are not
+        representative and therefore ignored.
+
+        Args:
+            endpoint (str): Called endpoint
+            node_url (str): Url of the called node
+            chunk_size (int): Number of validators sent with the request
+            max_chunk_size (int): Upper bound of validators per request for the endpoint
+            latency (float): Response latency in seconds
+            response_size (int): Size of the response body in bytes
+        """
+        tuned_chunk_size = self.__get_tuned_chunk_size(endpoint, node_url)
+        if chunk_size * 2 < tuned_chunk_size:
+            return
+        if (
+            latency > program.CHUNK_SHRINK_LATENCY_THRESHOLD
+            or response_size > program.MAX_RESPONSE_SIZE_PER_REST_CALL
+        ):
+            self.__set_chunk_size(endpoint, node_url, chunk_size // 2)
+        elif (
+            chunk_size >= tuned_chunk_size
+            and latency < program.CHUNK_GROWTH_LATENCY_THRESHOLD
+            and response_size * 2 <= program.MAX_RESPONSE_SIZE_PER_REST_CALL
+        ):
+            self.__set_chunk_size(
+                endpoint, node_url, min(tuned_chunk_size * 2, max_chunk_size)
+            )
+
+    def record_failure(self, endpoint: str, node_url: str, chunk_size: int) -> None:
+        """Shrink the chunk size after a timeout or a 413/414 response
+
+        Args:
+            endpoint (str): Called endpoint
+            node_url (str): Url of the called node
+            chunk_size (int): Number of validators sent with the request
+        """
+        tuned_chunk_size = self.__get_tuned_chunk_size(endpoint, node_url)
+        self.__set_chunk_size(
+            endpoint, node_url, min(tuned_chunk_size, chunk_size // 2)
+        )
+
+    def __get_tuned_chunk_size(self, endpoint: str, node_url: str) -> int:
+        """Get the currently tuned chunk size
+
+        Args:
+            endpoint (str): Called endpoint
+            node_url (str): Url of the called node
+
+        Returns:
+            int: Tuned chunk size
+        """
+        return self.__chunk_sizes.get(
+            (get_endpoint_without_epoch(endpoint), node_url),
+            program.NUMBER_OF_VALIDATORS_PER_REST_CALL,
+        )
+
+    def __set_chunk_size(self, endpoint: str, node_url: str, chunk_size: int) -> None:
+        """Store a new chunk size within the allowed bounds
+
+        Args:
+            endpoint (str): Called endpoint
+            node_url (str): Url of the called node
+            chunk_size (int): New chunk size
+        """
+        endpoint_key = get_endpoint_without_epoch(endpoint)
+        chunk_size = max(chunk_size, program.MIN_NUMBER_OF_VALIDATORS_PER_REST_CALL)
+        if self.__get_tuned_chunk_size(endpoint, node_url) != chunk_size:
+            self.__logger.debug(
+                logging.ADJUSTED_CHUNK_SIZE_MESSAGE, endpoint_key, node_url, chunk_size
+            )
+        self.__chunk_sizes[(endpoint_key, node_url)] = chunk_size
+
+
+chunk_size_controller = ChunkSizeController()
@@ -0,0 +1,85 @@
+"""Module for pooled asynchronous http clients
+"""
+
+from asyncio import AbstractEventLoop, get_running_loop
+from typing import Dict, Tuple
+
+from cli.arguments import ARGUMENTS
+from constants import program
+from httpx import AsyncClient, Limits, Timeout
+from protocol.compression import compression_manager
+
+
+class ConnectionPool:
+    """Manages one pooled keep-alive http client per node url which is shared by
+    duty fetchers, keymanager calls and health checks"""
+
+    def __init__(self) -> None:
+        self.__clients: Dict[str, Tuple[AbstractEventLoop, AsyncClient]] = {}
+
+    def get_client(self, node_url: str) -> AsyncClient:
+        """Get the pooled client for the provided node url. Connections are bound to the
+        event loop they were opened in, therefore a new client is created for every new loop.
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            AsyncClient: Pooled asynchronous http client
+        """
+        running_loop = get_running_loop()
+        loop_and_client = self.__clients.get(node_url)
+        if loop_and_client and loop_and_client[0] is running_loop:
+            return loop_and_client[1]
+        client = self.__create_client(node_url)
+        self.__clients[node_url] = (running_loop, client)
+        return client
+
+    async def close_clients(self) -> None:
+        """Close the clients which were created in the running event loop. Needs to be
+        awaited before the loop exits since the connections can not be closed afterwards.
+        """
+        running_loop = get_running_loop()
+        for node_url, (loop, client) in list(self.__clients.items()):
+            if loop is running_loop:
+                del self.__clients[node_url]
+                await client.aclose()
+
+    def __create_client(self, node_url: str) -> AsyncClient:
+        """Create a new client with the user defined pool settings. Requests which are
+        decoded by httpx itself only advertise the encodings httpx supports.
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            AsyncClient: Asynchronous http client
+        """
+        return AsyncClient(
+            timeout=Timeout(
+                program.REQUEST_TIMEOUT[1], connect=program.REQUEST_TIMEOUT[0]
+            ),
+            limits=Limits(
+                max_connections=ARGUMENTS.connection_pool_size,
+                max_keepalive_connections=ARGUMENTS.connection_pool_size,
+                keepalive_expiry=ARGUMENTS.connection_keep_alive,
+            ),
+            http2=ARGUMENTS.http2,
+            headers={"Accept-Encoding": self.__get_accept_encoding(node_url)},
+        )
+
+    def __get_accept_encoding(self, node_url: str) -> str:
+        """Get the default Accept-Encoding header of the client for the provided node
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            str: Compressed encodings if compression is not disabled for the node
+        """
+        if compression_manager.is_compression_enabled(node_url):
+            return program.COMPRESSED_ACCEPT_ENCODING
+        return program.IDENTITY_ACCEPT_ENCODING
+
+
+connection_pool = ConnectionPool()
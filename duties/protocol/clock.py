@@ -0,0 +1,117 @@
+"""Module for tracking beacon chain slots and waking up at slot and epoch boundaries
+"""
+
+from asyncio import Event, sleep, wait_for
+from math import floor
+from time import time
+from typing import List
+
+
+class SlotClock:
+    """Tracks the current slot and epoch. The start and end time of the current slot are
+    precomputed, so reading the current slot or epoch only compares the time with the slot
+    boundaries until the next slot starts. Coroutines can wait for the start of a slot or
+    epoch (optionally with an offset into the slot).
+    """
+
+    def __init__(self, genesis_time: int, slot_time: int, slots_per_epoch: int) -> None:
+        self.__genesis_time = genesis_time
+        self.__slot_time = slot_time
+        self.__slots_per_epoch = slots_per_epoch
+        self.__current_slot = 0
+        self.__current_slot_start_time = 0.0
+        self.__current_slot_end_time = 0.0
+
+    def get_current_slot(self) -> int:
+        """Get the current beacon chain slot
+
+        Returns:
+            int: The current beacon chain slot
+        """
+        now = time()
+        if not self.__current_slot_start_time <= now < self.__current_slot_end_time:
+            self.__current_slot = floor((now - self.__genesis_time) / self.__slot_time)
+            self.__current_slot_start_time = self.get_slot_start_time(
+                self.__current_slot
+            )
+            self.__current_slot_end_time = (
+                self.__current_slot_start_time + self.__slot_time
+            )
+        return self.__current_slot
+
+    def get_current_epoch(self) -> int:
+        """Get the current beacon chain epoch
+
+        Returns:
+            int: The current beacon chain epoch
+        """
+        return self.get_current_slot() // self.__slots_per_epoch
+
+    def get_slot_start_time(self, slot: int) -> float:
+        """Get the start time of the provided slot
+
+        Args:
+            slot (int): Beacon chain slot
+
+        Returns:
+            float: Start time of the slot as unix timestamp in seconds
+        """
+        return float(self.__genesis_time + slot * self.__slot_time)
+
+    def get_seconds_to_slot(self, slot: int) -> float:
+        """Get the time until the provided slot starts
+
+        Args:
+            slot (int): Beacon chain slot
+
+        Returns:
+            float: Time in seconds until the slot starts, negative if the slot already started # pylint: disable=line-too-long
+        """
+        return self.get_slot_start_time(slot) - time()
+
+    async def wait_until_slot(self, slot: int, offset: float = 0.0) -> None:
+        """Wait until the provided slot started
+
+        Args:
+            slot (int): Beacon chain slot
+            offset (float): Time in seconds into the slot at which the wait ends
+        """
+        await sleep(max(self.get_seconds_to_slot(slot) + offset, 0.0))
+
+    async def wait(
+        self,
+        timeout: float,
+        wake_up_slots: List[int],
+        offset: float = 0.0,
+        wake_up_event: Event | None = None,
+    ) -> None:
+        """Wait for the provided time. The wait ends earlier when the next epoch or one of
+        the provided slots starts or when the provided event is set. Slots which already
+        started are ignored.
+
+        Args:
+            timeout (float): Max. waiting time in seconds
+            wake_up_slots (List[int]): Slots at whose start the wait ends
+            offset (float): Time in seconds into the slot at which the wait ends
+            wake_up_event (Event | None): Event which ends the wait, cleared afterwards
+        """
+        next_epoch_starting_slot = (
+            self.get_current_epoch() + 1
+        ) * self.__slots_per_epoch
+        waiting_times = [
+            self.get_seconds_to_slot(slot) + offset
+            for slot in [next_epoch_starting_slot, *wake_up_slots]
+        ]
+        waiting_time = min(
+            waiting_time
+            for waiting_time in [timeout, *waiting_times]
+            if waiting_time > 0
+        )
+        if wake_up_event is None:
+            await sleep(waiting_time)
+            return
+        try:
+            await wait_for(wake_up_event.wait(), waiting_time)
+        except TimeoutError:
+            pass
+        wake_up_event.clear()
@@ -0,0 +1,235 @@
+"""Module for compressed transfer of api responses
+"""
+
+from dataclasses import dataclass
+from logging import getLogger
+from time import perf_counter
+from typing import Any, AsyncIterator, Dict
+from zlib import MAX_WBITS, decompressobj
+from zlib import error as ZlibError
+
+from cli.arguments import ARGUMENTS
+from constants import logging, program
+from helper.general import get_endpoint_without_epoch
+from httpx import DecodingError, Response
+
+try:
+    from zstandard import ZstdDecompressor, ZstdError
+except ImportError:
+    ZstdDecompressor = None  # pylint: disable=invalid-name
+    ZstdError = ZlibError  # pylint: disable=invalid-name
+
+
+@dataclass
+class CompressionStatistics:
+    """Accumulated transfer and decode statistics of compressed responses of an endpoint"""
+
+    responses: int = 0
+    compressed_bytes: int = 0
+    decoded_bytes: int = 0
+    decode_time: float = 0.0
+
+    def record(
+        self, compressed_bytes: int, decoded_bytes: int, decode_time: float
+    ) -> None:
+        """Add a decoded response to the statistics
+
+        Args:
+            compressed_bytes (int): Size of the response body on the wire
+            decoded_bytes (int): Size of the decoded response body
+            decode_time (float): Time in seconds spent for decompression
+        """
+        self.responses += 1
+        self.compressed_bytes += compressed_bytes
+        self.decoded_bytes += decoded_bytes
+        self.decode_time += decode_time
+
+    def get_ratio(self) -> float:
+        """Get the compression ratio over all recorded responses
+
+        Returns:
+            float: Decoded bytes per transferred byte
+        """
+        return self.decoded_bytes / max(self.compressed_bytes, 1)
+
+    def get_average_decode_time(self) -> float:
+        """Get the average decompression time of a response
+
+        Returns:
+            float: Average decode time in seconds
+        """
+        return self.decode_time / max(self.responses, 1)
+
+
+class CompressionManager:
+    """Negotiates compressed responses per node and decodes them while recording the
+    compression ratio and decode time per endpoint. zstd is only advertised if the optional
+    zstandard package is installed."""
+
+    def __init__(self) -> None:
+        self.__statistics: Dict[str, CompressionStatistics] = {}
+        self.__logger = getLogger()
+
+    def is_compression_enabled(self, node_url: str) -> bool:
+        """Check whether compressed responses should be requested from the provided node
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            bool: True if compression is not disabled globally or for the node
+        """
+        return (
+            not ARGUMENTS.no_compression
+            and node_url not in ARGUMENTS.no_compression_nodes
+        )
+
+    def get_accept_encoding(self, node_url: str) -> str:
+        """Get the content encodings which are advertised to the provided node
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            str: Value of the Accept-Encoding header
+        """
+        if not self.is_compression_enabled(node_url):
+            return program.IDENTITY_ACCEPT_ENCODING
+        if ZstdDecompressor is None:
+            return program.COMPRESSED_ACCEPT_ENCODING
+        return program.ZSTD_ACCEPT_ENCODING
+
+    def get_statistics(self, endpoint: str) -> CompressionStatistics:
+        """Get the compression statistics of the provided endpoint
+
+        Args:
+            endpoint (str): Called endpoint
+
+        Returns:
+            CompressionStatistics: Statistics of compressed responses of the endpoint
+        """
+        return self.__statistics.setdefault(
+            get_endpoint_without_epoch(endpoint), CompressionStatistics()
+        )
+
+    async def iter_decoded_bytes(
+        self, response: Response, endpoint: str
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the decoded body of a streamed response. The response needs to be
+        sent with stream=True since the raw body is decoded here instead of by httpx.
+
+        Args:
+            response (Response): Streamed response object from the api call
+            endpoint (str): Called endpoint
+
+        Raises:
+            DecodingError: Raised if the content encoding is unsupported or the body is corrupt # pylint: disable=line-too-long
+
+        Yields:
+            bytes: Decoded parts of the response body
+        """
+        content_encoding = response.headers.get("content-encoding", "").strip().lower()
+        decoder = self.__create_decoder(content_encoding, response)
+        if decoder is None:
+            async for chunk in response.aiter_raw():
+                yield chunk
+            return
+        decoded_bytes = 0
+        decode_time = 0.0
+        try:
+            async for chunk in response.aiter_raw():
+                start_time = perf_counter()
+                decoded_chunk = decoder.decompress(chunk)
+                decode_time += perf_counter() - start_time
+                decoded_bytes += len(decoded_chunk)
+                if decoded_chunk:
+                    yield decoded_chunk
+            start_time = perf_counter()
+            decoded_chunk = decoder.flush()
+            decode_time += perf_counter() - start_time
+        except (ZlibError, ZstdError) as error:
+            raise DecodingError(str(error), request=response.request) from error
+        decoded_bytes += len(decoded_chunk)
+        if decoded_chunk:
+            yield decoded_chunk
+        self.__record(
+            endpoint,
+            content_encoding,
+            response.num_bytes_downloaded,
+            decoded_bytes,
+            decode_time,
+        )
+
+    async def read_decoded_bytes(self, response: Response, endpoint: str) -> bytes:
+        """Read the complete decoded body of a streamed response
+
+        Args:
+            response (Response): Streamed response object from the api call
+            endpoint (str): Called endpoint
+
+        Returns:
+            bytes: Decoded response body
+        """
+        return b"".join(
+            [chunk async for chunk in self.iter_decoded_bytes(response, endpoint)]
+        )
+
+    def __create_decoder(self, content_encoding: str, response: Response) -> Any:
+        """Create an incremental decoder for the provided content encoding
+
+        Args:
+            content_encoding (str): Value of the Content-Encoding header
+            response (Response): Response object from the api call
+
+        Raises:
+            DecodingError: Raised if the content encoding is not supported
+
+        Returns:
+            Any: Decoder with decompress and flush or None if the body is not encoded
+        """
+        match content_encoding:
+            case "" | "identity":
+                return None
+            case "gzip":
+                return decompressobj(MAX_WBITS | 16)
+            case "deflate":
+                return decompressobj()
+            case "zstd" if ZstdDecompressor is not None:
+                return ZstdDecompressor().decompressobj()
+        raise DecodingError(
+            logging.UNSUPPORTED_CONTENT_ENCODING_ERROR_MESSAGE.format(content_encoding),
+            request=response.request,
+        )
+
+    def __record(
+        self,
+        endpoint: str,
+        content_encoding: str,
+        compressed_bytes: int,
+        decoded_bytes: int,
+        decode_time: float,
+    ) -> None:
+        """Record and log the statistics of a decoded response
+
+        Args:
+            endpoint (str): Called endpoint
+            content_encoding (str): Content encoding of the response
+            compressed_bytes (int): Size of the response body on the wire
+            decoded_bytes (int): Size of the decoded response body
+            decode_time (float): Time in seconds spent for decompression
+        """
+        statistics = self.get_statistics(endpoint)
+        statistics.record(compressed_bytes, decoded_bytes, decode_time)
+        self.__logger.debug(
+            logging.COMPRESSED_RESPONSE_MESSAGE,
+            content_encoding,
+            get_endpoint_without_epoch(endpoint),
+            compressed_bytes,
+            decoded_bytes,
+            decode_time * 1000,
+            statistics.get_ratio(),
+            statistics.get_average_decode_time() * 1000,
+        )
+
+
+compression_manager = CompressionManager()
@@ -1,17 +1,20 @@
 """Module for protocol connection healthiness"""
 
 from abc import ABC, abstractmethod
-from asyncio import sleep
+from asyncio import create_task, gather, sleep, wait
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
-from typing import List, Optional
+from time import perf_counter
+from typing import Dict, List, Optional
 
 from cli.arguments import ARGUMENTS
-from cli.types import NodeConnectionProperties
+from cli.types import NodeConnectionProperties, NodeSelectionStrategy
 from constants import endpoints, json, logging, program
 from helper.general import get_correct_request_header
-from requests import ConnectionError as RequestsConnectionError
-from requests import ReadTimeout, Response, get
+from httpx import TransportError
+from protocol.client import connection_pool
+from protocol.response import decode_response
+from protocol.statistics import NodeStatistics
 
 
 class NodeManager(ABC):
@@ -20,6 +23,8 @@ class NodeManager(ABC):
     def __init__(self) -> None:
         self.healthy_nodes: List[NodeConnectionProperties] = []
         self._provided_nodes: List[NodeConnectionProperties] = []
+        self._statistics: Dict[str, NodeStatistics] = {}
+        self.__heartbeats: Dict[str, float] = {}
         self._logger = getLogger()
         self._set_provided_nodes()
 
@@ -27,39 +32,129 @@ class NodeManager(ABC):
         """Set provided nodes from arguments"""
         nodes = self._get_node_argument()
         if nodes:
-            self._provided_nodes = list(set(nodes))
+            self._provided_nodes = list(dict.fromkeys(nodes))
 
     async def update_node_health(self) -> None:
         """Update node healthiness in interval"""
         while True:
-            self.update_node_health_once()
+            await self.update_node_health_once()
             await sleep(self._get_health_check_interval())
 
-    def update_node_health_once(self) -> None:
-        """Update node healthiness based on REST responses"""
+    async def update_node_health_once(self) -> None:
+        """Update node healthiness based on REST responses. All nodes are probed concurrently
+        and the healthy nodes are replaced at once after the round finished."""
         if self._provided_nodes:
-            for node in self._provided_nodes:
-                if self._check_node_health(node):
-                    self._update_healthy_nodes("append", node)
-                else:
-                    self._update_healthy_nodes("remove", node)
+            node_healthiness = await self.__probe_provided_nodes()
+            self.healthy_nodes = [
+                node
+                for node, is_healthy in zip(self._provided_nodes, node_healthiness)
+                if is_healthy
+            ]
             self._log_health_of_nodes()
 
-    def _update_healthy_nodes(
-        self, action: str, node: NodeConnectionProperties
+    async def __probe_provided_nodes(self) -> List[bool]:
+        """Probe all provided nodes concurrently within a deadline. Nodes which did not answer
+        within the deadline are considered unhealthy. Nodes with a recent event stream
+        heartbeat are considered healthy without being probed.
+
+        Returns:
+            List[bool]: Healthiness of the provided nodes in the order of the provided nodes
+        """
+        tasks = {
+            node: create_task(self.__check_node_health_with_statistics(node))
+            for node in self._provided_nodes
+            if not self.__has_recent_heartbeat(node)
+        }
+        pending_tasks = set()
+        if tasks:
+            _, pending_tasks = await wait(
+                tasks.values(), timeout=program.NODE_HEALTH_CHECK_ROUND_DEADLINE
+            )
+        for task in pending_tasks:
+            task.cancel()
+        await gather(*pending_tasks, return_exceptions=True)
+        return [
+            node not in tasks
+            or (
+                tasks[node] not in pending_tasks
+                and tasks[node].exception() is None
+                and tasks[node].result()
+            )
+            for node in self._provided_nodes
+        ]
+
+    def record_heartbeat(self, node: NodeConnectionProperties) -> None:
+        """Record that the provided node is alive, e.g. since it streamed an event
+
+        Args:
+            node (NodeConnectionProperties): Node connection properties
+        """
+        self.__heartbeats[node.url] = perf_counter()
+
+    def __has_recent_heartbeat(self, node: NodeConnectionProperties) -> bool:
+        """Check whether the provided node recently proved to be alive
+
+        Args:
+            node (NodeConnectionProperties): Node connection properties
+
+        Returns:
+            bool: True if the last heartbeat of the node is still valid
+        """
+        last_heartbeat = self.__heartbeats.get(node.url)
+        return (
+            last_heartbeat is not None
+            and perf_counter() - last_heartbeat
+            < program.SECONDS_UNTIL_EVENT_STREAM_HEARTBEAT_EXPIRES
+        )
+
+    async def __check_node_health_with_statistics(
+        self, node: NodeConnectionProperties
+    ) -> bool:
+        """Check node health and record the probe latency. Cancelled probes count as error.
+
+        Args:
+            node (NodeConnectionProperties): Node connection properties
+
+        Returns:
+            bool: Whether or not the node is healthy
+        """
+        start_time = perf_counter()
+        is_healthy = False
+        try:
+            is_healthy = await self._check_node_health(node)
+            return is_healthy
+        finally:
+            self.record_response(
+                node, perf_counter() - start_time, not is_healthy, True
+            )
+
+    def record_response(
+        self,
+        node: NodeConnectionProperties,
+        latency: float,
+        is_error: bool,
+        is_health_check: bool = False,
     ) -> None:
-        """Add or remove node to/from healthy nodes list
+        """Record latency and outcome of a request to the provided node
 
         Args:
-            action (str): Which action should be performed
             node (NodeConnectionProperties): Node connection properties
+            latency (float): Response latency in seconds
+            is_error (bool): Whether or not the request failed
+            is_health_check (bool): Whether or not the request was a health check
         """
-        if action == "append":
-            if node not in self.healthy_nodes:
-                self.healthy_nodes.append(node)
-        elif action == "remove":
-            if node in self.healthy_nodes:
-                self.healthy_nodes.remove(node)
+        self.get_statistics(node).record(latency, is_error, is_health_check)
+
+    def get_statistics(self, node: NodeConnectionProperties) -> NodeStatistics:
+        """Get the response statistics of the provided node
+
+        Args:
+            node (NodeConnectionProperties): Node connection properties
+
+        Returns:
+            NodeStatistics: Response statistics of the node
+        """
+        return self._statistics.setdefault(node.url, NodeStatistics())
 
     @abstractmethod
     def _get_node_argument(self) -> List[NodeConnectionProperties]:
@@ -70,7 +165,7 @@ class NodeManager(ABC):
         """Get health check interval in seconds"""
 
     @abstractmethod
-    def _check_node_health(self, node: NodeConnectionProperties) -> bool:
+    async def _check_node_health(self, node: NodeConnectionProperties) -> bool:
         """Check if a specific node is healthy"""
 
     @abstractmethod
@@ -90,6 +185,7 @@ class BeaconNode(NodeManager):
             minutes=10
         )
         self.__last_used_beacon_node = "None"
+        self.__round_robin_counter = 0
         super().__init__()
 
     def _get_node_argument(self) -> List[NodeConnectionProperties]:
@@ -100,15 +196,14 @@ class BeaconNode(NodeManager):
         """Get beacon node health check interval"""
         return program.SECONDS_UNTIL_BEACON_NODE_HEALTH_UPDATE
 
-    def _check_node_health(self, node: NodeConnectionProperties) -> bool:
+    async def _check_node_health(self, node: NodeConnectionProperties) -> bool:
         """Check if beacon node is healthy"""
         try:
-            response: Response = get(
+            response = await connection_pool.get_client(node.url).get(
                 url=f"{node.url}{endpoints.NODE_HEALTH_ENDPOINT}",
-                timeout=program.REQUEST_TIMEOUT,
             )
             return response.status_code == 200
-        except (RequestsConnectionError, ReadTimeout):
+        except TransportError:
             return False
 
     def _log_health_of_nodes(self) -> None:
@@ -145,9 +240,9 @@ class BeaconNode(NodeManager):
         """Update beacon node healthiness in interval"""
         await self.update_node_health()
 
-    def update_beacon_node_health_once(self) -> None:
+    async def update_beacon_node_health_once(self) -> None:
         """Update beacon node healthiness based on REST responses"""
-        self.update_node_health_once()
+        await self.update_node_health_once()
 
     def get_healthy_beacon_node(self) -> Optional[NodeConnectionProperties]:
         """Get a healthy beacon node from the available nodes
@@ -157,11 +252,72 @@ class BeaconNode(NodeManager):
         """
         current_time = datetime.now(timezone.utc)
         if self.healthy_nodes:
-            selected_node = self.healthy_nodes[0]
+            selected_node = self.__select_beacon_node(self.healthy_nodes)
             self.__log_used_beacon_node(current_time, selected_node.url)
             return selected_node
         return None
 
+    def get_healthy_beacon_node_weights(self) -> Dict[NodeConnectionProperties, float]:
+        """Get the relative throughput of all healthy beacon nodes. Nodes without observed
+        latency get the average weight of the other nodes.
+
+        Returns:
+            Dict[NodeConnectionProperties, float]: Weight per healthy beacon node
+        """
+        scores = {
+            node: self.get_statistics(node).get_score() for node in self.healthy_nodes
+        }
+        known_weights = [1 / score for score in scores.values() if score > 0]
+        default_weight = (
+            sum(known_weights) / len(known_weights) if known_weights else 1.0
+        )
+        return {
+            node: 1 / score if score > 0 else default_weight
+            for node, score in scores.items()
+        }
+
+    def get_fallback_beacon_nodes(
+        self, failed_node: NodeConnectionProperties
+    ) -> List[NodeConnectionProperties]:
+        """Get all other healthy beacon nodes ordered by their expected request cost
+
+        Args:
+            failed_node (NodeConnectionProperties): Beacon node which failed to respond
+
+        Returns:
+            List[NodeConnectionProperties]: Healthy beacon nodes which can take over the request
+        """
+        return sorted(
+            [node for node in self.healthy_nodes if node != failed_node],
+            key=lambda node: self.get_statistics(node).get_score(),
+        )
+
+    def __select_beacon_node(
+        self, healthy_nodes: List[NodeConnectionProperties]
+    ) -> NodeConnectionProperties:
+        """Select a beacon node in dependence of the user defined selection strategy
+
+        Args:
+            healthy_nodes (List[NodeConnectionProperties]): Currently healthy beacon nodes
+
+        Returns:
+            NodeConnectionProperties: Selected beacon node
+        """
+        match ARGUMENTS.beacon_node_selection:
+            case NodeSelectionStrategy.FASTEST:
+                return min(
+                    healthy_nodes,
+                    key=lambda node: self.get_statistics(node).get_score(),
+                )
+            case NodeSelectionStrategy.ROUND_ROBIN:
+                selected_node = healthy_nodes[
+                    self.__round_robin_counter % len(healthy_nodes)
+                ]
+                self.__round_robin_counter += 1
+                return selected_node
+            case _:
+                return healthy_nodes[0]
+
     def __log_used_beacon_node(self, time: datetime, node_url: str) -> None:
         """Log the used beacon node in dependence of specific events
 
@@ -176,7 +332,10 @@ class BeaconNode(NodeManager):
                 minutes=program.MINUTES_UNTIL_USED_BEACON_NODE_CONNECTION_STRING_IS_LOGGED
             )
             or not self.is_any_node_healthy
-            or node_url != self.__last_used_beacon_node
+            or (
+                node_url != self.__last_used_beacon_node
+                and ARGUMENTS.beacon_node_selection == NodeSelectionStrategy.FIRST
+            )
         ):
             self._logger.info(logging.USED_BEACON_NODE_MESSAGE, node_url)
             self.__last_used_beacon_node_info = time
@@ -195,13 +354,12 @@ class ValidatorNode(NodeManager):
         """Get validator node health check interval"""
         return program.VALIDATOR_HEALTH_UPDATE_INTERVAL
 
-    def _check_node_health(self, node: NodeConnectionProperties) -> bool:
+    async def _check_node_health(self, node: NodeConnectionProperties) -> bool:
         """Check if validator node is healthy"""
         try:
             header = get_correct_request_header(node)
-            response = get(
+            response = await connection_pool.get_client(node.url).get(
                 url=f"{node.url}{endpoints.FEERECIPIENT_ENDPOINT}",
-                timeout=program.REQUEST_TIMEOUT,
                 headers=header,
             )
             if response.status_code in (401, 403):
@@ -210,14 +368,12 @@ class ValidatorNode(NodeManager):
                     node.url,
                 )
                 return False
-            elif (
-                json.RESPONSE_JSON_DATA_FIELD_NAME in response.json()
-                or json.RESPONSE_JSON_MESSAGE_NAME in response.json()
-            ):
-                return True
-            else:
-                return False
-        except RequestsConnectionError:
+            decoded_response = decode_response(response)
+            return (
+                json.RESPONSE_JSON_DATA_FIELD_NAME in decoded_response
+                or json.RESPONSE_JSON_MESSAGE_NAME in decoded_response
+            )
+        except TransportError:
             return False
 
     def _log_health_of_nodes(self) -> None:
@@ -235,9 +391,9 @@ class ValidatorNode(NodeManager):
         """Update validator node healthiness in interval"""
         await self.update_node_health()
 
-    def update_validator_node_health_once(self) -> None:
+    async def update_validator_node_health_once(self) -> None:
         """Update validator node healthiness based on REST responses"""
-        self.update_node_health_once()
+        await self.update_node_health_once()
 
     def __log_unhealthy_node(self, node: NodeConnectionProperties) -> None:
         """Log unhealthy node
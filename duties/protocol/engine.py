@@ -0,0 +1,346 @@
+"""Module for computing validator duties offline from a beacon state snapshot
+"""
+
+from dataclasses import dataclass, field
+from hashlib import sha256
+from json import loads
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from constants import json
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # pylint: disable=invalid-name
+
+SLOTS_PER_EPOCH = 32
+MIN_SEED_LOOKAHEAD = 1
+EPOCHS_PER_HISTORICAL_VECTOR = 65536
+SHUFFLE_ROUND_COUNT = 90
+TARGET_COMMITTEE_SIZE = 128
+MAX_COMMITTEES_PER_SLOT = 64
+DOMAIN_BEACON_ATTESTER = bytes.fromhex("01000000")
+
+
+@dataclass
+class StateSnapshot:
+    """Parts of a beacon state which determine the attester duties: the validator registry
+    and the RANDAO mixes. Validators are stored as columns and addressed by their index.
+    Like in the beacon state the mixes are addressed by their position in the historical
+    vector (see get_randao_mix_index). The epoch is the epoch of the state, all mixes of
+    earlier epochs are final.
+    """
+
+    pubkeys: List[str]
+    activation_epochs: List[int]
+    exit_epochs: List[int]
+    randao_mixes: Dict[int, bytes] = field(default_factory=dict)
+    epoch: int = 0
+
+    def get_active_validator_indices(self, epoch: int) -> List[int]:
+        """Get the indices of all validators which are active in the provided epoch
+
+        Args:
+            epoch (int): Epoch for which the validators need to be active
+
+        Returns:
+            List[int]: Sorted active validator indices
+        """
+        return [
+            index
+            for index, (activation_epoch, exit_epoch) in enumerate(
+                zip(self.activation_epochs, self.exit_epochs)
+            )
+            if activation_epoch <= epoch < exit_epoch
+        ]
+
+    def has_seed(self, epoch: int) -> bool:
+        """Check whether the snapshot determines the seed of the provided epoch. The RANDAO
+        mix of the epoch before the previous epoch needs to be final and recorded.
+
+        Args:
+            epoch (int): Epoch of the seed
+
+        Returns:
+            bool: Whether or not the seed can be computed
+        """
+        return (
+            epoch - MIN_SEED_LOOKAHEAD - 1 < self.epoch
+            and get_randao_mix_index(
+                epoch + EPOCHS_PER_HISTORICAL_VECTOR - MIN_SEED_LOOKAHEAD - 1
+            )
+            in self.randao_mixes
+        )
+
+    def get_seed(self, epoch: int, domain_type: bytes) -> bytes:
+        """Get the seed of the provided epoch and domain. The seed depends on the RANDAO mix
+        of the epoch before the previous epoch. The mix index wraps around like in the
+        consensus specification, so the first epochs use the mixes of the genesis state.
+
+        Args:
+            epoch (int): Epoch of the seed
+            domain_type (bytes): Domain type of the duty
+
+        Raises:
+            KeyError: Raised if the snapshot does not contain the required RANDAO mix
+
+        Returns:
+            bytes: Seed for the shuffling
+        """
+        mix = self.randao_mixes[
+            get_randao_mix_index(
+                epoch + EPOCHS_PER_HISTORICAL_VECTOR - MIN_SEED_LOOKAHEAD - 1
+            )
+        ]
+        return sha256(domain_type + epoch.to_bytes(8, "little") + mix).digest()
+
+
+class DutyEngine:
+    """Computes attester duties with the shuffling of the consensus specification instead of
+    requesting them per validator. The shuffling of an epoch is computed once for all
+    validators and cached.
+    """
+
+    def __init__(self, snapshot: StateSnapshot) -> None:
+        self.__snapshot = snapshot
+        self.__shufflings: Dict[int, Tuple[List[int], int]] = {}
+
+    def can_compute_attestation_duties(self, epoch: int, validators: List[str]) -> bool:
+        """Check whether the snapshot determines the attester duties of the provided
+        validators. The shuffling is known up to one epoch after the snapshot and validators
+        which were added after the snapshot are unknown.
+
+        Args:
+            epoch (int): Epoch of the duties
+            validators (List[str]): Validator indices
+
+        Returns:
+            bool: Whether or not the duties can be computed
+        """
+        number_of_validators = len(self.__snapshot.pubkeys)
+        return self.__snapshot.has_seed(epoch) and all(
+            int(validator) < number_of_validators for validator in validators
+        )
+
+    def get_attestation_duties(
+        self, epoch: int, validators: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Compute the attester duties of the provided validators
+
+        Args:
+            epoch (int): Epoch of the duties
+            validators (List[str]): Validator indices
+
+        Returns:
+            List[Dict[str, Any]]: Attester duties in the structure of the json api
+        """
+        shuffled_indices, committees_per_slot = self.__get_shuffling(epoch)
+        validator_set = {int(validator) for validator in validators}
+        committee_count = committees_per_slot * SLOTS_PER_EPOCH
+        attestation_duties: List[Dict[str, Any]] = []
+        for committee_number in range(committee_count):
+            start = len(shuffled_indices) * committee_number // committee_count
+            end = len(shuffled_indices) * (committee_number + 1) // committee_count
+            committee = shuffled_indices[start:end]
+            if validator_set.isdisjoint(committee):
+                continue
+            slot = epoch * SLOTS_PER_EPOCH + committee_number // committees_per_slot
+            attestation_duties.extend(
+                {
+                    "pubkey": self.__snapshot.pubkeys[validator_index],
+                    "validator_index": str(validator_index),
+                    "committee_index": str(committee_number % committees_per_slot),
+                    "committee_length": str(len(committee)),
+                    "committees_at_slot": str(committees_per_slot),
+                    "validator_committee_index": str(position),
+                    "slot": str(slot),
+                }
+                for position, validator_index in enumerate(committee)
+                if validator_index in validator_set
+            )
+        return attestation_duties
+
+    def __get_shuffling(self, epoch: int) -> Tuple[List[int], int]:
+        """Get the shuffled active validators and the number of committees per slot
+
+        Args:
+            epoch (int): Epoch of the attester duties
+
+        Returns:
+            Tuple[List[int], int]: Shuffled active validator indices and committees per slot
+        """
+        if epoch not in self.__shufflings:
+            active_validator_indices = self.__snapshot.get_active_validator_indices(
+                epoch
+            )
+            shuffled_positions = compute_shuffled_indices(
+                len(active_validator_indices),
+                self.__snapshot.get_seed(epoch, DOMAIN_BEACON_ATTESTER),
+            )
+            self.__shufflings[epoch] = (
+                [active_validator_indices[position] for position in shuffled_positions],
+                max(
+                    1,
+                    min(
+                        MAX_COMMITTEES_PER_SLOT,
+                        len(active_validator_indices)
+                        // SLOTS_PER_EPOCH
+                        // TARGET_COMMITTEE_SIZE,
+                    ),
+                ),
+            )
+        return self.__shufflings[epoch]
+
+
+def get_randao_mix_index(epoch: int) -> int:
+    """Get the position of the RANDAO mix of the provided epoch in the historical vector
+
+    Args:
+        epoch (int): Epoch of the mix
+
+    Returns:
+        int: Index of the mix
+    """
+    return epoch % EPOCHS_PER_HISTORICAL_VECTOR
+
+
+def compute_shuffled_index(index: int, index_count: int, seed: bytes) -> int:
+    """Compute the shuffled position of a single index with the swap-or-not shuffle
+
+    Args:
+        index (int): Index which will be shuffled
+        index_count (int): Number of shuffled indices
+        seed (bytes): Seed of the shuffling
+
+    Returns:
+        int: Shuffled index
+    """
+    for current_round in range(SHUFFLE_ROUND_COUNT):
+        round_bytes = current_round.to_bytes(1, "little")
+        pivot = (
+            int.from_bytes(sha256(seed + round_bytes).digest()[:8], "little")
+            % index_count
+        )
+        flip = (pivot + index_count - index) % index_count
+        position = max(index, flip)
+        source = sha256(
+            seed + round_bytes + (position // 256).to_bytes(4, "little")
+        ).digest()
+        if (source[(position % 256) // 8] >> (position % 8)) % 2:
+            index = flip
+    return index
+
+
+def compute_shuffled_indices(index_count: int, seed: bytes) -> List[int]:
+    """Compute the shuffled position of all indices at once. Every round hashes each block
+    of 256 positions only once and is applied to all indices, vectorized with numpy if
+    the optional package is installed.
+
+    Args:
+        index_count (int): Number of shuffled indices
+        seed (bytes): Seed of the shuffling
+
+    Returns:
+        List[int]: Shuffled index of every index, equal to compute_shuffled_index
+    """
+    if index_count == 0:
+        return []
+    if numpy is not None:
+        return __compute_shuffled_indices_with_numpy(index_count, seed)
+    indices = list(range(index_count))
+    for current_round in range(SHUFFLE_ROUND_COUNT):
+        pivot, source = __get_round_data(current_round, index_count, seed)
+        shuffled_indices: List[int] = []
+        for index in indices:
+            flip = (pivot + index_count - index) % index_count
+            position = index if index > flip else flip
+            shuffled_indices.append(
+                flip if (source[position >> 3] >> (position & 7)) & 1 else index
+            )
+        indices = shuffled_indices
+    return indices
+
+
+def __compute_shuffled_indices_with_numpy(index_count: int, seed: bytes) -> List[int]:
+    """Compute the shuffled position of all indices with numpy array operations
+
+    Args:
+        index_count (int): Number of shuffled indices
+        seed (bytes): Seed of the shuffling
+
+    Returns:
+        List[int]: Shuffled index of every index
+    """
+    indices = numpy.arange(index_count, dtype=numpy.int64)
+    for current_round in range(SHUFFLE_ROUND_COUNT):
+        pivot, source = __get_round_data(current_round, index_count, seed)
+        flips = (pivot + index_count - indices) % index_count
+        bits = numpy.unpackbits(
+            numpy.frombuffer(source, dtype=numpy.uint8), bitorder="little"
+        )
+        indices = numpy.where(bits[numpy.maximum(indices, flips)], flips, indices)
+    return indices.tolist()
+
+
+def __get_round_data(
+    current_round: int, index_count: int, seed: bytes
+) -> Tuple[int, bytes]:
+    """Get the pivot and the swap bits of all positions of a shuffle round. The bit of a
+    position is at bit position % 8 of byte position // 8 of the concatenated hashes.
+
+    Args:
+        current_round (int): Shuffle round
+        index_count (int): Number of shuffled indices
+        seed (bytes): Seed of the shuffling
+
+    Returns:
+        Tuple[int, bytes]: Pivot and concatenated hashes of all blocks of 256 positions
+    """
+    round_bytes = current_round.to_bytes(1, "little")
+    pivot = (
+        int.from_bytes(sha256(seed + round_bytes).digest()[:8], "little") % index_count
+    )
+    source = b"".join(
+        sha256(seed + round_bytes + block.to_bytes(4, "little")).digest()
+        for block in range((index_count + 255) // 256)
+    )
+    return pivot, source
+
+
+def load_state_snapshot(file_path: str) -> StateSnapshot:
+    """Load a state snapshot from a json file. The file contains the 'validators' as
+    returned by /eth/v1/beacon/states/<state>/validators and the 'randao_mixes' of finished
+    epochs as mapping from epoch to the mix returned by /eth/v1/beacon/states/<state>/randao.
+    The snapshot is taken in the epoch after the latest recorded mix. Negative epochs
+    address the genesis mixes which are used for the seeds of the first epochs.
+
+    Args:
+        file_path (str): Path to the snapshot file
+
+    Raises:
+        KeyError: Raised if the file does not contain validators or RANDAO mixes
+        ValueError: Raised if the file does not contain any RANDAO mix
+
+    Returns:
+        StateSnapshot: Loaded snapshot
+    """
+    content = loads(Path(file_path).read_text(encoding="utf-8"))
+    validators = sorted(
+        content[json.RESPONSE_JSON_VALIDATORS_FIELD_NAME],
+        key=lambda validator: int(validator[json.RESPONSE_JSON_INDEX_FIELD_NAME]),
+    )
+    registry = [
+        validator[json.RESPONSE_JSON_VALIDATOR_FIELD_NAME] for validator in validators
+    ]
+    randao_mixes = {
+        int(epoch): bytes.fromhex(mix.removeprefix("0x"))
+        for epoch, mix in content[json.STATE_SNAPSHOT_RANDAO_MIXES_FIELD_NAME].items()
+    }
+    return StateSnapshot(
+        [validator[json.RESPONSE_JSON_PUBKEY_FIELD_NAME] for validator in registry],
+        [int(validator["activation_epoch"]) for validator in registry],
+        [int(validator["exit_epoch"]) for validator in registry],
+        {get_randao_mix_index(epoch): mix for epoch, mix in randao_mixes.items()},
+        max(randao_mixes) + 1,
+    )
@@ -4,13 +4,14 @@ from asyncio import run
 from logging import getLogger
 from math import ceil, trunc
 from sys import exit as sys_exit
-from time import time
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
 from constants import endpoints, json, logging
-from fetcher.data_types import DutyType, ValidatorDuty
+from fetcher.data_types import DutyRecord, DutyType
 from helper.error import NoDataFromEndpointError
 
+from protocol.client import connection_pool
+from protocol.clock import SlotClock
 from protocol.request import CalldataType, send_beacon_api_request
 
 __LOGGER = getLogger()
@@ -30,6 +31,8 @@ async def __fetch_genesis_time() -> int:
     except NoDataFromEndpointError:
         __LOGGER.error(logging.NO_GENESIS_TIME_ERROR_MESSAGE)
         sys_exit(1)
+    finally:
+        await connection_pool.close_clients()
 
 
 try:
@@ -42,6 +45,9 @@ SLOT_TIME = 12
 SLOTS_PER_EPOCH = 32
 EPOCHS_PER_SYNC_COMMITTEE = 256
 ACTIVE_VALIDATOR_STATUS = ["active_ongoing", "active_exiting", "active_slashed"]
+FAR_FUTURE_EPOCH = 2**64 - 1
+
+slot_clock = SlotClock(GENESIS_TIME, SLOT_TIME, SLOTS_PER_EPOCH)
 
 
 def get_current_slot() -> int:
@@ -50,7 +56,7 @@ def get_current_slot() -> int:
     Returns:
         int: The current beacon chain slot
     """
-    return trunc((time() - GENESIS_TIME) / SLOT_TIME)
+    return slot_clock.get_current_slot()
 
 
 def get_current_epoch() -> int:
@@ -59,15 +65,43 @@ def get_current_epoch() -> int:
     Returns:
         int: Current epoch
     """
-    now = time()
-    return trunc((now - GENESIS_TIME) / (SLOTS_PER_EPOCH * SLOT_TIME))
+    return slot_clock.get_current_epoch()
+
 
+def get_validator_status(validator: Dict[str, Any], epoch: int) -> str:
+    """Derives the validator status at the provided epoch from the validator container
+    (see https://github.com/ethereum/beacon-APIs/blob/master/validator-flow.md)
+
+    Args:
+        validator (Dict[str, Any]): Validator container as returned by the beacon api
+        epoch (int): Epoch for which the status is derived
 
-def set_time_to_duty(duty: ValidatorDuty) -> None:
+    Returns:
+        str: Validator status
+    """
+    is_slashed = validator["slashed"]
+    if int(validator["activation_epoch"]) > epoch:
+        if int(validator["activation_eligibility_epoch"]) == FAR_FUTURE_EPOCH:
+            return "pending_initialized"
+        return "pending_queued"
+    if int(validator["exit_epoch"]) > epoch:
+        if is_slashed:
+            return "active_slashed"
+        if int(validator["exit_epoch"]) != FAR_FUTURE_EPOCH:
+            return "active_exiting"
+        return "active_ongoing"
+    if int(validator["withdrawable_epoch"]) > epoch:
+        return "exited_slashed" if is_slashed else "exited_unslashed"
+    if int(validator["effective_balance"]) != 0:
+        return "withdrawal_possible"
+    return "withdrawal_done"
+
+
+def set_time_to_duty(duty: DutyRecord) -> None:
     """Sets the time (in seconds) until the provided duty is due, via call by reference
 
     Args:
-        duty (ValidatorDuty): Validator duty
+        duty (DutyRecord): Validator duty
     """
     match duty.type:
         case DutyType.NONE:
@@ -93,7 +127,7 @@ def set_time_to_duty(duty: ValidatorDuty) -> None:
             else:
                 duty.seconds_to_duty = time_to_next_sync_committee
         case _:
-            duty.seconds_to_duty = int(duty.slot * SLOT_TIME + GENESIS_TIME - time())
+            duty.seconds_to_duty = int(slot_clock.get_seconds_to_slot(duty.slot))
 
 
 def get_time_to_next_sync_committee(
@@ -117,6 +151,26 @@ def get_time_to_next_sync_committee(
     return number_of_slots_to_next_sync_committee * SLOT_TIME
 
 
+def get_dependent_slot(duty_type: DutyType, epoch: int) -> int | None:
+    """Gets the slot of the block whose root the duties of the provided epoch depend on
+    (see https://github.com/ethereum/beacon-APIs/blob/master/validator-flow.md)
+
+    Args:
+        duty_type (DutyType): Type of the duty
+        epoch (int): Epoch of the duties
+
+    Returns:
+        int | None: Dependent slot or None if the duties do not have a dependent root
+    """
+    match duty_type:
+        case DutyType.ATTESTATION:
+            return max((epoch - 1) * SLOTS_PER_EPOCH - 1, 0)
+        case DutyType.PROPOSING:
+            return max(epoch * SLOTS_PER_EPOCH - 1, 0)
+        case _:
+            return None
+
+
 def get_sync_committee_epoch_boundaries(epoch: int) -> Tuple[int, int]:
     """Gets sync committee lower and upper epoch boundaries based on the provided epoch
 
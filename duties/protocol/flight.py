@@ -0,0 +1,62 @@
+"""Module for coalescing identical concurrent requests
+"""
+
+from asyncio import AbstractEventLoop, Task, create_task, get_running_loop, shield
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from constants import logging
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call and its result between all concurrent callers with the
+    same key. Once the call finished, the next caller starts a new one."""
+
+    def __init__(self) -> None:
+        self.__in_flight: Dict[Hashable, Tuple[AbstractEventLoop, Task[Any]]] = {}
+        self.__logger = getLogger()
+
+    async def run(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """Run the provided function or join the in-flight call with the same key. The
+        shared call is shielded so that a cancelled caller (e.g. on a rest timeout) does not
+        cancel the call for the remaining callers.
+
+        Args:
+            key (Hashable): Identifies calls which return the same result
+            function (Callable[[], Awaitable[T]]): Function which starts the call
+
+        Returns:
+            T: Result of the shared call
+        """
+        running_loop = get_running_loop()
+        loop_and_task = self.__in_flight.get(key)
+        if (
+            loop_and_task
+            and loop_and_task[0] is running_loop
+            and not loop_and_task[1].done()
+        ):
+            self.__logger.debug(logging.JOINED_IN_FLIGHT_REQUEST_MESSAGE, key)
+            return await shield(loop_and_task[1])
+        task = create_task(function())
+        self.__in_flight[key] = (running_loop, task)
+        task.add_done_callback(lambda _: self.__remove(key, task))
+        return await shield(task)
+
+    def __remove(self, key: Hashable, task: Task[Any]) -> None:
+        """Remove the finished call if it was not replaced in the meantime. A possible
+        exception is marked as retrieved since all callers might have been cancelled.
+
+        Args:
+            key (Hashable): Key of the finished call
+            task (Task[Any]): Finished call
+        """
+        if not task.cancelled():
+            task.exception()
+        loop_and_task = self.__in_flight.get(key)
+        if loop_and_task and loop_and_task[1] is task:
+            del self.__in_flight[key]
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,97 @@
+"""Module for limiting the request load per node
+"""
+
+from asyncio import AbstractEventLoop, Semaphore, get_running_loop, sleep
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from time import monotonic
+from typing import AsyncIterator, Dict, Tuple
+
+from cli.arguments import ARGUMENTS
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket which refills with a constant rate up to its capacity"""
+
+    rate: float
+    capacity: float
+    tokens: float
+    last_refill: float
+
+    def take_token(self) -> float:
+        """Take a token from the bucket. If no token is left, a token is reserved in advance.
+
+        Returns:
+            float: Time in seconds to wait until the taken token is available
+        """
+        current_time = monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (current_time - self.last_refill) * self.rate
+        )
+        self.last_refill = current_time
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RequestLimiter:
+    """Limits the number of concurrent requests and the request rate per node"""
+
+    def __init__(self) -> None:
+        self.__semaphores: Dict[str, Tuple[AbstractEventLoop, Semaphore]] = {}
+        self.__token_buckets: Dict[str, TokenBucket] = {}
+
+    @asynccontextmanager
+    async def limit(self, node_url: str) -> AsyncIterator[None]:
+        """Wait until a request to the provided node is allowed. The rate limit is awaited
+        before a concurrency slot is taken, so waiting requests do not block the slots of
+        the node.
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Yields:
+            None: Context in which the request can be sent and its response read
+        """
+        if ARGUMENTS.max_requests_per_second > 0:
+            await sleep(self.__get_token_bucket(node_url).take_token())
+        async with self.__get_semaphore(node_url):
+            yield
+
+    def __get_semaphore(self, node_url: str) -> Semaphore:
+        """Get the semaphore of the provided node for the running event loop
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            Semaphore: Semaphore limiting concurrent requests to the node
+        """
+        running_loop = get_running_loop()
+        loop_and_semaphore = self.__semaphores.get(node_url)
+        if loop_and_semaphore and loop_and_semaphore[0] is running_loop:
+            return loop_and_semaphore[1]
+        semaphore = Semaphore(ARGUMENTS.max_concurrent_requests)
+        self.__semaphores[node_url] = (running_loop, semaphore)
+        return semaphore
+
+    def __get_token_bucket(self, node_url: str) -> TokenBucket:
+        """Get the token bucket of the provided node
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            TokenBucket: Token bucket limiting the request rate to the node
+        """
+        if node_url not in self.__token_buckets:
+            capacity = max(ARGUMENTS.max_requests_per_second, 1.0)
+            self.__token_buckets[node_url] = TokenBucket(
+                ARGUMENTS.max_requests_per_second, capacity, capacity, monotonic()
+            )
+        return self.__token_buckets[node_url]
+
+
+request_limiter = RequestLimiter()
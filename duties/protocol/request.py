@@ -1,25 +1,64 @@
 """Module for fetching data from a beacon client"""
 
-from asyncio import TaskGroup, sleep
+from asyncio import (
+    FIRST_COMPLETED,
+    Event,
+    Task,
+    TaskGroup,
+    create_task,
+    gather,
+    run,
+    sleep,
+    wait,
+)
 from enum import Enum
 from itertools import chain
 from logging import getLogger
-from typing import Any, List
+from time import perf_counter
+from typing import Any, Callable, List, Tuple
 from urllib.parse import urlencode
 
-from cli.types import NodeConnectionProperties
+from cli.arguments import ARGUMENTS
+from cli.types import NodeConnectionProperties, NodeType
 from constants import endpoints, json, logging, program
-from helper.error import NoDataFromEndpointError, PrysmError
+from helper.error import (
+    NoDataFromEndpointError,
+    PayloadTooLargeError,
+    PrysmError,
+    SszNotSupportedError,
+)
 from helper.general import get_correct_request_header
-from protocol.connection import BeaconNode, ValidatorNode
-from requests import ConnectionError as RequestsConnectionError
-from requests import ReadTimeout, Response, get, post
+from httpx import DecodingError, ReadTimeout, Response, TransportError
+from protocol.chunk import chunk_size_controller
+from protocol.client import connection_pool
+from protocol.compression import compression_manager
+from protocol.connection import BeaconNode, NodeManager, ValidatorNode
+from protocol.limiter import request_limiter
+from protocol.response import (
+    ApiResponse,
+    DutyResponse,
+    decode_json,
+    decode_streamed_data,
+)
+from protocol.retry import retry_engine
+from protocol.ssz import decode_ssz_data, ssz_negotiator
 
 __LOGGER = getLogger()
 beacon_node = BeaconNode()
 validator_node = ValidatorNode()
-validator_node.update_validator_node_health_once()
-beacon_node.update_beacon_node_health_once()
+
+
+async def __update_node_health_once() -> None:
+    """Probe provided validator and beacon nodes concurrently"""
+    try:
+        async with TaskGroup() as taskgroup:
+            taskgroup.create_task(validator_node.update_validator_node_health_once())
+            taskgroup.create_task(beacon_node.update_beacon_node_health_once())
+    finally:
+        await connection_pool.close_clients()
+
+
+run(__update_node_health_once())
 
 
 class CalldataType(Enum):
@@ -35,6 +74,7 @@ async def send_beacon_api_request(
     calldata_type: CalldataType,
     provided_validators: List[str] | None = None,
     flatten: bool = True,
+    projection: Callable[[Any], Any] | None = None,
 ) -> List[Any]:
     """Sends api requests to the beacon client and returns the subsequent data objects
     from the responses
@@ -44,48 +84,284 @@ async def send_beacon_api_request(
         calldata_type (CalldataType): The type of calldata submitted with the request
         provided_validators (List[str] | None): Validator indices or pubkey to get information for
         flatten (bool): If True the returned list will be flattened
+        projection (Callable[[Any], Any] | None): If provided, the 'data' array of the responses is decoded while it is received and every element is reduced with this function # pylint: disable=line-too-long
 
     Returns:
         List[Any]: List with data objects from responses
     """
+    responses = await __send_beacon_api_requests(
+        endpoint, calldata_type, provided_validators, projection
+    )
+    return __convert_to_raw_data_responses(responses, flatten)
+
 
+async def send_beacon_api_duty_request(
+    endpoint: str,
+    calldata_type: CalldataType,
+    provided_validators: List[str] | None = None,
+) -> DutyResponse:
+    """Sends duty api requests to the beacon client and returns the flattened duties together
+    with the dependent root of the responses
+
+    Args:
+        endpoint (str): Duty endpoint which will be called
+        calldata_type (CalldataType): The type of calldata submitted with the request
+        provided_validators (List[str] | None): Validator indices or pubkey to get duties for
+
+    Returns:
+        DutyResponse: Duties of all chunks. The dependent root is None if the responses did not include it (SSZ, sync committee duties) or the chunks disagree. Chunks which disagree (e.g. answered by beacon nodes with different heads) are not complete # pylint: disable=line-too-long
+    """
+    responses = await __send_beacon_api_requests(
+        endpoint, calldata_type, provided_validators
+    )
+    dependent_roots = {
+        response.dependent_root
+        for response in responses
+        if response is not None and response.dependent_root is not None
+    }
+    return DutyResponse(
+        __convert_to_raw_data_responses(responses, True),
+        dependent_roots.pop() if len(dependent_roots) == 1 else None,
+        all(response is not None for response in responses)
+        and len(dependent_roots) <= 1,
+    )
+
+
+async def __send_beacon_api_requests(
+    endpoint: str,
+    calldata_type: CalldataType,
+    provided_validators: List[str] | None = None,
+    projection: Callable[[Any], Any] | None = None,
+) -> List[ApiResponse | None]:
+    """Sends the possibly chunked api requests to the beacon client
+
+    Args:
+        endpoint (str): Endpoint which will be called
+        calldata_type (CalldataType): The type of calldata submitted with the request
+        provided_validators (List[str] | None): Validator indices or pubkey to get information for
+        projection (Callable[[Any], Any] | None): Function which reduces every element of a streamed data array # pylint: disable=line-too-long
+
+    Returns:
+        List[ApiResponse | None]: Responses of all chunks
+    """
     beacon_node_endpoint = beacon_node.get_healthy_beacon_node()
-    responses: List[Response] = []
+    responses: List[ApiResponse | None] = []
     if beacon_node_endpoint:
         if provided_validators:
+            chunk_size = __get_chunk_size(beacon_node_endpoint, endpoint, calldata_type)
             chunked_validators = [
-                provided_validators[
-                    index : index + program.NUMBER_OF_VALIDATORS_PER_REST_CALL
-                ]
-                for index in range(
-                    0,
-                    len(provided_validators),
-                    program.NUMBER_OF_VALIDATORS_PER_REST_CALL,
-                )
+                provided_validators[index : index + chunk_size]
+                for index in range(0, len(provided_validators), chunk_size)
             ]
+            chunk_beacon_nodes = __get_beacon_nodes_for_chunks(
+                beacon_node_endpoint, len(chunked_validators)
+            )
             async with TaskGroup() as taskgroup:
                 tasks = [
                     taskgroup.create_task(
-                        __handle_api_request(
-                            beacon_node_endpoint,
+                        __handle_validator_chunk_request(
+                            chunk_beacon_node,
                             endpoint,
                             calldata_type,
                             chunk,
+                            projection,
                         )
                     )
-                    for chunk in chunked_validators
+                    for chunk_beacon_node, chunk in zip(
+                        chunk_beacon_nodes, chunked_validators
+                    )
                 ]
-            responses = [task.result() for task in tasks]
+            responses = [response for task in tasks for response in task.result()]
         else:
             responses.append(
-                await __handle_api_request(
+                await __handle_beacon_api_request(
                     beacon_node_endpoint,
                     endpoint,
                     calldata_type,
                     [],
+                    projection,
                 )
             )
-    return __convert_to_raw_data_responses(responses, flatten)
+    return responses
+
+
+def __get_chunk_size(
+    selected_beacon_node: NodeConnectionProperties,
+    endpoint: str,
+    calldata_type: CalldataType,
+) -> int:
+    """Get the tuned number of validators per request for all beacon nodes which
+    will receive chunks
+
+    Args:
+        selected_beacon_node (NodeConnectionProperties): Beacon node selected for the request
+        endpoint (str): Endpoint which will be called
+        calldata_type (CalldataType): The type of calldata submitted with the request
+
+    Returns:
+        int: Number of validators per request
+    """
+    chunk_beacon_nodes = [selected_beacon_node]
+    if ARGUMENTS.spread_validator_chunks:
+        chunk_beacon_nodes.extend(beacon_node.healthy_nodes)
+    return chunk_size_controller.get_chunk_size(
+        endpoint,
+        [node.url for node in chunk_beacon_nodes],
+        __get_max_chunk_size(calldata_type),
+    )
+
+
+def __get_max_chunk_size(calldata_type: CalldataType) -> int:
+    """Get the upper bound of validators per request. Validators sent as url parameters
+    are bound by url length limits while request bodies can take much larger chunks.
+
+    Args:
+        calldata_type (CalldataType): The type of calldata submitted with the request
+
+    Returns:
+        int: Max. number of validators per request
+    """
+    if calldata_type == CalldataType.REQUEST_DATA:
+        return program.MAX_NUMBER_OF_VALIDATORS_PER_POST_REST_CALL
+    return program.NUMBER_OF_VALIDATORS_PER_REST_CALL
+
+
+async def __handle_validator_chunk_request(
+    node_connection_properties: NodeConnectionProperties,
+    endpoint: str,
+    calldata_type: CalldataType,
+    validator_chunk: List[str],
+    projection: Callable[[Any], Any] | None = None,
+) -> List[ApiResponse | None]:
+    """Handle the api request for a validator chunk. If the node rejects the chunk as too large,
+    the chunk is split in halves which are requested separately.
+
+    Args:
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+        endpoint (str): Endpoint which will be called
+        calldata_type (CalldataType): The type of calldata submitted with the request
+        validator_chunk (List[str]): Validator indices or pubkeys of the chunk
+        projection (Callable[[Any], Any] | None): Function which reduces every element of a streamed data array # pylint: disable=line-too-long
+
+    Returns:
+        List[ApiResponse | None]: Responses for the chunk or its parts
+    """
+    try:
+        return [
+            await __handle_beacon_api_request(
+                node_connection_properties,
+                endpoint,
+                calldata_type,
+                validator_chunk,
+                projection,
+            )
+        ]
+    except PayloadTooLargeError:
+        if len(validator_chunk) < 2:
+            return [None]
+        half = len(validator_chunk) // 2
+        async with TaskGroup() as taskgroup:
+            tasks = [
+                taskgroup.create_task(
+                    __handle_validator_chunk_request(
+                        node_connection_properties,
+                        endpoint,
+                        calldata_type,
+                        part,
+                        projection,
+                    )
+                )
+                for part in [validator_chunk[:half], validator_chunk[half:]]
+            ]
+        return [response for task in tasks for response in task.result()]
+
+
+def __get_beacon_nodes_for_chunks(
+    selected_beacon_node: NodeConnectionProperties, number_of_chunks: int
+) -> List[NodeConnectionProperties]:
+    """Assign a beacon node to every chunk. If chunks should be spread, all healthy beacon nodes
+    get a share of chunks in proportion to their observed throughput (smooth weighted round-robin).
+
+    Args:
+        selected_beacon_node (NodeConnectionProperties): Beacon node selected for the request
+        number_of_chunks (int): Number of chunks
+
+    Returns:
+        List[NodeConnectionProperties]: Beacon node for every chunk in chunk order
+    """
+    node_weights = beacon_node.get_healthy_beacon_node_weights()
+    if not ARGUMENTS.spread_validator_chunks or len(node_weights) < 2:
+        return [selected_beacon_node] * number_of_chunks
+    total_weight = sum(node_weights.values())
+    current_weights = {node: 0.0 for node in node_weights}
+    chunk_beacon_nodes: List[NodeConnectionProperties] = []
+    for _ in range(number_of_chunks):
+        for node, weight in node_weights.items():
+            current_weights[node] += weight
+        chunk_beacon_node = max(current_weights, key=current_weights.__getitem__)
+        current_weights[chunk_beacon_node] -= total_weight
+        chunk_beacon_nodes.append(chunk_beacon_node)
+    return chunk_beacon_nodes
+
+
+async def __handle_beacon_api_request(
+    node_connection_properties: NodeConnectionProperties,
+    endpoint: str,
+    calldata_type: CalldataType,
+    provided_validators: List[str],
+    projection: Callable[[Any], Any] | None = None,
+) -> ApiResponse | None:
+    """Handle a single api request to a beacon node and move it to the other healthy beacon
+    nodes if the request fails. Nodes with a tripped circuit breaker and nodes which already
+    received the request as hedged request are skipped.
+
+    Args:
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+        endpoint (str): Endpoint which will be called
+        calldata_type (CalldataType): The type of calldata submitted with the request
+        provided_validators (List[str]): Validator indices or pubkey to get information for
+        projection (Callable[[Any], Any] | None): Function which reduces every element of a streamed data array # pylint: disable=line-too-long
+
+    Returns:
+        ApiResponse | None: Response with data provided by the endpoint or None if no data could be fetched # pylint: disable=line-too-long
+    """
+    beacon_nodes = [
+        node
+        for node in [
+            node_connection_properties,
+            *beacon_node.get_fallback_beacon_nodes(node_connection_properties),
+        ]
+        if retry_engine.is_node_available(node.url)
+    ] or [node_connection_properties]
+    requested_nodes = beacon_nodes[:1]
+    if ARGUMENTS.hedge_requests:
+        response, is_hedged = await __handle_hedged_api_request(
+            beacon_nodes[0],
+            beacon_nodes[1] if len(beacon_nodes) > 1 else None,
+            endpoint,
+            calldata_type,
+            provided_validators,
+            projection,
+        )
+        if is_hedged:
+            requested_nodes = beacon_nodes[:2]
+    else:
+        response = await __handle_api_request(
+            beacon_nodes[0], endpoint, calldata_type, provided_validators, projection
+        )
+    for fallback_node in beacon_nodes[len(requested_nodes) :]:
+        if response is not None:
+            break
+        __LOGGER.warning(
+            logging.BEACON_NODE_FAILOVER_MESSAGE,
+            requested_nodes[-1].url,
+            fallback_node.url,
+        )
+        requested_nodes.append(fallback_node)
+        response = await __handle_api_request(
+            fallback_node, endpoint, calldata_type, provided_validators, projection
+        )
+    return response
 
 
 async def send_key_manager_api_keystore_requests() -> List[Any]:
@@ -117,154 +393,449 @@ async def send_key_manager_api_keystore_requests() -> List[Any]:
     return []
 
 
+async def __handle_hedged_api_request(
+    node_connection_properties: NodeConnectionProperties,
+    hedge_node: NodeConnectionProperties | None,
+    endpoint: str,
+    calldata_type: CalldataType,
+    provided_validators: List[str],
+    projection: Callable[[Any], Any] | None = None,
+) -> Tuple[ApiResponse | None, bool]:
+    """Handle a single api request to a beacon node. If the node does not answer within the
+    user defined percentile of its recent latencies (counted from the moment the request left
+    the request queue until the response headers arrive), the same request is sent to the
+    hedge node. The first valid response is used and the other request is cancelled. Like the
+    recorded latencies, the hedge timer only covers the first attempt until the node answered,
+    so neither reading the response body nor retries are hedged.
+
+    Args:
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+        hedge_node (NodeConnectionProperties | None): Beacon node which receives the hedged request or None if the request can not be hedged # pylint: disable=line-too-long
+        endpoint (str): Endpoint which will be called
+        calldata_type (CalldataType): The type of calldata submitted with the request
+        provided_validators (List[str]): Validator indices or pubkey to get information for
+        projection (Callable[[Any], Any] | None): Function which reduces every element of a streamed data array # pylint: disable=line-too-long
+
+    Returns:
+        Tuple[ApiResponse | None, bool]: Response with data provided by the endpoint or None if no data could be fetched and whether the request was sent to the hedge node # pylint: disable=line-too-long
+    """
+    hedge_delay = beacon_node.get_statistics(
+        node_connection_properties
+    ).get_latency_percentile(ARGUMENTS.hedge_percentile)
+    if hedge_delay is None or hedge_node is None:
+        return (
+            await __handle_api_request(
+                node_connection_properties,
+                endpoint,
+                calldata_type,
+                provided_validators,
+                projection,
+            ),
+            False,
+        )
+    request_started = Event()
+    response_received = Event()
+    request_task = create_task(
+        __handle_api_request(
+            node_connection_properties,
+            endpoint,
+            calldata_type,
+            provided_validators,
+            projection,
+            request_started,
+            response_received,
+        )
+    )
+    event_tasks = [
+        create_task(request_started.wait()),
+        create_task(response_received.wait()),
+    ]
+    pending_tasks: set[Task[ApiResponse | None]] = {request_task}
+    response: ApiResponse | None = None
+    try:
+        await wait([request_task, event_tasks[0]], return_when=FIRST_COMPLETED)
+        done_tasks, _ = await wait(
+            [request_task, event_tasks[1]],
+            timeout=hedge_delay,
+            return_when=FIRST_COMPLETED,
+        )
+        if done_tasks:
+            return await request_task, False
+        __LOGGER.info(
+            logging.HEDGED_REQUEST_MESSAGE,
+            node_connection_properties.url,
+            round(hedge_delay, 2),
+            hedge_node.url,
+        )
+        pending_tasks.add(
+            create_task(
+                __handle_api_request(
+                    hedge_node,
+                    endpoint,
+                    calldata_type,
+                    provided_validators,
+                    projection,
+                )
+            )
+        )
+        while pending_tasks and response is None:
+            done_tasks, pending_tasks = await wait(
+                pending_tasks, return_when=FIRST_COMPLETED
+            )
+            for task in done_tasks:
+                response = response or task.result()
+        return response, True
+    finally:
+        for task in [*event_tasks, *pending_tasks]:
+            task.cancel()
+        await gather(*event_tasks, *pending_tasks, return_exceptions=True)
+
+
 async def __handle_api_request(
     node_connection_properties: NodeConnectionProperties,
     endpoint: str,
     calldata_type: CalldataType,
     provided_validators: List[str],
-) -> Response:
-    """Handle a single api request to a beacon or validator node
+    projection: Callable[[Any], Any] | None = None,
+    request_started: Event | None = None,
+    response_received: Event | None = None,
+) -> ApiResponse | None:
+    """Handle a single api request to a beacon or validator node. Failed attempts are retried
+    with exponential backoff as long as the retry budget and the circuit breaker of the node
+    allow it. Only successful responses count as success for the circuit breaker. Error
+    responses with a message are not retried and only count as failure if they are not
+    expected (see __is_expected_error_response). Every attempt holds a slot of the request
+    limits of the node until its response body is read.
 
     Args:
         node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
         endpoint (str): Endpoint which will be called
         calldata_type (CalldataType): The type of calldata submitted with the request
         provided_validators (List[str]): Validator indices or pubkey to get information for
+        projection (Callable[[Any], Any] | None): Function which reduces every element of a streamed data array # pylint: disable=line-too-long
+        request_started (Event | None): Event which is set when the request leaves the queue
+        response_received (Event | None): Event which is set when the node answered with the response headers or the attempt failed # pylint: disable=line-too-long
 
     Returns:
-        Response: Response object with data provided by the endpoint
+        ApiResponse | None: Response with data provided by the endpoint or None if no data could be fetched # pylint: disable=line-too-long
     """
-    is_request_successful = False
-    response = Response()
     calldata = __get_processed_calldata(provided_validators, calldata_type)
-    retry_counter = 0
-    retry_limit = 3
-    while not is_request_successful and retry_counter < retry_limit:
+    node_url = node_connection_properties.url
+    attempt = 1
+    is_request_allowed = retry_engine.is_request_allowed(node_url, attempt)
+    if not is_request_allowed:
+        return None
+    while is_request_allowed:
+        is_ssz_requested = __is_ssz_requested(
+            node_connection_properties, endpoint, provided_validators
+        )
         try:
-            retry_counter += 1
-            response = __send_api_request(
-                node_connection_properties, endpoint, calldata, calldata_type
+            async with request_limiter.limit(node_url):
+                if request_started:
+                    request_started.set()
+                try:
+                    response = await __send_api_request(
+                        node_connection_properties,
+                        endpoint,
+                        calldata,
+                        calldata_type,
+                        is_ssz_requested,
+                    )
+                finally:
+                    if response_received:
+                        response_received.set()
+                try:
+                    __check_payload_size(
+                        response,
+                        node_connection_properties,
+                        endpoint,
+                        provided_validators,
+                    )
+                    __check_ssz_support(response, is_ssz_requested)
+                    api_response = await __decode_successful_response(
+                        response, endpoint, node_url, projection
+                    )
+                except PrysmError:
+                    if not __is_expected_error_response(
+                        response, node_connection_properties, endpoint
+                    ):
+                        retry_engine.record_failure(node_url)
+                    return None
+                finally:
+                    await response.aclose()
+            if is_ssz_requested:
+                ssz_negotiator.record_format(
+                    node_url, endpoint, __is_ssz_response(response)
+                )
+            retry_engine.record_success(node_url)
+            if calldata_type != CalldataType.NONE:
+                chunk_size_controller.record_success(
+                    endpoint,
+                    node_url,
+                    len(provided_validators),
+                    __get_max_chunk_size(calldata_type),
+                    response.elapsed.total_seconds(),
+                    response.num_bytes_downloaded,
+                )
+            return api_response
+        except SszNotSupportedError:
+            ssz_negotiator.record_format(node_url, endpoint, False)
+            __LOGGER.warning(logging.SSZ_FALLBACK_MESSAGE, node_url, endpoint)
+            continue
+        except ReadTimeout:
+            if calldata_type != CalldataType.NONE:
+                chunk_size_controller.record_failure(
+                    endpoint, node_url, len(provided_validators)
+                )
+            __LOGGER.error(
+                logging.READ_TIMEOUT_ERROR_MESSAGE,
+                node_connection_properties.node_type.value,
+                node_url,
             )
-            response.close()
-            is_request_successful = __is_request_successful(
-                response, node_connection_properties.url
+        except (KeyError, DecodingError):
+            __LOGGER.error(
+                logging.READ_TIMEOUT_ERROR_MESSAGE,
+                node_connection_properties.node_type.value,
+                node_url,
             )
-        except RequestsConnectionError:
+        except (RuntimeError, ValueError):
             __LOGGER.error(
-                logging.CONNECTION_ERROR_MESSAGE,
+                logging.INVALID_RESPONSE_ERROR_MESSAGE,
                 node_connection_properties.node_type.value,
-                node_connection_properties.url,
+                node_url,
             )
-            await sleep(program.REQUEST_CONNECTION_ERROR_WAITING_TIME)
-        except (ReadTimeout, KeyError):
+        except TransportError:
             __LOGGER.error(
-                logging.READ_TIMEOUT_ERROR_MESSAGE,
+                logging.CONNECTION_ERROR_MESSAGE,
                 node_connection_properties.node_type.value,
-                node_connection_properties.url,
+                node_url,
             )
-            await sleep(program.REQUEST_READ_TIMEOUT_ERROR_WAITING_TIME)
-        except PrysmError:
-            return Response()
-        __log_too_many_retries(retry_counter, retry_limit, node_connection_properties)
-    return response
+        retry_engine.record_failure(node_url)
+        retry_delay = retry_engine.policy.get_delay(attempt)
+        attempt += 1
+        is_request_allowed = retry_engine.is_request_allowed(node_url, attempt)
+        if is_request_allowed:
+            __LOGGER.debug(
+                logging.RETRY_REQUEST_MESSAGE, node_url, round(retry_delay, 2)
+            )
+            await sleep(retry_delay)
+    __log_failed_request(node_connection_properties)
+    return None
 
 
-def __log_too_many_retries(
-    retry_counter: int,
-    retry_limit: int,
+def __check_payload_size(
+    response: Response,
     node_connection_properties: NodeConnectionProperties,
+    endpoint: str,
+    provided_validators: List[str],
 ) -> None:
-    """Log if too many api request retries are performed
+    """Check whether the node rejected the request because of its size
 
     Args:
-        retry_counter (int): Count the number of request retries
+        response (Response): Response object from the api call
         node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+        endpoint (str): Called endpoint
+        provided_validators (List[str]): Validator indices or pubkeys sent with the request
+
+    Raises:
+        PayloadTooLargeError: Raised if the node answered with 413 or 414
     """
-    if retry_counter == retry_limit:
-        __LOGGER.error(
-            logging.NO_RESPONSE_ERROR_MESSAGE, node_connection_properties.url
+    if response.status_code in program.PAYLOAD_TOO_LARGE_STATUS_CODES:
+        chunk_size_controller.record_failure(
+            endpoint, node_connection_properties.url, len(provided_validators)
+        )
+        raise PayloadTooLargeError()
+
+
+def __is_expected_error_response(
+    response: Response,
+    node_connection_properties: NodeConnectionProperties,
+    endpoint: str,
+) -> bool:
+    """Check whether an error response with a message is expected and therefore does not
+    indicate a failing node. These are client errors (e.g. unknown validators) and the 500
+    of prysm validator clients for remote keystores if web3signer is not configured.
+
+    Args:
+        response (Response): Response object from the api call
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+        endpoint (str): Called endpoint
+
+    Returns:
+        bool: True if the error response does not count as failure for the circuit breaker
+    """
+    return response.is_client_error or (
+        node_connection_properties.node_type == NodeType.VALIDATOR
+        and endpoint == endpoints.REMOTE_KEYSTORES_ENDPOINT
+    )
+
+
+def __is_ssz_requested(
+    node_connection_properties: NodeConnectionProperties,
+    endpoint: str,
+    provided_validators: List[str],
+) -> bool:
+    """Check whether the response should be requested SSZ encoded. Requests without
+    validators (block proposing duties and dependent root requests) are sent as json, since
+    their body does not grow with the number of validators and only json bodies carry the
+    dependent root.
+
+    Args:
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+        endpoint (str): Endpoint which will be called
+        provided_validators (List[str]): Validator indices or pubkeys sent with the request
+
+    Returns:
+        bool: True if SSZ is enabled and supported by the node for the endpoint
+    """
+    return (
+        ARGUMENTS.ssz
+        and len(provided_validators) > 0
+        and node_connection_properties.node_type == NodeType.BEACON
+        and ssz_negotiator.is_ssz_supported(node_connection_properties.url, endpoint)
+    )
+
+
+def __check_ssz_support(response: Response, is_ssz_requested: bool) -> None:
+    """Check whether the node rejected the request because of the requested SSZ encoding
+
+    Args:
+        response (Response): Response object from the api call
+        is_ssz_requested (bool): Whether or not SSZ was requested
+
+    Raises:
+        SszNotSupportedError: Raised if the node answered with 406 or 415 to a SSZ request
+    """
+    if (
+        is_ssz_requested
+        and response.status_code in program.UNSUPPORTED_CONTENT_TYPE_STATUS_CODES
+    ):
+        raise SszNotSupportedError()
+
+
+def __is_ssz_response(response: Response) -> bool:
+    """Check whether the response body is SSZ encoded
+
+    Args:
+        response (Response): Response object from the api call
+
+    Returns:
+        bool: True if the response is SSZ encoded
+    """
+    return response.headers.get("content-type", "").startswith(program.SSZ_CONTENT_TYPE)
+
+
+def __log_failed_request(
+    node_connection_properties: NodeConnectionProperties,
+) -> None:
+    """Log that no data could be fetched from the node
+
+    Args:
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+    """
+    __LOGGER.error(logging.NO_RESPONSE_ERROR_MESSAGE, node_connection_properties.url)
+    if node_connection_properties.bearer_token:
+        __LOGGER.warning(
+            logging.NO_FETCHED_VALIDATOR_IDENTIFIERS_MESSAGE,
+            node_connection_properties.url,
         )
-        if node_connection_properties.bearer_token:
-            __LOGGER.warning(
-                logging.NO_FETCHED_VALIDATOR_IDENTIFIERS_MESSAGE,
-                node_connection_properties.url,
-            )
 
 
-def __send_api_request(
+async def __send_api_request(
     node_connection_properties: NodeConnectionProperties,
     endpoint: str,
     calldata: str,
     calldata_type: CalldataType,
+    is_ssz_requested: bool = False,
 ) -> Response:
-    """Send consensus layer beacon or validator node api request
+    """Send consensus layer beacon or validator node api request. Only the headers are read,
+    the body is streamed and decoded by the compression manager. The caller holds the
+    request limits of the node until the body is read.
 
     Args:
         node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
         endpoint (str): API endpoint
         calldata (str): Data which is send alongside the request
         calldata_type (CalldataType): Type of calldata
+        is_ssz_requested (bool): If True a SSZ encoded response is preferred
 
     Returns:
         Response: Request response
     """
-    response = Response()
-    header = get_correct_request_header(node_connection_properties)
-    match calldata_type:
-        case CalldataType.REQUEST_DATA:
-            response = post(
-                url=f"{node_connection_properties.url}{endpoint}",
-                data=calldata,
-                timeout=program.REQUEST_TIMEOUT,
-                headers=header,
-            )
-        case CalldataType.PARAMETERS:
-            parameters = urlencode({"id": calldata}, safe=",")
-            response = get(
-                url=f"{node_connection_properties.url}{endpoint}",
-                params=parameters,
-                timeout=program.REQUEST_TIMEOUT,
-                headers=header,
-            )
-        case _:
-            response = get(
-                url=f"{node_connection_properties.url}{endpoint}",
-                timeout=program.REQUEST_TIMEOUT,
-                headers=header,
-            )
-    response.close()
-    return response
+    client = connection_pool.get_client(node_connection_properties.url)
+    header = {
+        **get_correct_request_header(node_connection_properties),
+        "Accept-Encoding": compression_manager.get_accept_encoding(
+            node_connection_properties.url
+        ),
+    }
+    if is_ssz_requested:
+        header["Accept"] = program.SSZ_ACCEPT_HEADER
+    url = f"{node_connection_properties.url}{endpoint}"
+    start_time = perf_counter()
+    is_error = True
+    try:
+        match calldata_type:
+            case CalldataType.REQUEST_DATA:
+                request = client.build_request(
+                    "POST", url=url, content=calldata, headers=header
+                )
+            case CalldataType.PARAMETERS:
+                # build query manually to keep commas unescaped and the url short
+                parameters = urlencode({"id": calldata}, safe=",")
+                request = client.build_request(
+                    "GET", url=f"{url}?{parameters}", headers=header
+                )
+            case _:
+                request = client.build_request("GET", url=url, headers=header)
+        response = await client.send(request, stream=True)
+        is_error = response.is_server_error
+        return response
+    finally:
+        __get_node_manager(node_connection_properties).record_response(
+            node_connection_properties, perf_counter() - start_time, is_error
+        )
+
+
+def __get_node_manager(
+    node_connection_properties: NodeConnectionProperties,
+) -> NodeManager:
+    """Get the node manager which is responsible for the provided node
+
+    Args:
+        node_connection_properties (NodeConnectionProperties): Object with respective connection information # pylint: disable=line-too-long
+
+    Returns:
+        NodeManager: Beacon or validator node manager
+    """
+    if node_connection_properties.node_type == NodeType.BEACON:
+        return beacon_node
+    return validator_node
 
 
 def __convert_to_raw_data_responses(
-    raw_responses: List[Response], flatten: bool
+    raw_responses: List[ApiResponse | None], flatten: bool
 ) -> List[Any]:
     """Creates a list with raw data response objects
 
     Args:
-        raw_responses (List[Response]): List of fetched responses
+        raw_responses (List[ApiResponse | None]): List of fetched responses
         flatten (bool): Should a possible list of lists be flattend. This assumes some knowledge about the handled data strucutes. # pylint: disable=line-too-long
 
     Returns:
         List[Any]: List of raw data objects from raw response objects
     """
     responses_with_status_code = [
-        response for response in raw_responses if response.status_code
+        response for response in raw_responses if response is not None
     ]
     if responses_with_status_code:
         if flatten:
             return list(
-                chain(
-                    *[
-                        raw_response.json()[json.RESPONSE_JSON_DATA_FIELD_NAME]
-                        for raw_response in responses_with_status_code
-                    ]
+                chain.from_iterable(
+                    raw_response.data for raw_response in responses_with_status_code
                 )
             )
-        return [
-            raw_response.json()[json.RESPONSE_JSON_DATA_FIELD_NAME]
-            for raw_response in responses_with_status_code
-        ]
+        return [raw_response.data for raw_response in responses_with_status_code]
     raise NoDataFromEndpointError()
 
 
@@ -292,27 +863,61 @@ def __get_processed_calldata(
     return calldata
 
 
-def __is_request_successful(response: Response, node_url: str) -> bool:
-    """Helper to check if a request was successful
+async def __decode_successful_response(
+    response: Response,
+    endpoint: str,
+    node_url: str,
+    projection: Callable[[Any], Any] | None = None,
+) -> ApiResponse:
+    """Decode the response body once and check if the request was successful. If a projection
+    is provided, the data array of a successful response is decoded while it is streamed.
+    SSZ encoded responses are decoded into the structure of the json api. Compressed bodies
+    are decompressed by the compression manager.
 
     Args:
         response (Response): Response object from the api call
+        endpoint (str): Called endpoint
         node_url (str): Url to which the request was sent
+        projection (Callable[[Any], Any] | None): Function which reduces every element of a streamed data array # pylint: disable=line-too-long
 
     Raises:
         RuntimeError: Raised when reponse is totally empty
         KeyError: Raised if no data field is within the response object
         PrysmError: Specific error for prysm which returns 500 if you send a request to fetch remote keystores but web3signer flags are not set # pylint: disable=line-too-long
+        SszNotSupportedError: Raised if a SSZ response could not be decoded
+        DecodingError: Raised if a compressed response could not be decompressed
 
     Returns:
-        bool: True if request was successful
+        ApiResponse: Response with the decoded data field
     """
-    if not response.text:
+    if response.is_success and __is_ssz_response(response):
+        content = await compression_manager.read_decoded_bytes(response, endpoint)
+        try:
+            data = decode_ssz_data(endpoint, content)
+        except ValueError as error:
+            raise SszNotSupportedError() from error
+        if projection:
+            data = [projection(element) for element in data]
+        return ApiResponse(response, data)
+    if projection and response.is_success:
+        return ApiResponse(
+            response,
+            await decode_streamed_data(
+                compression_manager.iter_decoded_bytes(response, endpoint), projection
+            ),
+        )
+    content = await compression_manager.read_decoded_bytes(response, endpoint)
+    if not content:
         __LOGGER.error(response)
         raise RuntimeError(logging.NO_RESPONSE_ERROR_MESSAGE, node_url)
-    if json.RESPONSE_JSON_DATA_FIELD_NAME in response.json():
-        return True
-    if json.RESPONSE_JSON_MESSAGE_NAME in response.json():
+    decoded_response = decode_json(content)
+    if json.RESPONSE_JSON_DATA_FIELD_NAME in decoded_response:
+        return ApiResponse(
+            response,
+            decoded_response[json.RESPONSE_JSON_DATA_FIELD_NAME],
+            decoded_response.get(json.RESPONSE_JSON_DEPENDENT_ROOT_FIELD_NAME),
+        )
+    if json.RESPONSE_JSON_MESSAGE_NAME in decoded_response:
         raise PrysmError()
-    __LOGGER.error(response.text)
+    __LOGGER.error(content.decode(errors="replace"))
     raise KeyError(logging.NO_DATA_FIELD_IN_RESPONS_JSON_ERROR_MESSAGE)
@@ -0,0 +1,236 @@
+"""Module for decoding api responses
+"""
+
+from codecs import getincrementaldecoder
+from dataclasses import dataclass
+from enum import Enum
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, AsyncIterator, Callable, List, Tuple
+
+from constants import json, logging
+from httpx import Response
+
+try:
+    from orjson import loads as decode_json
+except ImportError:
+    from json import loads as decode_json  # type: ignore[assignment]
+
+
+@dataclass
+class ApiResponse:
+    """Api response with the decoded 'data' field of its json body and the dependent root
+    of duty responses"""
+
+    response: Response
+    data: Any
+    dependent_root: str | None = None
+
+
+@dataclass
+class DutyResponse:
+    """Flattened duties of all chunks of a duty request. The duties are complete if all chunks
+    were fetched and agree on the dependent root."""
+
+    duties: List[Any]
+    dependent_root: str | None
+    is_complete: bool
+
+
+class _DecoderState(Enum):
+    """Position of the streaming decoder within the json body"""
+
+    OBJECT_START = 0
+    KEY = 1
+    VALUE = 2
+    DATA_ARRAY_START = 3
+    DATA_ARRAY_ELEMENT = 4
+    DONE = 5
+
+
+class DataArrayDecoder:
+    """Incrementally decodes the elements of the top level 'data' array of a json body.
+    Every element is passed to the projection as soon as it is complete, so only the
+    projected elements and the unparsed rest of the last received chunk are held in memory.
+    """
+
+    def __init__(self, projection: Callable[[Any], Any]) -> None:
+        self.__projection = projection
+        self.__buffer = ""
+        self.__position = 0
+        self.__state = _DecoderState.OBJECT_START
+        self.__is_data_found = False
+        self.__text_decoder = getincrementaldecoder("utf-8")()
+        self.__json_decoder = JSONDecoder()
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Decode the provided part of the body
+
+        Args:
+            chunk (bytes): Next part of the response body
+
+        Returns:
+            List[Any]: Projected array elements which were completed by the chunk
+        """
+        self.__buffer = self.__buffer[self.__position :] + self.__text_decoder.decode(
+            chunk
+        )
+        self.__position = 0
+        projected_elements: List[Any] = []
+        while self.__state != _DecoderState.DONE and self.__decode_next(
+            projected_elements
+        ):
+            pass
+        return projected_elements
+
+    def close(self) -> None:
+        """Check that the complete body was decoded
+
+        Raises:
+            KeyError: Raised if the body is incomplete or does not include a 'data' array
+        """
+        if not self.__is_data_found or self.__state != _DecoderState.DONE:
+            raise KeyError(logging.NO_DATA_FIELD_IN_RESPONS_JSON_ERROR_MESSAGE)
+
+    def __decode_next(self, projected_elements: List[Any]) -> bool:
+        """Decode the next token of the current state. The position is only moved forward
+        if the token is complete.
+
+        Args:
+            projected_elements (List[Any]): List to which completed elements are appended
+
+        Returns:
+            bool: True if a token was decoded, False if more data is needed
+        """
+        position = self.__skip_whitespace(self.__position)
+        if position >= len(self.__buffer):
+            return False
+        character = self.__buffer[position]
+        match self.__state:
+            case _DecoderState.OBJECT_START:
+                if character != "{":
+                    raise KeyError(logging.NO_DATA_FIELD_IN_RESPONS_JSON_ERROR_MESSAGE)
+                self.__move_to(position + 1, _DecoderState.KEY)
+            case _DecoderState.KEY:
+                return self.__decode_key(position, character)
+            case _DecoderState.VALUE:
+                end = self.__decode_complete_value(position)
+                if end is None:
+                    return False
+                self.__move_to(end[1], _DecoderState.KEY)
+            case _DecoderState.DATA_ARRAY_START:
+                if character != "[":
+                    raise KeyError(logging.NO_DATA_FIELD_IN_RESPONS_JSON_ERROR_MESSAGE)
+                self.__is_data_found = True
+                self.__move_to(position + 1, _DecoderState.DATA_ARRAY_ELEMENT)
+            case _DecoderState.DATA_ARRAY_ELEMENT:
+                if character == "]":
+                    self.__move_to(position + 1, _DecoderState.KEY)
+                    return True
+                if character == ",":
+                    position = self.__skip_whitespace(position + 1)
+                element = self.__decode_complete_value(position)
+                if element is None:
+                    return False
+                projected_elements.append(self.__projection(element[0]))
+                self.__move_to(element[1], _DecoderState.DATA_ARRAY_ELEMENT)
+        return True
+
+    def __decode_key(self, position: int, character: str) -> bool:
+        """Decode the next key of the top level object including its colon
+
+        Args:
+            position (int): Position of the first non whitespace character
+            character (str): First non whitespace character
+
+        Returns:
+            bool: True if a key or the end of the object was decoded, False if more data is needed
+        """
+        if character == "}":
+            self.__move_to(position + 1, _DecoderState.DONE)
+            return True
+        if character == ",":
+            position = self.__skip_whitespace(position + 1)
+        key = self.__decode_complete_value(position)
+        if key is None:
+            return False
+        position = self.__skip_whitespace(key[1])
+        if position >= len(self.__buffer):
+            return False
+        if key[0] == json.RESPONSE_JSON_DATA_FIELD_NAME:
+            self.__move_to(position + 1, _DecoderState.DATA_ARRAY_START)
+        else:
+            self.__move_to(position + 1, _DecoderState.VALUE)
+        return True
+
+    def __decode_complete_value(self, position: int) -> Tuple[Any, int] | None:
+        """Decode the json value at the provided position. A value is only complete if it is
+        followed by another character, otherwise e.g. a number could be cut off.
+
+        Args:
+            position (int): Start position of the value
+
+        Returns:
+            Tuple[Any, int] | None: Decoded value and end position or None if more data is needed
+        """
+        try:
+            value, end = self.__json_decoder.raw_decode(self.__buffer, position)
+        except JSONDecodeError:
+            return None
+        if end >= len(self.__buffer):
+            return None
+        return value, end
+
+    def __skip_whitespace(self, position: int) -> int:
+        """Get the position of the next non whitespace character
+
+        Args:
+            position (int): Start position
+
+        Returns:
+            int: Position of the next non whitespace character
+        """
+        while position < len(self.__buffer) and self.__buffer[position] in " \t\n\r":
+            position += 1
+        return position
+
+    def __move_to(self, position: int, state: _DecoderState) -> None:
+        """Commit the decoded token
+
+        Args:
+            position (int): Position after the decoded token
+            state (_DecoderState): Next decoder state
+        """
+        self.__position = position
+        self.__state = state
+
+
+def decode_response(response: Response) -> Any:
+    """Decode the json body of the provided response. orjson is used if it is installed.
+
+    Args:
+        response (Response): Response object from the api call
+
+    Returns:
+        Any: Decoded json body
+    """
+    return decode_json(response.content)
+
+
+async def decode_streamed_data(
+    chunks: AsyncIterator[bytes], projection: Callable[[Any], Any]
+) -> List[Any]:
+    """Decode the 'data' array of a streamed response while it is received
+
+    Args:
+        chunks (AsyncIterator[bytes]): Decoded parts of the streamed response body
+        projection (Callable[[Any], Any]): Function which reduces every array element to the needed fields # pylint: disable=line-too-long
+
+    Returns:
+        List[Any]: Projected array elements
+    """
+    decoder = DataArrayDecoder(projection)
+    projected_elements: List[Any] = []
+    async for chunk in chunks:
+        projected_elements.extend(decoder.feed(chunk))
+    decoder.close()
+    return projected_elements
@@ -0,0 +1,209 @@
+"""Module for retrying failed requests and tripping unreliable nodes
+"""
+
+from dataclasses import dataclass
+from logging import getLogger
+from random import uniform
+from time import monotonic
+from typing import Dict
+
+from constants import logging, program
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter between the attempts of a request"""
+
+    max_attempts: int = program.REQUEST_RETRY_LIMIT
+    base_delay: float = program.REQUEST_RETRY_BASE_DELAY
+    max_delay: float = program.REQUEST_RETRY_MAX_DELAY
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the waiting time after the provided failed attempt. Half of the exponential delay
+        is randomized so that concurrent chunk requests do not retry in lockstep.
+
+        Args:
+            attempt (int): Number of the failed attempt starting with 1
+
+        Returns:
+            float: Waiting time in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + uniform(0, delay / 2)
+
+
+@dataclass
+class RetryBudget:
+    """Limits retries to a share of the sent requests. Every first attempt deposits a fraction
+    of a retry while every retry withdraws a full one. The budget starts full and holds at
+    most RETRY_BUDGET_MAX_TOKENS retries."""
+
+    balance: float = program.RETRY_BUDGET_MAX_TOKENS
+
+    def deposit(self) -> None:
+        """Deposit the retry share of a first attempt"""
+        self.balance = min(
+            self.balance + program.RETRY_BUDGET_RATIO, program.RETRY_BUDGET_MAX_TOKENS
+        )
+
+    def withdraw(self) -> bool:
+        """Withdraw a retry from the budget
+
+        Returns:
+            bool: True if a retry was left in the budget
+        """
+        if self.balance < 1:
+            return False
+        self.balance -= 1
+        return True
+
+
+@dataclass
+class CircuitBreaker:
+    """Trips after consecutive failed requests. While open, no requests are sent to the node.
+    After the open duration a single trial request is allowed (half open) which either closes
+    the breaker again or keeps it open for another open duration."""
+
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+    is_rejection_logged: bool = False
+
+    def is_open(self) -> bool:
+        """Check whether requests are currently rejected
+
+        Returns:
+            bool: True if the breaker is tripped and no trial request is due
+        """
+        return (
+            self.opened_at is not None
+            and monotonic() - self.opened_at < program.CIRCUIT_BREAKER_OPEN_DURATION
+        )
+
+    def is_request_allowed(self) -> bool:
+        """Check whether a request can be sent to the node. If a trial request is due, the
+        open duration restarts so that concurrent requests keep being rejected.
+
+        Returns:
+            bool: True if the breaker is closed or a trial request is due
+        """
+        if self.is_open():
+            return False
+        if self.opened_at is not None:
+            self.opened_at = monotonic()
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker"""
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.is_rejection_logged = False
+
+    def record_failure(self) -> bool:
+        """Count a failed request and trip the breaker if the threshold is reached
+
+        Returns:
+            bool: True if the breaker was closed before this failure
+        """
+        self.consecutive_failures += 1
+        if self.consecutive_failures < program.CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            return False
+        was_closed = self.opened_at is None
+        self.opened_at = monotonic()
+        self.is_rejection_logged = False
+        return was_closed
+
+
+class RetryEngine:
+    """Decides per node whether and when a failed request is retried"""
+
+    def __init__(self, policy: RetryPolicy = RetryPolicy()) -> None:
+        self.policy = policy
+        self.__circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.__retry_budgets: Dict[str, RetryBudget] = {}
+        self.__logger = getLogger()
+
+    def is_node_available(self, node_url: str) -> bool:
+        """Check whether the circuit breaker of the node is closed or allows a trial request
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            bool: True if requests can be sent to the node
+        """
+        return not self.__get_circuit_breaker(node_url).is_open()
+
+    def is_request_allowed(self, node_url: str, attempt: int) -> bool:
+        """Check whether an attempt of a request can be sent to the provided node. First attempts
+        deposit to the retry budget of the node while retries withdraw from it. The first
+        request which is rejected by an open circuit breaker is logged.
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+            attempt (int): Number of the attempt starting with 1
+
+        Returns:
+            bool: True if the attempt can be sent
+        """
+        if attempt > self.policy.max_attempts:
+            return False
+        circuit_breaker = self.__get_circuit_breaker(node_url)
+        if not circuit_breaker.is_request_allowed():
+            if not circuit_breaker.is_rejection_logged:
+                circuit_breaker.is_rejection_logged = True
+                self.__logger.warning(
+                    logging.CIRCUIT_BREAKER_REJECTED_REQUEST_MESSAGE, node_url
+                )
+            return False
+        retry_budget = self.__get_retry_budget(node_url)
+        if attempt == 1:
+            retry_budget.deposit()
+            return True
+        return retry_budget.withdraw()
+
+    def record_success(self, node_url: str) -> None:
+        """Record a successful request
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+        """
+        self.__get_circuit_breaker(node_url).record_success()
+
+    def record_failure(self, node_url: str) -> None:
+        """Record a failed request and log if the circuit breaker of the node trips
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+        """
+        if self.__get_circuit_breaker(node_url).record_failure():
+            self.__logger.warning(
+                logging.CIRCUIT_BREAKER_OPEN_MESSAGE,
+                node_url,
+                program.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                program.CIRCUIT_BREAKER_OPEN_DURATION,
+            )
+
+    def __get_circuit_breaker(self, node_url: str) -> CircuitBreaker:
+        """Get the circuit breaker of the provided node
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            CircuitBreaker: Circuit breaker of the node
+        """
+        return self.__circuit_breakers.setdefault(node_url, CircuitBreaker())
+
+    def __get_retry_budget(self, node_url: str) -> RetryBudget:
+        """Get the retry budget of the provided node
+
+        Args:
+            node_url (str): Url of the beacon or validator node
+
+        Returns:
+            RetryBudget: Retry budget of the node
+        """
+        return self.__retry_budgets.setdefault(node_url, RetryBudget())
+
+
+retry_engine = RetryEngine()
@@ -0,0 +1,230 @@
+"""Module for decoding SSZ encoded beacon api responses
+"""
+
+from struct import Struct
+from struct import error as StructError
+from typing import Any, Callable, Dict, List, Tuple
+
+from constants import endpoints
+from helper.general import get_endpoint_without_epoch
+
+__ATTESTER_DUTY = Struct("<48s6Q")
+__SYNC_COMMITTEE_DUTY_FIXED_PART = Struct("<48sQI")
+__VALIDATOR = Struct("<2Q48s32sQ?4Q")
+__UINT64 = Struct("<Q")
+__OFFSET = Struct("<I")
+
+
+def decode_attester_duties(content: bytes) -> List[Dict[str, Any]]:
+    """Decode a SSZ list of attester duties (fixed size of 96 bytes)
+
+    Args:
+        content (bytes): SSZ encoded response body
+
+    Returns:
+        List[Dict[str, Any]]: Attester duties in the structure of the json api
+    """
+    return [
+        {
+            "pubkey": f"0x{pubkey.hex()}",
+            "validator_index": str(validator_index),
+            "committee_index": str(committee_index),
+            "committee_length": str(committee_length),
+            "committees_at_slot": str(committees_at_slot),
+            "validator_committee_index": str(validator_committee_index),
+            "slot": str(slot),
+        }
+        for (
+            pubkey,
+            validator_index,
+            committee_index,
+            committee_length,
+            committees_at_slot,
+            validator_committee_index,
+            slot,
+        ) in __iterate_fixed_size_list(content, __ATTESTER_DUTY)
+    ]
+
+
+def decode_sync_committee_duties(content: bytes) -> List[Dict[str, Any]]:
+    """Decode a SSZ list of sync committee duties. The duties have a variable size because
+    of the list of sync committee indices, therefore the list starts with an offset per duty.
+
+    Args:
+        content (bytes): SSZ encoded response body
+
+    Raises:
+        ValueError: Raised if the offsets do not match the content
+
+    Returns:
+        List[Dict[str, Any]]: Sync committee duties in the structure of the json api
+    """
+    if not content:
+        return []
+    first_offset = __OFFSET.unpack_from(content)[0]
+    if first_offset % __OFFSET.size or first_offset > len(content):
+        raise ValueError("Invalid SSZ offsets")
+    number_of_duties = first_offset // __OFFSET.size
+    duty_offsets = [
+        __OFFSET.unpack_from(content, index * __OFFSET.size)[0]
+        for index in range(number_of_duties)
+    ] + [len(content)]
+    sync_committee_duties: List[Dict[str, Any]] = []
+    for start, end in zip(duty_offsets, duty_offsets[1:]):
+        if end - start < __SYNC_COMMITTEE_DUTY_FIXED_PART.size:
+            raise ValueError("Invalid SSZ offsets")
+        pubkey, validator_index, indices_offset = (
+            __SYNC_COMMITTEE_DUTY_FIXED_PART.unpack_from(content, start)
+        )
+        sync_committee_duties.append(
+            {
+                "pubkey": f"0x{pubkey.hex()}",
+                "validator_index": str(validator_index),
+                "validator_sync_committee_indices": [
+                    str(sync_committee_index)
+                    for (sync_committee_index,) in __iterate_fixed_size_list(
+                        content[start + indices_offset : end], __UINT64
+                    )
+                ],
+            }
+        )
+    return sync_committee_duties
+
+
+def decode_validators(content: bytes) -> List[Dict[str, Any]]:
+    """Decode a SSZ list of validators (index, balance and the 121 bytes validator container).
+    The status is not part of the SSZ encoding and needs to be derived from the epochs.
+
+    Args:
+        content (bytes): SSZ encoded response body
+
+    Returns:
+        List[Dict[str, Any]]: Validators in the structure of the json api without status
+    """
+    return [
+        {
+            "index": str(index),
+            "balance": str(balance),
+            "validator": {
+                "pubkey": f"0x{pubkey.hex()}",
+                "withdrawal_credentials": f"0x{withdrawal_credentials.hex()}",
+                "effective_balance": str(effective_balance),
+                "slashed": slashed,
+                "activation_eligibility_epoch": str(activation_eligibility_epoch),
+                "activation_epoch": str(activation_epoch),
+                "exit_epoch": str(exit_epoch),
+                "withdrawable_epoch": str(withdrawable_epoch),
+            },
+        }
+        for (
+            index,
+            balance,
+            pubkey,
+            withdrawal_credentials,
+            effective_balance,
+            slashed,
+            activation_eligibility_epoch,
+            activation_epoch,
+            exit_epoch,
+            withdrawable_epoch,
+        ) in __iterate_fixed_size_list(content, __VALIDATOR)
+    ]
+
+
+__DECODERS: List[Tuple[str, Callable[[bytes], List[Dict[str, Any]]]]] = [
+    (endpoints.ATTESTATION_DUTY_ENDPOINT, decode_attester_duties),
+    (endpoints.SYNC_COMMITTEE_DUTY_ENDPOINT, decode_sync_committee_duties),
+    (endpoints.VALIDATOR_STATUS_ENDPOINT, decode_validators),
+]
+
+
+class SszNegotiator:
+    """Remembers per node and endpoint whether SSZ responses are supported"""
+
+    def __init__(self) -> None:
+        self.__is_ssz_supported: Dict[Tuple[str, str], bool] = {}
+
+    def is_ssz_supported(self, node_url: str, endpoint: str) -> bool:
+        """Check whether SSZ should be requested for the provided node and endpoint. Nodes are
+        asked for SSZ until they answered with json once.
+
+        Args:
+            node_url (str): Url of the beacon node
+            endpoint (str): Endpoint which will be called
+
+        Returns:
+            bool: True if SSZ should be requested
+        """
+        return get_ssz_decoder(endpoint) is not None and self.__is_ssz_supported.get(
+            (node_url, get_endpoint_without_epoch(endpoint)), True
+        )
+
+    def record_format(self, node_url: str, endpoint: str, is_ssz: bool) -> None:
+        """Remember the format in which the node answered
+
+        Args:
+            node_url (str): Url of the beacon node
+            endpoint (str): Called endpoint
+            is_ssz (bool): Whether or not the node answered with SSZ
+        """
+        self.__is_ssz_supported[(node_url, get_endpoint_without_epoch(endpoint))] = (
+            is_ssz
+        )
+
+
+def decode_ssz_data(endpoint: str, content: bytes) -> List[Dict[str, Any]]:
+    """Decode the SSZ encoded data of the provided endpoint
+
+    Args:
+        endpoint (str): Called endpoint
+        content (bytes): SSZ encoded response body
+
+    Raises:
+        ValueError: Raised if the endpoint has no SSZ decoder or the content is malformed
+
+    Returns:
+        List[Dict[str, Any]]: Data in the structure of the json api
+    """
+    decoder = get_ssz_decoder(endpoint)
+    if decoder is None:
+        raise ValueError(f"No SSZ decoder for endpoint {endpoint}")
+    try:
+        return decoder(content)
+    except StructError as error:
+        raise ValueError("Malformed SSZ content") from error
+
+
+def get_ssz_decoder(endpoint: str) -> Callable[[bytes], List[Dict[str, Any]]] | None:
+    """Get the SSZ decoder for the data of the provided endpoint
+
+    Args:
+        endpoint (str): Called endpoint
+
+    Returns:
+        Callable[[bytes], List[Dict[str, Any]]] | None: Decoder or None if the endpoint is only requested as json # pylint: disable=line-too-long
+    """
+    for endpoint_prefix, decoder in __DECODERS:
+        if endpoint.startswith(endpoint_prefix):
+            return decoder
+    return None
+
+
+def __iterate_fixed_size_list(content: bytes, element: Struct) -> Any:
+    """Iterate over the elements of a SSZ list with fixed size elements
+
+    Args:
+        content (bytes): SSZ encoded list
+        element (Struct): Layout of a list element
+
+    Raises:
+        ValueError: Raised if the content is not a multiple of the element size
+
+    Returns:
+        Any: Iterator over the unpacked elements
+    """
+    if len(content) % element.size:
+        raise ValueError("Invalid SSZ list length")
+    return element.iter_unpack(content)
+
+
+ssz_negotiator = SszNegotiator()
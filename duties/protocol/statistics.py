@@ -0,0 +1,68 @@
+"""Module for node response statistics
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Deque
+
+from constants import program
+
+
+@dataclass
+class NodeStatistics:
+    """Exponential moving averages of response latency (in seconds) and error rate of a node"""
+
+    latency: float | None = None
+    error_rate: float = 0.0
+    recent_latencies: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=program.NODE_LATENCY_SAMPLE_SIZE)
+    )
+
+    def record(
+        self, latency: float, is_error: bool, is_health_check: bool = False
+    ) -> None:
+        """Update the moving averages with a new observation. Only api request latencies are
+        kept as recent latencies since health checks are much cheaper than duty requests.
+
+        Args:
+            latency (float): Observed response latency in seconds
+            is_error (bool): Whether or not the request failed
+            is_health_check (bool): Whether or not the observation stems from a health check
+        """
+        smoothing_factor = program.NODE_STATISTICS_SMOOTHING_FACTOR
+        self.error_rate += smoothing_factor * (float(is_error) - self.error_rate)
+        if is_error:
+            return
+        if not is_health_check:
+            self.recent_latencies.append(latency)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += smoothing_factor * (latency - self.latency)
+
+    def get_score(self) -> float:
+        """Get the expected cost of a request to the node where lower is better. Nodes without
+        any observed latency are preferred to collect data for them.
+
+        Returns:
+            float: Latency weighted by error rate
+        """
+        if self.latency is None:
+            return 0.0
+        return self.latency / max(1 - self.error_rate, program.MIN_NODE_SUCCESS_RATE)
+
+    def get_latency_percentile(self, percentile: float) -> float | None:
+        """Get the provided percentile of the recently observed successful api request latencies
+
+        Args:
+            percentile (float): Percentile between 0 and 100
+
+        Returns:
+            float | None: Latency percentile in seconds or None if not enough samples are present
+        """
+        if len(self.recent_latencies) < program.MIN_LATENCY_SAMPLES_FOR_PERCENTILE:
+            return None
+        sorted_latencies = sorted(self.recent_latencies)
+        index = max(ceil(percentile / 100 * len(sorted_latencies)) - 1, 0)
+        return sorted_latencies[index]
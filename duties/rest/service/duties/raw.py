@@ -32,7 +32,9 @@ async def fetch_raw_attestation_duties(
             fetch_upcoming_attestation_duties(),
             program.REST_RAW_DUTY_NO_BEACON_NODE_CONNECTION_TIMEOUT,
         )
-        return list(upcoming_attestation_duties.values())
+        return [
+            duty.to_validator_duty() for duty in upcoming_attestation_duties.values()
+        ]
     except AsyncioTimeoutError:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         return NoBeaconNodeConnection()
@@ -54,7 +56,9 @@ async def fetch_raw_sync_committeen_duties(
             fetch_upcoming_sync_committee_duties(),
             program.REST_RAW_DUTY_NO_BEACON_NODE_CONNECTION_TIMEOUT,
         )
-        return list(upcoming_sync_committee_duties.values())
+        return [
+            duty.to_validator_duty() for duty in upcoming_sync_committee_duties.values()
+        ]
     except AsyncioTimeoutError:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         return NoBeaconNodeConnection()
@@ -76,7 +80,7 @@ async def fetch_raw_proposing_duties(
             fetch_upcoming_proposing_duties(),
             program.REST_RAW_DUTY_NO_BEACON_NODE_CONNECTION_TIMEOUT,
         )
-        return list(upcoming_proposing_duties.values())
+        return [duty.to_validator_duty() for duty in upcoming_proposing_duties.values()]
     except AsyncioTimeoutError:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         return NoBeaconNodeConnection()
@@ -0,0 +1,56 @@
+"""Shared helpers for the benchmark scripts
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "duties"))
+
+NUMBER_OF_VALIDATORS = 1000
+
+
+def measure(function: Callable[[], Any], repetitions: int) -> float:
+    """Measure the mean runtime of the provided function
+
+    Args:
+        function (Callable[[], Any]): Function to measure
+        repetitions (int): Number of function calls
+
+    Returns:
+        float: Mean runtime in milliseconds
+    """
+    start_time = perf_counter()
+    for _ in range(repetitions):
+        function()
+    return (perf_counter() - start_time) / repetitions * 1000
+
+
+def create_validator_status_data(number_of_validators: int) -> List[Dict[str, Any]]:
+    """Create validator status data like returned by /eth/v1/beacon/states/head/validators
+
+    Args:
+        number_of_validators (int): Number of validators
+
+    Returns:
+        List[Dict[str, Any]]: Validator status data
+    """
+    return [
+        {
+            "index": str(index),
+            "balance": "32000000000",
+            "status": "active_ongoing",
+            "validator": {
+                "pubkey": f"0x{index:096x}",
+                "withdrawal_credentials": f"0x{index:064x}",
+                "effective_balance": "32000000000",
+                "slashed": False,
+                "activation_eligibility_epoch": "0",
+                "activation_epoch": "0",
+                "exit_epoch": "18446744073709551615",
+                "withdrawable_epoch": "18446744073709551615",
+            },
+        }
+        for index in range(number_of_validators)
+    ]
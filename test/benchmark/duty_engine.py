@@ -0,0 +1,75 @@
+"""Benchmark the offline duty engine with a mainnet sized validator set
+
+Run from the repository root: poetry run python test/benchmark/duty_engine.py
+"""
+
+from hashlib import sha256
+from time import perf_counter
+
+from common import measure
+from protocol import engine
+
+NUMBER_OF_VALIDATORS = 1_000_000
+NUMBER_OF_OWN_VALIDATORS = 100_000
+NUMBER_OF_CHECKED_INDICES = 100
+EPOCH = 300_000
+
+
+def __create_snapshot(number_of_validators: int) -> engine.StateSnapshot:
+    """Create a snapshot with active validators and a RANDAO mix for the benchmarked epoch
+
+    Args:
+        number_of_validators (int): Number of validators
+
+    Returns:
+        engine.StateSnapshot: Synthetic snapshot
+    """
+    return engine.StateSnapshot(
+        [f"0x{index:096x}" for index in range(number_of_validators)],
+        [0] * number_of_validators,
+        [2**64 - 1] * number_of_validators,
+        {
+            engine.get_randao_mix_index(EPOCH - engine.MIN_SEED_LOOKAHEAD - 1): sha256(
+                b"randao"
+            ).digest()
+        },
+        EPOCH,
+    )
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"Vectorized with numpy: {engine.numpy is not None}")
+    seed = sha256(b"seed").digest()
+    start_time = perf_counter()
+    shuffled_indices = engine.compute_shuffled_indices(NUMBER_OF_VALIDATORS, seed)
+    print(
+        f"Shuffle of {NUMBER_OF_VALIDATORS} validators: "
+        f"{(perf_counter() - start_time) * 1000:.0f} ms"
+    )
+    checked_indices = range(0, NUMBER_OF_VALIDATORS, NUMBER_OF_VALIDATORS // 100)
+    assert all(
+        shuffled_indices[index]
+        == engine.compute_shuffled_index(index, NUMBER_OF_VALIDATORS, seed)
+        for index in checked_indices
+    )
+    print(
+        "Single index shuffle: "
+        f"{measure(lambda: engine.compute_shuffled_index(1, NUMBER_OF_VALIDATORS, seed), NUMBER_OF_CHECKED_INDICES):.3f} ms"  # pylint: disable=line-too-long
+    )
+    duty_engine = engine.DutyEngine(__create_snapshot(NUMBER_OF_VALIDATORS))
+    own_validators = [str(index) for index in range(NUMBER_OF_OWN_VALIDATORS)]
+    start_time = perf_counter()
+    attestation_duties = duty_engine.get_attestation_duties(EPOCH, own_validators)
+    print(
+        f"Attester duties of {len(attestation_duties)} validators incl. shuffle: "
+        f"{(perf_counter() - start_time) * 1000:.0f} ms"
+    )
+    print(
+        f"Attester duties of {len(attestation_duties)} validators from cached shuffle: "
+        f"{measure(lambda: duty_engine.get_attestation_duties(EPOCH, own_validators), 3):.0f} ms"  # pylint: disable=line-too-long
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark the conversion of attester duty responses into internal duties per 10000 duties
+
+Run from the repository root: poetry run python test/benchmark/duty_records.py
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from common import measure
+
+# the fetcher package parses the command line arguments on import
+sys.argv = [sys.argv[0], "--validators", "1"]
+# pylint: disable-next=wrong-import-position
+from fetcher.data_types import DutyRecord, DutyType, ValidatorDuty
+
+NUMBER_OF_DUTIES = 10_000
+REPETITIONS = 20
+
+
+def __create_attestation_duty_data(number_of_duties: int) -> List[Dict[str, Any]]:
+    """Create attester duty data like returned by /eth/v1/validator/duties/attester/{epoch}
+
+    Args:
+        number_of_duties (int): Number of duties
+
+    Returns:
+        List[Dict[str, Any]]: Attester duty data
+    """
+    return [
+        {
+            "pubkey": f"0x{index:096x}",
+            "validator_index": str(index),
+            "committee_index": str(index % 64),
+            "committee_length": "500",
+            "committees_at_slot": "64",
+            "validator_committee_index": str(index % 500),
+            "slot": str(9_600_000 + index % 32),
+        }
+        for index in range(number_of_duties)
+    ]
+
+
+def __convert_to_validator_duties(data: List[Dict[str, Any]]) -> List[ValidatorDuty]:
+    """Convert the duties like before: validate the response and build the attestation duty
+
+    Args:
+        data (List[Dict[str, Any]]): Attester duty data
+
+    Returns:
+        List[ValidatorDuty]: Attestation duties
+    """
+    response_duties = [ValidatorDuty.model_validate(duty) for duty in data]
+    return [
+        ValidatorDuty(
+            pubkey=duty.pubkey,
+            validator_index=duty.validator_index,
+            slot=duty.slot,
+            type=DutyType.ATTESTATION,
+        )
+        for duty in response_duties
+    ]
+
+
+def __convert_to_duty_records(data: List[Dict[str, Any]]) -> List[DutyRecord]:
+    """Convert the duties into compact records
+
+    Args:
+        data (List[Dict[str, Any]]): Attester duty data
+
+    Returns:
+        List[DutyRecord]: Attestation duties
+    """
+    response_duties = [
+        DutyRecord.from_response(duty, DutyType.ATTESTATION) for duty in data
+    ]
+    return [
+        DutyRecord(duty.validator_index, duty.pubkey, DutyType.ATTESTATION, duty.slot)
+        for duty in response_duties
+    ]
+
+
+def __measure_allocations(function: Callable[[], List[Any]]) -> Tuple[float, float]:
+    """Measure the memory allocated during the conversion and retained by the duties
+
+    Args:
+        function (Callable[[], List[Any]]): Conversion to measure
+
+    Returns:
+        Tuple[float, float]: Peak and retained allocations in kB
+    """
+    tracemalloc.start()
+    duties = function()
+    retained_size, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del duties
+    return peak_size / 1000, retained_size / 1000
+
+
+def main() -> None:
+    """Run the benchmark"""
+    data = __create_attestation_duty_data(NUMBER_OF_DUTIES)
+    for name, function in [
+        ("Before (pydantic)", lambda: __convert_to_validator_duties(data)),
+        ("After (records)", lambda: __convert_to_duty_records(data)),
+    ]:
+        peak_size, retained_size = __measure_allocations(function)
+        print(
+            f"{name}: {measure(function, REPETITIONS):.1f} ms, "
+            f"{peak_size:.0f} kB peak and {retained_size:.0f} kB retained allocations "
+            f"per {NUMBER_OF_DUTIES} duties"
+        )
+    assert [
+        duty.to_validator_duty() for duty in __convert_to_duty_records(data)
+    ] == __convert_to_validator_duties(data)
+
+
+if __name__ == "__main__":
+    main()
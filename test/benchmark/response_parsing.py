@@ -0,0 +1,53 @@
+"""Benchmark json decoding of a validator status response per 1000 validators
+
+Run from the repository root: poetry run python test/benchmark/response_parsing.py
+"""
+
+from json import dumps
+
+from common import NUMBER_OF_VALIDATORS, create_validator_status_data, measure
+from httpx import Response
+from protocol.response import decode_json, decode_response
+
+REPETITIONS = 200
+
+
+def __decode_repeatedly(response: Response) -> None:
+    """Decode the response like before: once for the success check and once for the data
+
+    Args:
+        response (Response): Validator status response
+    """
+    _ = "data" in response.json()
+    _ = response.json()["data"]
+
+
+def __decode_once(response: Response) -> None:
+    """Decode the response once
+
+    Args:
+        response (Response): Validator status response
+    """
+    _ = decode_response(response)["data"]
+
+
+def main() -> None:
+    """Run the benchmark"""
+    response = Response(
+        200,
+        content=dumps(
+            {"data": create_validator_status_data(NUMBER_OF_VALIDATORS)}
+        ).encode(),
+    )
+    print(f"Response size: {len(response.content) / 1000:.0f} kB")
+    print(f"JSON backend: {decode_json.__module__}")
+    print(
+        f"Before (decode twice): {measure(lambda: __decode_repeatedly(response), REPETITIONS):.2f} ms"  # pylint: disable=line-too-long
+    )
+    print(
+        f"After (decode once): {measure(lambda: __decode_once(response), REPETITIONS):.2f} ms"  # pylint: disable=line-too-long
+    )
+
+
+if __name__ == "__main__":
+    main()
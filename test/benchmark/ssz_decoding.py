@@ -0,0 +1,145 @@
+"""Benchmark bytes on the wire and decode time of json and SSZ encoded responses
+per 1000 validators
+
+Run from the repository root: poetry run python test/benchmark/ssz_decoding.py
+"""
+
+from json import dumps
+from struct import pack
+from typing import Any, Callable, Dict, List
+
+from common import (
+    NUMBER_OF_VALIDATORS,
+    create_validator_status_data,
+    measure,
+)
+from protocol.response import decode_json
+from protocol.ssz import decode_attester_duties, decode_validators
+
+REPETITIONS = 200
+
+
+def __create_attester_duty_data(number_of_validators: int) -> List[Dict[str, Any]]:
+    """Create attester duty data like returned by /eth/v1/validator/duties/attester/<epoch>
+
+    Args:
+        number_of_validators (int): Number of validators
+
+    Returns:
+        List[Dict[str, Any]]: Attester duty data
+    """
+    return [
+        {
+            "pubkey": f"0x{index:096x}",
+            "validator_index": str(index),
+            "committee_index": str(index % 64),
+            "committee_length": "500",
+            "committees_at_slot": "64",
+            "validator_committee_index": str(index % 500),
+            "slot": str(320_000 + index % 32),
+        }
+        for index in range(number_of_validators)
+    ]
+
+
+def __encode_attester_duties(data: List[Dict[str, Any]]) -> bytes:
+    """Encode attester duties as SSZ list
+
+    Args:
+        data (List[Dict[str, Any]]): Attester duty data
+
+    Returns:
+        bytes: SSZ encoded attester duties
+    """
+    return b"".join(
+        pack(
+            "<48s6Q",
+            bytes.fromhex(duty["pubkey"][2:]),
+            int(duty["validator_index"]),
+            int(duty["committee_index"]),
+            int(duty["committee_length"]),
+            int(duty["committees_at_slot"]),
+            int(duty["validator_committee_index"]),
+            int(duty["slot"]),
+        )
+        for duty in data
+    )
+
+
+def __encode_validators(data: List[Dict[str, Any]]) -> bytes:
+    """Encode validators as SSZ list
+
+    Args:
+        data (List[Dict[str, Any]]): Validator status data
+
+    Returns:
+        bytes: SSZ encoded validators
+    """
+    return b"".join(
+        pack(
+            "<2Q48s32sQ?4Q",
+            int(validator["index"]),
+            int(validator["balance"]),
+            bytes.fromhex(validator["validator"]["pubkey"][2:]),
+            bytes.fromhex(validator["validator"]["withdrawal_credentials"][2:]),
+            int(validator["validator"]["effective_balance"]),
+            validator["validator"]["slashed"],
+            int(validator["validator"]["activation_eligibility_epoch"]),
+            int(validator["validator"]["activation_epoch"]),
+            int(validator["validator"]["exit_epoch"]),
+            int(validator["validator"]["withdrawable_epoch"]),
+        )
+        for validator in data
+    )
+
+
+def __compare(
+    name: str,
+    data: List[Dict[str, Any]],
+    encode_ssz: Callable[[List[Dict[str, Any]]], bytes],
+    decode_ssz: Callable[[bytes], List[Dict[str, Any]]],
+) -> None:
+    """Print size and decode time of both encodings
+
+    Args:
+        name (str): Name of the compared data
+        data (List[Dict[str, Any]]): Data in the structure of the json api
+        encode_ssz (Callable[[List[Dict[str, Any]]], bytes]): SSZ encoder
+        decode_ssz (Callable[[bytes], List[Dict[str, Any]]]): SSZ decoder
+    """
+    json_content = dumps({"data": data}).encode()
+    ssz_content = encode_ssz(data)
+    assert decode_ssz(ssz_content) == data
+    print(f"{name}:")
+    print(
+        f"  json: {len(json_content) / 1000:.0f} kB, "
+        f"{measure(lambda: decode_json(json_content), REPETITIONS):.2f} ms"
+    )
+    print(
+        f"  ssz: {len(ssz_content) / 1000:.0f} kB, "
+        f"{measure(lambda: decode_ssz(ssz_content), REPETITIONS):.2f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark"""
+    print(f"JSON backend: {decode_json.__module__}")
+    __compare(
+        "Attester duties",
+        __create_attester_duty_data(NUMBER_OF_VALIDATORS),
+        __encode_attester_duties,
+        decode_attester_duties,
+    )
+    __compare(
+        "Validators",
+        [
+            {key: value for key, value in validator.items() if key != "status"}
+            for validator in create_validator_status_data(NUMBER_OF_VALIDATORS)
+        ],
+        __encode_validators,
+        decode_validators,
+    )
+
+
+if __name__ == "__main__":
+    main()
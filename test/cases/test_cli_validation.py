@@ -191,3 +191,219 @@ def test_cicd_attestation_proportion_flag_validation() -> int:
         True,
         True,
     )
+
+
+def test_connection_pool_size_flag_validation() -> int:
+    """Test connection pool size validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = ["The connection pool size should be greater or equal 1"]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--connection-pool-size",
+        "0",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "connection pool size flag validation",
+        "ValueError:",
+        True,
+        True,
+    )
+
+
+def test_beacon_node_selection_flag_validation() -> int:
+    """Test beacon node selection validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = ["argument --beacon-node-selection: invalid"]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--beacon-node-selection",
+        "slowest",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "beacon node selection flag validation",
+        "error: argument",
+        True,
+        True,
+    )
+
+
+def test_hedge_percentile_flag_validation() -> int:
+    """Test hedge percentile validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = [
+        "The value for flag '--hedge-percentile' should be between 0 and 100"
+    ]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--hedge-requests",
+        "--hedge-percentile",
+        "0",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "hedge percentile flag validation",
+        "ValueError:",
+        True,
+        True,
+    )
+
+
+def test_max_concurrent_requests_flag_validation() -> int:
+    """Test max concurrent requests validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = [
+        "The value for flag '--max-concurrent-requests' should be greater or equal 1"
+    ]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--max-concurrent-requests",
+        "0",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "max concurrent requests flag validation",
+        "ValueError:",
+        True,
+        True,
+    )
+
+
+def test_max_requests_per_second_flag_validation() -> int:
+    """Test max requests per second validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = [
+        "The value for flag '--max-requests-per-second' should be greater or equal 0"
+    ]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--max-requests-per-second",
+        "-1",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "max requests per second flag validation",
+        "ValueError:",
+        True,
+        True,
+    )
+
+
+def test_no_compression_nodes_flag_validation() -> int:
+    """Test no compression nodes validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = ["Provided node url should start with http or https"]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--no-compression-nodes",
+        "localhost:5052",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "no compression nodes flag validation",
+        "KeyError:",
+        True,
+        True,
+    )
+
+
+def test_prefetch_slots_flag_validation() -> int:
+    """Test prefetch slots validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = ["The number of prefetch slots should be between 0 and 31"]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--prefetch-slots",
+        "32",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "prefetch slots flag validation",
+        "ValueError:",
+        True,
+        True,
+    )
+
+
+def test_state_snapshot_file_flag_validation() -> int:
+    """Test state snapshot file validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = ["The file passed with '--state-snapshot-file'"]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--state-snapshot-file",
+        str(Path.cwd() / "test/data/missing-state-snapshot.json"),
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "state snapshot file flag validation",
+        "ValueError:",
+        True,
+        True,
+    )
+
+
+def test_max_interval_flag_validation() -> int:
+    """Test max interval validation
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = ["Passed seconds for '--max-interval' (20) need to be 0"]
+    command = get_eth_duties_entry_point() + [
+        "--validators",
+        "1",
+        "--interval",
+        "24",
+        "--max-interval",
+        "20",
+    ]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "max interval flag validation",
+        "argparse.ArgumentError",
+        True,
+        True,
+    )
@@ -0,0 +1,149 @@
+"""Module with functions to test the offline duty engine against recorded vectors. The
+vectors were computed with the consensus specification (eth2spec) and do not need a beacon
+node.
+"""
+
+from hashlib import sha256
+from json import loads
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# pylint: disable-next=import-error
+from protocol import engine
+from sty import fg  # type: ignore[import]
+from test_helper.general import print_test_message
+
+VECTORS_FILE = Path.cwd() / "test/data/duty-engine-vectors.json"
+STATE_SNAPSHOT_FILE = Path.cwd() / "test/data/state-snapshot.json"
+STATE_SNAPSHOT_DUTIES_FILE = Path.cwd() / "test/data/state-snapshot-duties.json"
+
+
+def __run_engine_test(test_message: str, test: Callable[[], None]) -> int:
+    """Wrapper to run an engine test
+
+    Args:
+        test_message (str): Message printed to the console
+        test (Callable[[], None]): Test which asserts the computed duties
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    print_test_message(test_message=test_message)
+    try:
+        test()
+        print(fg.green + "Test succeeded\n" + fg.rs)
+        return 1
+    except AssertionError:
+        print(fg.red + "Test Failed\n" + fg.rs)
+        return 0
+
+
+def __read_json(file_path: Path) -> Any:
+    """Read a json test data file
+
+    Args:
+        file_path (Path): Path to the file
+
+    Returns:
+        Any: Decoded content
+    """
+    return loads(file_path.read_text(encoding="utf-8"))
+
+
+def __test_shuffling() -> None:
+    """Compare the single index and the complete shuffle with the shuffle vectors. The
+    complete shuffle is tested with and without numpy."""
+    numpy = engine.numpy
+    try:
+        for vector in __read_json(VECTORS_FILE)["shuffling"]:
+            seed = bytes.fromhex(vector["seed"].removeprefix("0x"))
+            assert [
+                engine.compute_shuffled_index(index, vector["count"], seed)
+                for index in range(vector["count"])
+            ] == vector["mapping"]
+            assert (
+                engine.compute_shuffled_indices(vector["count"], seed)
+                == vector["mapping"]
+            )
+            engine.numpy = None
+            assert (
+                engine.compute_shuffled_indices(vector["count"], seed)
+                == vector["mapping"]
+            )
+            engine.numpy = numpy
+    finally:
+        engine.numpy = numpy
+
+
+def __test_committees() -> None:
+    """Compare the attester duties with the committee vector of a validator set with
+    several committees per slot"""
+    vector = __read_json(VECTORS_FILE)["committees"]
+    number_of_validators = vector["number_of_validators"]
+    snapshot = engine.StateSnapshot(
+        [
+            f"0x{sha256(index.to_bytes(4, 'little')).hexdigest()}{'00' * 16}"
+            for index in range(number_of_validators)
+        ],
+        [0] * number_of_validators,
+        [2**64 - 1] * number_of_validators,
+        {
+            engine.get_randao_mix_index(
+                vector["epoch"] - engine.MIN_SEED_LOOKAHEAD - 1
+            ): bytes.fromhex(vector["randao_mix"].removeprefix("0x"))
+        },
+        vector["epoch"],
+    )
+    duty_engine = engine.DutyEngine(snapshot)
+    assert (
+        duty_engine.get_attestation_duties(vector["epoch"], vector["validators"])
+        == vector["attestation_duties"]
+    )
+
+
+def __test_recorded_state() -> None:
+    """Compare the attester duties computed from the recorded state snapshot with the duties
+    of the consensus specification. The snapshot includes the genesis mixes as well as
+    pending and exited validators."""
+    snapshot = engine.load_state_snapshot(str(STATE_SNAPSHOT_FILE))
+    expected_duties: Dict[str, Any] = __read_json(STATE_SNAPSHOT_DUTIES_FILE)
+    validators: List[str] = expected_duties["validators"]
+    duty_engine = engine.DutyEngine(snapshot)
+    for epoch, duties in expected_duties["attestation_duties"].items():
+        assert duty_engine.get_attestation_duties(int(epoch), validators) == duties
+    assert duty_engine.can_compute_attestation_duties(snapshot.epoch + 1, validators)
+    assert not duty_engine.can_compute_attestation_duties(
+        snapshot.epoch + 2, validators
+    )
+    assert not duty_engine.can_compute_attestation_duties(
+        snapshot.epoch, [str(len(snapshot.pubkeys))]
+    )
+
+
+def test_shuffling_vectors() -> int:
+    """Test the swap-or-not shuffle
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    return __run_engine_test("duty engine shuffling vectors", __test_shuffling)
+
+
+def test_committee_vectors() -> int:
+    """Test the attester committees
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    return __run_engine_test("duty engine committee vectors", __test_committees)
+
+
+def test_duties_from_recorded_state() -> int:
+    """Test the attester duties of a recorded state snapshot
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    return __run_engine_test(
+        "duty engine duties from recorded state", __test_recorded_state
+    )
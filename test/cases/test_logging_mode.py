@@ -303,3 +303,31 @@ def test_standard_logging_mode_when_identifiers_fetched_from_validator_nodes() -
             "couldn't be fetched correctly from the beacon client\n" + fg.rs
         )
         return 0
+
+
+def test_cached_duties_with_ssz() -> int:
+    """Test whether SSZ encoded duties are cached although SSZ responses do not include the
+    dependent root
+
+    Returns:
+        int: Whether or not test succeeds while 1 is success and 0 is failure
+    """
+    expected_logs = [
+        "Using cached attestation duties",
+        "Using cached proposing duties",
+    ]
+    command = get_general_eth_duties_start_command(
+        CONFIG.validators.active.general[0:10],
+        CONFIG.general.working_beacon_node_url,
+    ) + ["--ssz", "--log", "debug", "--max-interval", "0"]
+    return run_generic_test(
+        expected_logs,
+        command,
+        "cached duties with ssz",
+        expected_logs[1],
+        drop_expected_logs=True,
+        overhead_log_number=10,
+        additional_failure_message=(
+            "It could be that the beacon node does not support SSZ responses!"
+        ),
+    )
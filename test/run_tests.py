@@ -6,6 +6,7 @@
 from cases import (
     test_cicd_mode,
     test_cli_validation,
+    test_duty_engine,
     test_general,
     test_logging_mode,
     test_node_connection,
@@ -47,6 +48,7 @@ test_cases = [
     test_logging_mode.test_increase_of_max_attestation_duty_logs,
     test_logging_mode.test_logged_format_of_time_to_next_sync_committee,
     test_logging_mode.test_standard_logging_mode_when_identifiers_fetched_from_validator_nodes,
+    test_logging_mode.test_cached_duties_with_ssz,
     # Test cli validation
     test_cli_validation.test_any_validators_flag_validation,
     test_cli_validation.test_both_validators_flag_validation,
@@ -56,6 +58,15 @@ test_cases = [
     test_cli_validation.test_cicd_waiting_time_flag_validation,
     test_cli_validation.test_validator_nodes_and_validators_flag_validation,
     test_cli_validation.test_validator_nodes_and_validators_file_flag_validation,
+    test_cli_validation.test_connection_pool_size_flag_validation,
+    test_cli_validation.test_beacon_node_selection_flag_validation,
+    test_cli_validation.test_hedge_percentile_flag_validation,
+    test_cli_validation.test_max_concurrent_requests_flag_validation,
+    test_cli_validation.test_max_requests_per_second_flag_validation,
+    test_cli_validation.test_no_compression_nodes_flag_validation,
+    test_cli_validation.test_prefetch_slots_flag_validation,
+    test_cli_validation.test_state_snapshot_file_flag_validation,
+    test_cli_validation.test_max_interval_flag_validation,
     # Test cicd mode
     test_cicd_mode.test_cicd_exit_mode_with_sync_committee_duties_while_proportion_of_attestation_duties_is_above_threshold,
     test_cicd_mode.test_cicd_exit_mode_without_sync_committee_duties_while_proportion_of_attestation_duties_is_above_threshold,
@@ -64,6 +75,10 @@ test_cases = [
     test_cicd_mode.test_cicd_force_graceful_exit_mode,
     test_cicd_mode.test_cicd_wait_mode_without_sync_committee_duties_while_proportion_of_duties_is_above_threshold_within_waiting_time,
     test_cicd_mode.test_cicd_wait_mode_while_waiting_time_exceeds,
+    # Test offline duty engine
+    test_duty_engine.test_shuffling_vectors,
+    test_duty_engine.test_committee_vectors,
+    test_duty_engine.test_duties_from_recorded_state,
     # Test node connections
     test_node_connection.test_all_validator_nodes_are_healthy,
     test_node_connection.test_all_validator_nodes_are_healthy_with_duplicates,